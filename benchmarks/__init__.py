@@ -0,0 +1,12 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Micro benchmarks for anyconfig.
+
+Each module in this package is runnable as a script, e.g.::
+
+  PYTHONPATH=src python -m benchmarks.parsers_find
+"""
+
+# vim:sw=4:ts=4:et:
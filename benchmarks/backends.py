@@ -0,0 +1,369 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Benchmark the throughput of loading and dumping data with each backend.
+
+It measures the time and the peak memory usage of loads, load, dumps and dump
+API calls with every parser registered for each shape of synthetic documents
+made by :mod:`benchmarks.datagen`, and compares results with the baseline
+saved previously to find regressions, e.g.::
+
+  PYTHONPATH=src python -m benchmarks.backends --json baseline.json
+  (... make some changes ...)
+  PYTHONPATH=src python -m benchmarks.backends --baseline baseline.json
+
+Documents are adapted to formats cannot represent them as they are, that is,
+flattened for ini, properties and shellvars, and scalar values in them are
+converted to strings for xml. Parsers failed to process documents are
+reported as skipped.
+"""
+import argparse
+import json
+import os
+import pathlib
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import typing
+import warnings
+
+import anyconfig
+import anyconfig.parsers
+
+from anyconfig.backend import ParserT
+
+from . import datagen
+
+
+OPS: typing.Tuple[str, ...] = ('loads', 'load', 'dumps', 'dump')
+
+# Results are regarded as regressions if they are slower than this ratio.
+THRESHOLD: float = 0.1
+
+# Number of items in a section of ini files.
+_INI_SECTION_SIZE: int = 64
+
+# Bump this if the format of results was changed.
+FORMAT_VERSION: int = 1
+
+
+class Result(typing.NamedTuple):
+    """A result of a benchmark.
+
+    :param parser: ID of the parser
+    :param shape: Shape of the document
+    :param op: Name of the API, one of :data:`OPS`
+    :param nbytes: Size of the serialized document in bytes
+    :param usec: Time to process the document in micro seconds
+    :param mb_per_sec: Throughput in MB (10^6 bytes) per second
+    :param peak_kib: Peak size of memory allocated in KiB
+    :param error: Error message if it's skipped
+    """
+
+    parser: str
+    shape: str
+    op: str
+    nbytes: int = 0
+    usec: float = 0.0
+    mb_per_sec: float = 0.0
+    peak_kib: float = 0.0
+    error: str = ''
+
+    def key(self) -> str:
+        """Get the key to compare results."""
+        return f'{self.parser}/{self.shape}/{self.op}'
+
+
+def _flatten(data: typing.Any, prefix: str = ''
+             ) -> typing.Iterator[typing.Tuple[str, str]]:
+    """Flatten nested data to make pairs of keys and string values."""
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for key, val in items:
+        key = f'{prefix}{key}'
+        if isinstance(val, (dict, list)):
+            yield from _flatten(val, f'{key}_')
+        else:
+            yield (key, str(val))
+
+
+def _to_strings(data: typing.Any) -> typing.Any:
+    """Convert scalar values in nested data to strings."""
+    if isinstance(data, dict):
+        return {key: _to_strings(val) for key, val in data.items()}
+    if isinstance(data, list):
+        return [_to_strings(val) for val in data]
+
+    return str(data)
+
+
+def adapt(ptype: str, data: datagen.DataT) -> datagen.DataT:
+    """Adapt ``data`` to the format of type ``ptype`` can represent.
+
+    :param ptype: Type of the parser, e.g. 'ini'
+    :param data: A document made by :func:`benchmarks.datagen.make`
+    """
+    if ptype in ('properties', 'shellvars'):
+        return dict(_flatten(data))
+
+    if ptype == 'ini':
+        items = list(_flatten(data))
+        return {f'section_{i}': dict(items[i:i + _INI_SECTION_SIZE])
+                for i in range(0, len(items), _INI_SECTION_SIZE)}
+
+    if ptype == 'xml':
+        return {'root': _to_strings(data)}
+
+    return data
+
+
+def measure(fnc: typing.Callable[[], typing.Any], repeat: int = 5) -> float:
+    """Measure the best time to call ``fnc`` in seconds."""
+    timer = timeit.Timer(fnc)
+    (number, _time) = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def peak_memory(fnc: typing.Callable[[], typing.Any]) -> int:
+    """Measure the peak size of memory allocated while calling ``fnc``."""
+    tracemalloc.start()
+    try:
+        fnc()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _make_fns(psr: ParserT, data: datagen.DataT,
+              count: int, workdir: pathlib.Path
+              ) -> typing.Tuple[int, typing.Dict[str, typing.Callable]]:
+    """Make functions to call APIs ``count`` times to benchmark.
+
+    :return: A tuple of the size of the serialized data and functions
+    """
+    content = anyconfig.dumps(data, ac_parser=psr)
+    path = workdir / f'{psr.cid()}.{psr.extensions()[0]}'
+    anyconfig.dump(data, path, ac_parser=psr)
+
+    # Check if the data can be loaded.
+    anyconfig.loads(content, ac_parser=psr)
+    anyconfig.load(path, ac_parser=psr)
+
+    def repeated(fnc, *args):
+        """Call ``fnc`` ``count`` times."""
+        def call():
+            for _ in range(count):
+                fnc(*args, ac_parser=psr)
+
+        return call
+
+    nbytes = path.stat().st_size * count
+    return (nbytes, dict(loads=repeated(anyconfig.loads, content),
+                         load=repeated(anyconfig.load, path),
+                         dumps=repeated(anyconfig.dumps, data),
+                         dump=repeated(anyconfig.dump, data, path)))
+
+
+def bench(psr: ParserT, doc: datagen.Document,
+          ops: typing.Iterable[str] = OPS, repeat: int = 5,
+          memory: bool = True) -> typing.List[Result]:
+    """Benchmark ``psr`` with ``doc``.
+
+    :param psr: A parser object
+    :param doc: A document made by :func:`benchmarks.datagen.make`
+    :param ops: Names of the API to benchmark
+    :param repeat: Number of times to repeat to get the best results
+    :param memory: Measure the peak memory usage also if True
+    :return: A list of :class:`Result` objects
+    """
+    data = adapt(psr.type(), doc.data)
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            (nbytes, fns) = _make_fns(psr, data, doc.count,
+                                      pathlib.Path(workdir))
+        except Exception as exc:  # pylint: disable=broad-except
+            return [Result(psr.cid(), doc.shape, op, error=repr(exc))
+                    for op in ops]
+
+        res = []
+        for op in ops:
+            secs = measure(fns[op], repeat)
+            peak = peak_memory(fns[op]) if memory else 0
+            res.append(Result(psr.cid(), doc.shape, op, nbytes, secs * 1e6,
+                              nbytes / secs / 1e6, peak / 1024))
+
+        return res
+
+
+def _select(items: typing.Iterable[typing.Any], names: typing.List[str],
+            keyfn: typing.Callable[[typing.Any], typing.Iterable[str]]
+            ) -> typing.List[typing.Any]:
+    """Select items match with any of ``names`` if given."""
+    if not names:
+        return list(items)
+
+    return [item for item in items if set(keyfn(item)) & set(names)]
+
+
+def run(size: int = 1000, seed: int = 0, repeat: int = 5,
+        parsers: typing.Optional[typing.List[str]] = None,
+        shapes: typing.Optional[typing.List[str]] = None,
+        ops: typing.Iterable[str] = OPS, memory: bool = True
+        ) -> typing.Dict[str, typing.Any]:
+    """Run benchmarks.
+
+    :param size: Rough number of scalar items in documents
+    :param seed: Seed to make documents
+    :param repeat: Number of times to repeat to get the best results
+    :param parsers: IDs or types of parsers to benchmark, or all if not given
+    :param shapes: Shapes of documents to benchmark, or all if not given
+    :param ops: Names of the API to benchmark
+    :param memory: Measure the peak memory usage also if True
+    :return: A mapping object has the environment info and results
+    """
+    psrs = _select((ps[0] for _cid, ps in anyconfig.parsers.list_by_cid()),
+                   parsers or [], lambda p: (p.cid(), p.type()))
+    docs = _select(datagen.make_all(size, seed), shapes or [],
+                   lambda d: (d.shape, ))
+
+    results = [res for psr in psrs for doc in docs
+               for res in bench(psr, doc, ops, repeat, memory)]
+
+    return dict(
+        version=FORMAT_VERSION,
+        env=dict(python=platform.python_version(),
+                 implementation=platform.python_implementation(),
+                 platform=platform.platform(),
+                 anyconfig='.'.join(anyconfig.version())),
+        params=dict(size=size, seed=seed, repeat=repeat),
+        results=[res._asdict() for res in results]
+    )
+
+
+def compare(results: typing.Dict[str, typing.Any],
+            baseline: typing.Dict[str, typing.Any],
+            threshold: float = THRESHOLD
+            ) -> typing.List[typing.Tuple[str, float, float, float]]:
+    """Compare ``results`` with ``baseline`` to find regressions.
+
+    :param results: Results :func:`run` returned
+    :param baseline: Results :func:`run` returned and saved previously
+    :param threshold: Ratio of the time to be regarded as regressions
+    :return:
+        A list of tuples of the key, the time of the baseline, the time of
+        results and the ratio of them slower than ``threshold``
+    """
+    if baseline.get('params') != results.get('params'):
+        warnings.warn('Parameters of benchmarks are different from the '
+                      f'baseline: {baseline.get("params")!r}')
+
+    bases = {Result(**res).key(): Result(**res)
+             for res in baseline.get('results', [])}
+    regs = []
+    for res in (Result(**r) for r in results['results']):
+        base = bases.get(res.key())
+        if base is None or base.error or res.error:
+            continue
+
+        ratio = res.usec / base.usec
+        if ratio > 1 + threshold:
+            regs.append((res.key(), base.usec, res.usec, ratio))
+
+    return regs
+
+
+def print_results(results: typing.Dict[str, typing.Any],
+                  baseline: typing.Optional[typing.Dict[str, typing.Any]]
+                  = None, out: typing.TextIO = sys.stdout) -> None:
+    """Print results in a table."""
+    bases = {Result(**res).key(): Result(**res)
+             for res in (baseline or {}).get('results', [])}
+    print(f'{"parser":<12} {"shape":<13} {"op":<6} {"bytes":>9} '
+          f'{"usec":>11} {"MB/s":>8} {"peak KiB":>9} {"vs. base":>8}',
+          file=out)
+
+    for res in (Result(**r) for r in results['results']):
+        if res.error:
+            print(f'{res.parser:<12} {res.shape:<13} {res.op:<6} '
+                  f'skipped: {res.error}', file=out)
+            continue
+
+        base = bases.get(res.key())
+        diff = (f'{res.usec / base.usec:7.2f}x'
+                if base is not None and not base.error else '')
+        print(f'{res.parser:<12} {res.shape:<13} {res.op:<6} '
+              f'{res.nbytes:9d} {res.usec:11.1f} {res.mb_per_sec:8.2f} '
+              f'{res.peak_kib:9.1f} {diff:>8}', file=out)
+
+
+def _split(value: str) -> typing.List[str]:
+    """Split comma separated values."""
+    return [val for val in value.split(',') if val]
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """Entry point.
+
+    :return: 1 if some regressions were found or 0
+    """
+    psr = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    psr.add_argument('-s', '--size', type=int, default=1000,
+                     help='Rough number of scalar items in documents')
+    psr.add_argument('--seed', type=int, default=0)
+    psr.add_argument('-r', '--repeat', type=int, default=5)
+    psr.add_argument('-p', '--parsers', type=_split, default=[],
+                     help='Comma separated parser IDs or types')
+    psr.add_argument('--shapes', type=_split, default=[],
+                     help=f'Comma separated shapes of documents, '
+                          f'{",".join(datagen.SHAPES)}')
+    psr.add_argument('--ops', type=_split, default=list(OPS),
+                     help=f'Comma separated API names, {",".join(OPS)}')
+    psr.add_argument('--no-memory', action='store_false', dest='memory',
+                     help='Do not measure the peak memory usage')
+    psr.add_argument('--json',
+                     help='Path to save results in JSON, or - for stdout')
+    psr.add_argument('-b', '--baseline',
+                     help='Path to the results saved to compare with')
+    psr.add_argument('-t', '--threshold', type=float, default=THRESHOLD,
+                     help='Ratio of the time to be regarded as regressions')
+    args = psr.parse_args(argv)
+
+    unknowns = set(args.ops) - set(OPS)
+    if unknowns:
+        psr.error(f'Unknown API names: {", ".join(sorted(unknowns))}')
+
+    results = run(args.size, args.seed, args.repeat, args.parsers,
+                  args.shapes, args.ops, args.memory)
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(
+            pathlib.Path(args.baseline).read_text(encoding='utf-8')
+        )
+
+    if args.json == '-':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        print_results(results, baseline)
+        if args.json:
+            pathlib.Path(args.json).write_text(
+                json.dumps(results, indent=2) + os.linesep, encoding='utf-8'
+            )
+
+    if baseline is None:
+        return 0
+
+    regs = compare(results, baseline, args.threshold)
+    for key, base, new, ratio in regs:
+        print(f'Regression: {key} {base:.1f} -> {new:.1f} usec '
+              f'({ratio:.2f}x)', file=sys.stderr)
+
+    return 1 if regs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# vim:sw=4:ts=4:et:
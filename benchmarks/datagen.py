@@ -0,0 +1,146 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Generate synthetic documents to benchmark with.
+
+Documents are generated deterministically from the shape, the size and the
+seed so that results of benchmarks are comparable between runs.
+
+- wide: A mapping object has many scalar items
+- deep: Mapping objects nested deeply and each has a few scalar items
+- list_heavy: A mapping object has a long list of mapping objects and lists
+- string_heavy: A mapping object has many long strings
+- small_many: A small mapping object, processed many times
+"""
+import random
+import typing
+
+
+DataT = typing.Dict[str, typing.Any]
+
+# Nest level of 'deep' documents.
+DEPTH: int = 32
+
+# Length of strings in 'string_heavy' documents.
+STRLEN: int = 256
+
+_CHARS = ('abcdefghijklmnopqrstuvwxyz'
+          'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-.,:/')
+
+
+class Document(typing.NamedTuple):
+    """A generated document.
+
+    :param shape: Shape of the document, e.g. 'wide'
+    :param data: The document itself
+    :param count: Number of times to process ``data`` in one benchmark run
+    """
+
+    shape: str
+    data: DataT
+    count: int = 1
+
+
+def _scalar(rnd: random.Random, idx: int) -> typing.Any:
+    """Make a scalar value of various types."""
+    kind = idx % 4
+    if kind == 0:
+        return rnd.randint(0, 1 << 31)
+    if kind == 1:
+        return round(rnd.random() * 1000, 6)
+    if kind == 2:
+        return bool(rnd.getrandbits(1))
+
+    return _string(rnd, 16)
+
+
+def _string(rnd: random.Random, length: int) -> str:
+    """Make a random string of ``length`` characters."""
+    return ''.join(rnd.choice(_CHARS) for _ in range(length))
+
+
+def wide(rnd: random.Random, size: int) -> DataT:
+    """Make a mapping object has ``size`` scalar items."""
+    return {f'key_{i}': _scalar(rnd, i) for i in range(size)}
+
+
+def deep(rnd: random.Random, size: int) -> DataT:
+    """Make mapping objects nested :data:`DEPTH` levels have ``size`` items.
+
+    Scalar items are distributed evenly to the levels.
+    """
+    nitems = max(size // DEPTH, 1)
+    res: DataT = {}
+    cur = res
+    for level in range(DEPTH):
+        cur.update((f'key_{level}_{i}', _scalar(rnd, i))
+                   for i in range(nitems))
+        if level < DEPTH - 1:
+            cur[f'child_{level}'] = {}
+            cur = cur[f'child_{level}']
+
+    return res
+
+
+def list_heavy(rnd: random.Random, size: int) -> DataT:
+    """Make a mapping object has a list of records of about ``size`` items."""
+    return {
+        'items': [
+            dict(id=i, name=f'item_{i}', enabled=bool(i % 2),
+                 tags=[_string(rnd, 8) for _ in range(3)],
+                 values=[rnd.randint(0, 1000) for _ in range(3)])
+            for i in range(max(size // 8, 1))
+        ]
+    }
+
+
+def string_heavy(rnd: random.Random, size: int) -> DataT:
+    """Make a mapping object has long strings of about ``size`` items."""
+    return {f'key_{i}': _string(rnd, STRLEN)
+            for i in range(max(size // 8, 1))}
+
+
+def small(rnd: random.Random, _size: int) -> DataT:
+    """Make a small mapping object."""
+    return dict(name=_string(rnd, 8), port=rnd.randint(1, 65535),
+                enabled=True, timeout=1.5)
+
+
+# Shapes and functions to make them, and how many times to process the
+# generated data relative to the size.
+SHAPES: typing.Dict[str, typing.Tuple[
+    typing.Callable[[random.Random, int], DataT], int
+]] = {
+    'wide': (wide, 0),
+    'deep': (deep, 0),
+    'list_heavy': (list_heavy, 0),
+    'string_heavy': (string_heavy, 0),
+    'small_many': (small, 10),
+}
+
+
+def make(shape: str, size: int = 1000, seed: int = 0) -> Document:
+    """Make a document of ``shape``.
+
+    :param shape: Shape of the document, one of :data:`SHAPES`
+    :param size: Rough number of scalar items in the document
+    :param seed: Seed of the random number generator
+    :return: A :class:`Document` object
+    :raises: ValueError if ``shape`` is not known
+    """
+    try:
+        (fnc, divisor) = SHAPES[shape]
+    except KeyError as exc:
+        raise ValueError(f'Unknown shape: {shape}, '
+                         f'it must be one of {", ".join(SHAPES)}') from exc
+
+    data = fnc(random.Random(seed), size)
+    return Document(shape, data, max(size // divisor, 1) if divisor else 1)
+
+
+def make_all(size: int = 1000, seed: int = 0) -> typing.List[Document]:
+    """Make documents of all shapes."""
+    return [make(shape, size, seed) for shape in SHAPES]
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,124 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Benchmark the time to import anyconfig.
+
+Each statement runs in fresh interpreters, and the best wall time and the
+modules not in anyconfig took the longest to import, reported by
+``python -X importtime``, are printed.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+import typing
+
+
+CASES = (
+    ('import anyconfig', 'import anyconfig'),
+    ('load JSON', 'import anyconfig; anyconfig.loads("{}", ac_parser="json")'),
+    ('list parsers', 'import anyconfig; anyconfig.list_types()'),
+    ('validate', 'import anyconfig; anyconfig.is_valid({}, {})'),
+    ('query', 'import anyconfig; anyconfig.try_query({"a": 1}, "a")'),
+)
+
+# Optional libraries should be imported only if they are needed.
+OPTIONAL_MODULES = ('jsonschema', 'jinja2', 'jmespath', 'yaml')
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)')
+
+
+def _run_python(stmt: str, *opts: str, stdout: bool = False) -> str:
+    """Run ``stmt`` in a fresh interpreter and return its stderr or stdout."""
+    res = subprocess.run(
+        [sys.executable, *opts, '-c', stmt], check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=dict(os.environ, PYTHONWARNINGS='ignore')
+    )
+    return res.stdout if stdout else res.stderr
+
+
+def imported_optional_modules(stmt: str) -> typing.List[str]:
+    """Get the list of optional libraries imported by running ``stmt``."""
+    check = ('import sys; print(" ".join(m for m in '
+             f'{OPTIONAL_MODULES!r} if m in sys.modules))')
+    return _run_python(f'{stmt}; {check}', stdout=True).split()
+
+
+def measure(stmt: str, repeat: int = 5) -> float:
+    """Get the best wall time in secs to run ``stmt`` in new interpreters."""
+    _run_python('pass')  # Warm up caches.
+    ptime = min(_best_of(lambda: _run_python('pass'), repeat))
+    return min(_best_of(lambda: _run_python(stmt), repeat)) - ptime
+
+
+def _best_of(fnc: typing.Callable[[], typing.Any], repeat: int
+             ) -> typing.List[float]:
+    """Get the list of the times in secs to call ``fnc``."""
+    res = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fnc()
+        res.append(time.perf_counter() - start)
+
+    return res
+
+
+def top_imports(stmt: str, count: int = 10
+                ) -> typing.List[typing.Tuple[str, str, int]]:
+    """Get the modules took the longest time to import from anyconfig.
+
+    :return:
+        A list of tuples of (module_name, name of the anyconfig module
+        imports it, cumulative usec), of modules not in anyconfig
+    """
+    res = []
+    stack: typing.List[str] = []  # Modules being imported in the tree.
+
+    # The output lists modules in post-order and the indentation shows the
+    # depth of each modules in the tree.
+    for line in reversed(_run_python(stmt, '-X', 'importtime').splitlines()):
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+
+        (usec, mod, depth) = (int(match.group(2)), match.group(4),
+                              (len(match.group(3)) - 1) // 2)
+        del stack[depth:]
+        if stack and stack[-1].startswith('anyconfig') and \
+                not mod.startswith('anyconfig'):
+            res.append((mod, stack[-1], usec))
+        stack.append(mod)
+
+    return sorted(res, key=lambda t: t[2], reverse=True)[:count]
+
+
+def run(repeat: int = 5, count: int = 10) -> None:
+    """Run benchmarks and print the results."""
+    print(f'{"case":<24} {"time":>15}  optional libraries imported')
+    for name, stmt in CASES:
+        mods = ', '.join(imported_optional_modules(stmt)) or '-'
+        print(f'{name:<24} {measure(stmt, repeat) * 1e3:10.2f} msec  {mods}')
+
+    print(f'\nTop {count} modules imported from anyconfig modules:')
+    for mod, parent, usec in top_imports('import anyconfig', count):
+        print(f'  {mod:<32} {parent:<32} {usec / 1e3:8.2f} msec')
+
+
+def main() -> None:
+    """Entry point."""
+    psr = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    psr.add_argument('-r', '--repeat', type=int, default=5)
+    psr.add_argument('-c', '--count', type=int, default=10)
+    args = psr.parse_args()
+    run(args.repeat, args.count)
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
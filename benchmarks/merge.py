@@ -0,0 +1,356 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Benchmark how the time and the memory to merge data scale with sizes.
+
+It measures :func:`anyconfig.api.multi_load` loads and merges 1 to 1000
+inputs, and :func:`anyconfig.dicts.merge` with each merge strategy merges
+mapping objects of various widths, depths and lengths of lists in them and
+iterables of pairs, e.g.::
+
+  PYTHONPATH=src python -m benchmarks.merge
+  PYTHONPATH=src python -m benchmarks.merge --series 'merge/*/pairs'
+
+Results are shown in tables and plotted against sizes along with the order
+of growth estimated from them, O(n^k), to find quadratic behaviors. They can
+be saved in JSON, and plotted into image files also if matplotlib is
+available.
+"""
+import argparse
+import fnmatch
+import functools
+import json
+import math
+import pathlib
+import sys
+import tempfile
+import time
+import typing
+import warnings
+
+import anyconfig
+import anyconfig.dicts
+
+from .backends import peak_memory
+
+
+ArgsT = typing.Tuple[typing.Any, ...]
+
+# Sizes of inputs to measure by default.
+SIZES: typing.Tuple[int, ...] = (1, 3, 10, 30, 100, 300, 1000)
+
+# Minimum time to measure each point in seconds.
+MIN_TIME: float = 0.05
+
+# Width of bars in the plots in characters.
+_BAR_WIDTH: int = 40
+
+
+class Series(typing.NamedTuple):
+    """A series of benchmarks varies a size.
+
+    :param name: Name of the series, e.g. 'merge/merge_dicts/width'
+    :param setup:
+        A callable takes a size and returns a callable makes arguments to
+        pass to ``fnc`` every time
+    :param fnc: A callable to benchmark
+    :param sizes: Sizes to measure
+    """
+
+    name: str
+    setup: typing.Callable[[int], typing.Callable[[], ArgsT]]
+    fnc: typing.Callable[..., typing.Any]
+    sizes: typing.Tuple[int, ...] = SIZES
+
+
+class Point(typing.NamedTuple):
+    """A result of a benchmark with a size."""
+
+    size: int
+    usec: float
+    peak_kib: float
+
+
+def wide(width: int, offset: int = 0) -> typing.Dict[str, typing.Any]:
+    """Make a mapping object has ``width`` items."""
+    return {f'key_{i}': i for i in range(offset, offset + width)}
+
+
+def deep(depth: int, val: int = 0) -> typing.Dict[str, typing.Any]:
+    """Make mapping objects nested ``depth`` levels."""
+    res: typing.Dict[str, typing.Any] = dict(leaf=val)
+    for level in range(depth - 1, -1, -1):
+        res = {f'key_{level}': res, f'val_{level}': val}
+
+    return res
+
+
+def with_list(length: int, offset: int = 0) -> typing.Dict[str, typing.Any]:
+    """Make a mapping object has a list of ``length`` items."""
+    return dict(items=list(range(offset, offset + length)))
+
+
+def _merge_setup(make_fn: typing.Callable[..., typing.Any], strategy: str
+                 ) -> typing.Callable[[int], typing.Callable[[], ArgsT]]:
+    """Make a setup function of benchmarks of :func:`dicts.merge`.
+
+    Half of items in the other overlap with the ones in the first in the
+    results of ``make_fn(size, offset)``.
+    """
+    def setup(size: int) -> typing.Callable[[], ArgsT]:
+        other = make_fn(size, size // 2)
+        return lambda: (make_fn(size), other, strategy)
+
+    return setup
+
+
+def _pairs_setup(strategy: str
+                 ) -> typing.Callable[[int], typing.Callable[[], ArgsT]]:
+    """Make a setup function to merge an iterable of pairs."""
+    def setup(size: int) -> typing.Callable[[], ArgsT]:
+        other = list(wide(size, size // 2).items())
+        return lambda: (wide(size), other, strategy)
+
+    return setup
+
+
+def _merge(self: typing.Any, other: typing.Any, strategy: str) -> None:
+    """Call :func:`anyconfig.dicts.merge`."""
+    anyconfig.dicts.merge(self, other, ac_merge=strategy)
+
+
+def _multi_load_setup(workdir: pathlib.Path
+                      ) -> typing.Callable[[int], typing.Callable[[], ArgsT]]:
+    """Make a setup function of benchmarks of multi_load.
+
+    Each input has items overlap with others' and a nested mapping object.
+    """
+    def setup(size: int) -> typing.Callable[[], ArgsT]:
+        paths = []
+        for idx in range(size):
+            path = workdir / f'{size}_{idx:04d}.json'
+            if not path.exists():
+                path.write_text(json.dumps(
+                    dict(wide(16, idx), name=f'input_{idx}',
+                         nested=dict(wide(8, idx), tags=[idx % 10]))
+                ))
+            paths.append(path)
+
+        return lambda: (paths, )
+
+    return setup
+
+
+def _multi_load(paths: typing.List[pathlib.Path]) -> None:
+    """Call :func:`anyconfig.api.multi_load`."""
+    anyconfig.multi_load(paths, ac_parser='json')
+
+
+def make_series(workdir: pathlib.Path) -> typing.List[Series]:
+    """Make the list of all of series of benchmarks.
+
+    :param workdir: Dir to make input files for multi_load
+    """
+    res = [Series('multi_load/inputs', _multi_load_setup(workdir),
+                  _multi_load)]
+    for strategy in anyconfig.dicts.MERGE_STRATEGIES:
+        res.extend([
+            Series(f'merge/{strategy}/width', _merge_setup(wide, strategy),
+                   _merge, (*SIZES, 3000, 10000)),
+            Series(f'merge/{strategy}/depth', _merge_setup(deep, strategy),
+                   _merge, (1, 3, 10, 30, 100, 300)),
+            Series(f'merge/{strategy}/list', _merge_setup(with_list,
+                                                          strategy),
+                   _merge, (*SIZES, 3000)),
+            Series(f'merge/{strategy}/pairs', _pairs_setup(strategy),
+                   _merge, (*SIZES, 3000)),
+        ])
+
+    return res
+
+
+def measure(make_args: typing.Callable[[], ArgsT],
+            fnc: typing.Callable[..., typing.Any], repeat: int = 5
+            ) -> float:
+    """Measure the best time to call ``fnc`` in seconds.
+
+    Arguments are made before each call by ``make_args`` outside of the
+    measurement, because :func:`anyconfig.dicts.merge` modifies them.
+    """
+    args = make_args()
+    start = time.perf_counter()
+    fnc(*args)
+    elapsed = time.perf_counter() - start
+    number = max(min(int(MIN_TIME / max(elapsed, 1e-9)), 1000), 1)
+
+    best = math.inf
+    for _ in range(repeat):
+        argss = [make_args() for _ in range(number)]
+        start = time.perf_counter()
+        for args in argss:
+            fnc(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+
+    return best
+
+
+def order_of_growth(points: typing.Sequence[Point]) -> float:
+    """Estimate the exponent k of O(n^k) from the time of ``points``.
+
+    It's the slope of the line fitted to the points of larger half of sizes
+    on the log-log plane, as small sizes are dominated by constant costs.
+    """
+    pts = [p for p in points if p.size > 0 and p.usec > 0]
+    pts = pts[len(pts) // 2:] if len(pts) > 3 else pts
+    if len(pts) < 2:
+        return math.nan
+
+    xs_ = [math.log(p.size) for p in pts]
+    ys_ = [math.log(p.usec) for p in pts]
+    (xavg, yavg) = (sum(xs_) / len(xs_), sum(ys_) / len(ys_))
+    denom = sum((x - xavg) ** 2 for x in xs_)
+    if not denom:
+        return math.nan
+
+    return sum((x - xavg) * (y - yavg) for x, y in zip(xs_, ys_)) / denom
+
+
+def run_series(series: Series, repeat: int = 5, memory: bool = True,
+               max_size: typing.Optional[int] = None) -> typing.List[Point]:
+    """Run a series of benchmarks.
+
+    :param series: A :class:`Series` object
+    :param repeat: Number of times to repeat to get the best results
+    :param memory: Measure the peak memory usage also if True
+    :param max_size: Maximum size to measure
+    """
+    res = []
+    for size in series.sizes:
+        if max_size is not None and size > max_size:
+            break
+
+        make_args = series.setup(size)
+        secs = measure(make_args, series.fnc, repeat)
+        peak = 0
+        if memory:
+            peak = peak_memory(functools.partial(series.fnc, *make_args()))
+
+        res.append(Point(size, secs * 1e6, peak / 1024))
+
+    return res
+
+
+def _bar(val: float, vmax: float) -> str:
+    """Make a bar in log scale for ``val`` of ``vmax``."""
+    if val <= 0 or vmax <= 0:
+        return ''
+
+    ratio = math.log1p(val) / math.log1p(vmax)
+    return '#' * max(int(ratio * _BAR_WIDTH), 1)
+
+
+def print_series(name: str, points: typing.Sequence[Point],
+                 out: typing.TextIO = sys.stdout) -> None:
+    """Print results of a series with bars plot them in log scale."""
+    order = order_of_growth(points)
+    note = '  <- superlinear' if order >= 1.5 else ''
+    print(f'{name}: ~O(n^{order:.2f}){note}', file=out)
+
+    vmax = max((p.usec for p in points), default=0)
+    for pnt in points:
+        print(f'  {pnt.size:>6} {pnt.usec:12.1f} usec {pnt.peak_kib:10.1f} '
+              f'KiB  {_bar(pnt.usec, vmax)}', file=out)
+
+
+def plot(results: typing.Dict[str, typing.List[Point]], path: str) -> None:
+    """Plot results into an image file at ``path`` with matplotlib."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        warnings.warn('matplotlib is not available. Do not plot results.')
+        return
+
+    (fig, (ax_time, ax_mem)) = plt.subplots(1, 2, figsize=(16, 8))
+    for name, points in results.items():
+        sizes = [p.size for p in points]
+        ax_time.plot(sizes, [p.usec for p in points], marker='.', label=name)
+        ax_mem.plot(sizes, [p.peak_kib for p in points], marker='.',
+                    label=name)
+
+    for axis, label in ((ax_time, 'usec'), (ax_mem, 'peak KiB')):
+        axis.set_xscale('log')
+        axis.set_yscale('log')
+        axis.set_xlabel('size')
+        axis.set_ylabel(label)
+
+    ax_time.legend(fontsize='x-small')
+    fig.tight_layout()
+    fig.savefig(path)
+
+
+def run(patterns: typing.Sequence[str] = ('*', ), repeat: int = 5,
+        memory: bool = True, max_size: typing.Optional[int] = None,
+        out: typing.Optional[typing.TextIO] = sys.stdout
+        ) -> typing.Dict[str, typing.List[Point]]:
+    """Run series of benchmarks match with any of ``patterns``.
+
+    :param patterns: Glob patterns of names of series to run
+    :param out: Stream to print results to, or None not to print
+    :return: A mapping object of names of series and results of them
+    """
+    res = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for series in make_series(pathlib.Path(workdir)):
+            if not any(fnmatch.fnmatch(series.name, pat)
+                       for pat in patterns):
+                continue
+
+            res[series.name] = run_series(series, repeat, memory, max_size)
+            if out is not None:
+                print_series(series.name, res[series.name], out)
+
+    return res
+
+
+def _or_none(val: float) -> typing.Optional[float]:
+    """Convert NaN to None to save in JSON."""
+    return None if math.isnan(val) else val
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """Entry point."""
+    psr = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    psr.add_argument('-s', '--series', action='append', default=[],
+                     help="Glob patterns of names of series to run, e.g. "
+                          "'merge/*/list'. It can be given multiple times")
+    psr.add_argument('-r', '--repeat', type=int, default=5)
+    psr.add_argument('-m', '--max-size', type=int,
+                     help='Maximum size to measure')
+    psr.add_argument('--no-memory', action='store_false', dest='memory',
+                     help='Do not measure the peak memory usage')
+    psr.add_argument('--json', help='Path to save results in JSON')
+    psr.add_argument('--plot',
+                     help='Path to save the plot of results, needs '
+                          'matplotlib')
+    args = psr.parse_args(argv)
+
+    res = run(args.series or ['*'], args.repeat, args.memory, args.max_size)
+    if args.json:
+        pathlib.Path(args.json).write_text(json.dumps(
+            {name: dict(order=_or_none(order_of_growth(points)),
+                        points=[p._asdict() for p in points])
+             for name, points in res.items()}, indent=2
+        ))
+
+    if args.plot:
+        plot(res, args.plot)
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
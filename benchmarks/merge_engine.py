@@ -0,0 +1,210 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Compare :func:`anyconfig.dicts.merge` with the previous implementation.
+
+The previous implementation merged lists in O(n*m), rebuilt a dict from
+iterables of pairs for each pair and merged mapping objects with recursive
+calls. It's kept in this module as the reference to check that both give the
+same results and to measure the speedup, e.g.::
+
+  PYTHONPATH=src python -m benchmarks.merge_engine
+  PYTHONPATH=src python -m benchmarks.merge_engine --cases '*list*'
+
+It exits with 1 if results of some cases differ from the reference's.
+"""
+import argparse
+import copy
+import fnmatch
+import sys
+import typing
+
+import anyconfig.dicts
+import anyconfig.utils
+
+from .merge import (
+    deep, measure, wide, with_list
+)
+
+
+ArgsT = typing.Tuple[typing.Any, ...]
+DictT = typing.Dict[str, typing.Any]
+
+
+# The reference (previous) implementation.
+def _ref_merge_list(self: DictT, key: str, lst: typing.Iterable) -> None:
+    """Merge lists in O(n*m)."""
+    self[key] += [x for x in lst if x not in self[key]]
+
+
+def _ref_update_with_merge(self: DictT, other: DictT, key: str,
+                           val: typing.Any = None, merge_lists: bool = False,
+                           **options) -> None:
+    """Merge the value of ``self`` with ``other``'s recursively."""
+    if val is None:
+        val = other[key]
+
+    if key in self:
+        val0 = self[key]
+        if anyconfig.utils.is_dict_like(val0):
+            ref_merge(self[key], val, merge_lists=merge_lists, **options)
+        elif merge_lists and all(anyconfig.utils.is_list_like(obj)
+                                 for obj in (val, val0)):
+            _ref_merge_list(self, key, val)
+        else:
+            self[key] = val
+    else:
+        self[key] = val
+
+
+def _ref_update_with_merge_lists(self: DictT, other: DictT, key: str,
+                                 val: typing.Any = None, **options) -> None:
+    """Merge lists also."""
+    _ref_update_with_merge(self, other, key, val=val, merge_lists=True,
+                           **options)
+
+
+def _ref_update_with_replace(self: DictT, other: DictT, key: str,
+                             default: typing.Any = None, **_options) -> None:
+    """Replace values."""
+    oval = other.get(key, None)
+    if oval is not None:
+        self[key] = oval
+    elif default is not None:
+        self[key] = default
+
+
+def _ref_update_wo_replace(self: DictT, other: DictT, key: str,
+                           val: typing.Any = None, **_options) -> None:
+    """Add values only if missing."""
+    if key not in self:
+        self[key] = other.get(key, val)
+
+
+_REF_MERGE_FNS = {
+    anyconfig.dicts.MS_REPLACE: _ref_update_with_replace,
+    anyconfig.dicts.MS_NO_REPLACE: _ref_update_wo_replace,
+    anyconfig.dicts.MS_DICTS: _ref_update_with_merge,
+    anyconfig.dicts.MS_DICTS_AND_LISTS: _ref_update_with_merge_lists,
+}
+
+
+def ref_merge(self: DictT, other: typing.Any,
+              ac_merge: str = anyconfig.dicts.MS_DICTS, **options) -> None:
+    """Merge ``other`` into ``self`` same as the previous implementation."""
+    update_fn = _REF_MERGE_FNS[ac_merge or anyconfig.dicts.MS_DICTS]
+    if isinstance(other, dict):
+        for key in other.keys():
+            update_fn(self, other, key, **options)
+    else:
+        try:
+            for key, val in other:
+                update_fn(self, dict(other), key, val=val, **options)
+        except (ValueError, TypeError) as exc:
+            raise type(exc)(f'{exc!s} other={other!r}')
+
+
+def new_merge(self: DictT, other: typing.Any, ac_merge: str) -> None:
+    """Call :func:`anyconfig.dicts.merge`."""
+    anyconfig.dicts.merge(self, other, ac_merge=ac_merge)
+
+
+class Case(typing.NamedTuple):
+    """A case to compare implementations.
+
+    :param name: Name of the case
+    :param make_args: A callable makes arguments (self, other, strategy)
+    """
+
+    name: str
+    make_args: typing.Callable[[], ArgsT]
+
+
+def _with_dicts_in_list(length: int, offset: int = 0) -> DictT:
+    """Make a mapping object has a list of unhashable items."""
+    return dict(items=[dict(idx=i) for i in range(offset, offset + length)])
+
+
+def _make_args(make_fn: typing.Callable[..., DictT], size: int,
+               strategy: str, pairs: bool = False
+               ) -> typing.Callable[[], ArgsT]:
+    """Make a function makes arguments half of items of them overlap."""
+    other: typing.Any = make_fn(size, size // 2)
+    if pairs:
+        other = list(other.items())
+
+    return lambda: (make_fn(size), other, strategy)
+
+
+def make_cases() -> typing.List[Case]:
+    """Make the list of all of cases."""
+    res = []
+    for strategy in anyconfig.dicts.MERGE_STRATEGIES:
+        for name, make_fn, size, pairs in (
+            ('width', wide, 10000, False),
+            ('depth', deep, 300, False),
+            ('list', with_list, 3000, False),
+            ('list_of_dicts', _with_dicts_in_list, 300, False),
+            ('pairs', wide, 3000, True),
+            ('small_pairs', wide, 10, True),
+        ):
+            res.append(Case(f'{strategy}/{name}/{size}',
+                            _make_args(make_fn, size, strategy, pairs)))
+
+    return res
+
+
+def same_results(case: Case) -> bool:
+    """Test if both implementations give the same results in ``case``."""
+    (self_0, other, strategy) = case.make_args()
+    self_1 = copy.deepcopy(self_0)
+
+    ref_merge(self_0, copy.deepcopy(other), ac_merge=strategy)
+    new_merge(self_1, copy.deepcopy(other), strategy)
+
+    return self_0 == self_1
+
+
+def run(patterns: typing.Sequence[str] = ('*', ), repeat: int = 5,
+        out: typing.TextIO = sys.stdout) -> bool:
+    """Compare implementations in cases match with any of ``patterns``.
+
+    :return: True if results of all of cases are same
+    """
+    print(f'{"case":<44} {"ref usec":>12} {"new usec":>12} {"speedup":>8} '
+          'same', file=out)
+
+    all_same = True
+    for case in make_cases():
+        if not any(fnmatch.fnmatch(case.name, pat) for pat in patterns):
+            continue
+
+        same = same_results(case)
+        all_same = all_same and same
+
+        ref = measure(case.make_args, ref_merge, repeat) * 1e6
+        new = measure(case.make_args, new_merge, repeat) * 1e6
+        print(f'{case.name:<44} {ref:12.1f} {new:12.1f} {ref / new:7.1f}x '
+              f'{"yes" if same else "NO"}', file=out)
+
+    return all_same
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """Entry point."""
+    psr = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    psr.add_argument('-c', '--cases', action='append', default=[],
+                     help="Glob patterns of names of cases to run, e.g. "
+                          "'*/list/*'. It can be given multiple times")
+    psr.add_argument('-r', '--repeat', type=int, default=5)
+    args = psr.parse_args(argv)
+
+    if not run(args.cases or ['*'], args.repeat):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,48 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Benchmark the cost to look up parsers.
+
+Every load and dump API call looks up the parser to use through
+:func:`anyconfig.parsers.find`, so its cost is paid on each call.
+"""
+import argparse
+import timeit
+
+import anyconfig
+import anyconfig.parsers
+
+
+CASES = (
+    ('find(forced_type="json")',
+     lambda: anyconfig.parsers.find(None, forced_type='json')),
+    ('find("a.json")',
+     lambda: anyconfig.parsers.find('a.json')),
+    ('findall(forced_type="yaml")',
+     lambda: anyconfig.parsers.findall(None, forced_type='yaml')),
+    ('loads("{}", ac_parser="json")',
+     lambda: anyconfig.loads('{}', ac_parser='json')),
+)
+
+
+def run(number: int = 10000, repeat: int = 5) -> None:
+    """Run benchmarks and print the best results in usec per call."""
+    for name, fnc in CASES:
+        best = min(timeit.repeat(fnc, number=number, repeat=repeat))
+        print(f'{name:<32} {best / number * 1e6:10.2f} usec/call')
+
+
+def main() -> None:
+    """Entry point."""
+    psr = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    psr.add_argument('-n', '--number', type=int, default=10000)
+    psr.add_argument('-r', '--repeat', type=int, default=5)
+    args = psr.parse_args()
+    run(args.number, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
+
+# vim:sw=4:ts=4:et:
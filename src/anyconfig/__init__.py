@@ -22,23 +22,32 @@ validation/generation support.
 
 """
 from .api import (
-    dump, dumps, single_load, multi_load, load, loads,
-    open, version,
+    dump, dumps, single_load, multi_load, load, loads, iter_load,
+    adump, adumps, asingle_load, amulti_load, aload, aloads,
+    open, version, watch, prepare,
+    Cache,
     UnknownFileTypeError, UnknownParserTypeError,
     UnknownProcessorTypeError, ValidationError,
     MS_REPLACE, MS_NO_REPLACE, MS_DICTS, MS_DICTS_AND_LISTS, MERGE_STRATEGIES,
-    merge, get, set_,
+    merge, get, get_many, set_, set_many,
     load_plugins, list_types, list_by_cid, list_by_type, list_by_extension,
     findall, find,
-    try_query,
+    stats,
+    Profiler,
+    try_query, query_many,
     validate, is_valid, gen_schema
 )
 
 
 __all__ = [
     'dump', 'dumps',
-    'single_load', 'multi_load', 'load', 'loads',
-    'open', 'version',
+    'single_load', 'multi_load', 'load', 'loads', 'iter_load',
+    'adump', 'adumps',
+    'asingle_load', 'amulti_load', 'aload', 'aloads',
+    'open', 'version', 'watch', 'prepare',
+
+    # anyconfig.cache
+    'Cache',
 
     # anyconfig.common
     'UnknownParserTypeError', 'UnknownProcessorTypeError',
@@ -46,14 +55,20 @@ __all__ = [
 
     # anyconfig.dicsts
     'MS_REPLACE', 'MS_NO_REPLACE', 'MS_DICTS', 'MS_DICTS_AND_LISTS',
-    'MERGE_STRATEGIES', 'merge', 'get', 'set_',
+    'MERGE_STRATEGIES', 'merge', 'get', 'get_many', 'set_', 'set_many',
 
     # anyconfig.parsers
     'load_plugins', 'list_types', 'list_by_cid', 'list_by_type',
     'list_by_extension', 'findall', 'find',
 
+    # anyconfig.metrics
+    'stats',
+
+    # anyconfig.profiling
+    'Profiler',
+
     # anyconfig.query
-    'try_query',
+    'try_query', 'query_many',
 
     # anyconfig.validate
     'validate', 'is_valid', 'gen_schema'
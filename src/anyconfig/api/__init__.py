@@ -5,6 +5,30 @@
 # pylint: disable=unused-import,import-error,invalid-name
 r"""Public APIs of anyconfig module.
 
+.. versionadded:: 0.13.1
+
+   - Added ac_cache keyword option to load APIs and export
+     :class:`anyconfig.cache.Cache` to cache data loaded from files.
+   - Added ac_parallel keyword option to :func:`multi_load` and :func:`load`
+     to load data from multiple inputs concurrently.
+   - Added coroutine versions of load and dump APIs, :func:`asingle_load`,
+     :func:`amulti_load`, :func:`aload`, :func:`aloads`, :func:`adump` and
+     :func:`adumps`.
+   - Added :func:`watch` to reload data from files on changes.
+   - Added :func:`iter_load` to load documents one by one from inputs
+     consist of multiple documents or records.
+   - Added ac_profile keyword option to load APIs to profile each stage of
+     loading and export :class:`anyconfig.profiling.Profiler`.
+   - Export :func:`anyconfig.metrics.stats` to get metrics of loads, dumps,
+     caches, validation and template rendering.
+   - Added :func:`prepare` to make a loader with the parser, options, the
+     schema and the query resolved only once.
+   - Export :func:`anyconfig.dicts.get_many` and
+     :func:`anyconfig.dicts.set_many` to get and set values at multiple
+     paths at once.
+   - Export :func:`anyconfig.query.query_many` to query data with multiple
+     JMESPath expressions at once.
+
 .. versionchanged:: 0.10.2
 
    - Re-structured APIs and split into sub modules
@@ -86,16 +110,26 @@ r"""Public APIs of anyconfig module.
 import typing
 
 from .datatypes import MaybeDataT
+from ._adump import (
+    adump, adumps
+)
+from ._aload import (
+    asingle_load, amulti_load, aload, aloads
+)
 from ._dump import (
     dump, dumps
 )
+from ._iter_load import iter_load
 from ._load import (
     single_load, multi_load, load, loads
 )
 from ._open import open  # pylint: disable=redefined-builtin
+from ._prepare import PreparedLoader, prepare
+from ._watch import Watcher, watch
 
 # Export some more APIs originally from other sub modules.
 from ..backend import ParserT
+from ..cache import Cache
 from ..common import (
     InDataT, InDataExT,
     UnknownFileTypeError, UnknownParserTypeError,
@@ -103,7 +137,7 @@ from ..common import (
 )
 from ..dicts import (
     MS_REPLACE, MS_NO_REPLACE, MS_DICTS, MS_DICTS_AND_LISTS, MERGE_STRATEGIES,
-    merge, get, set_,
+    merge, get, get_many, set_, set_many,
 )
 from ..ioinfo import (
     IOInfo, make as ioinfo_make, makes as ioinfo_makes,
@@ -112,7 +146,11 @@ from ..parsers import (
     load_plugins, list_types, list_by_cid, list_by_type, list_by_extension,
     findall, find, MaybeParserT
 )
-from ..query import try_query
+from ..metrics import stats
+from ..profiling import Profiler
+from ..query import (
+    try_query, query_many
+)
 from ..schema import (
     validate, is_valid, gen_schema
 )
@@ -132,12 +170,17 @@ def version() -> typing.List[str]:
 __all__ = [
     'MaybeDataT',
     'dump', 'dumps',
-    'single_load', 'multi_load', 'load', 'loads',
-    'open', 'version',
+    'single_load', 'multi_load', 'load', 'loads', 'iter_load',
+    'adump', 'adumps',
+    'asingle_load', 'amulti_load', 'aload', 'aloads',
+    'open', 'version', 'Watcher', 'watch', 'PreparedLoader', 'prepare',
 
     # anyconfig.backend
     'ParserT',
 
+    # anyconfig.cache
+    'Cache',
+
     # anyconfig.common
     'InDataT', 'InDataExT',
     'UnknownFileTypeError', 'UnknownParserTypeError',
@@ -146,7 +189,7 @@ __all__ = [
     # anyconfig.dicsts
     'MS_REPLACE', 'MS_NO_REPLACE', 'MS_DICTS', 'MS_DICTS_AND_LISTS',
     'MERGE_STRATEGIES',
-    'merge', 'get', 'set_',
+    'merge', 'get', 'get_many', 'set_', 'set_many',
 
     # anyconfig.ioinfo
     'IOInfo', 'ioinfo_make', 'ioinfo_makes',
@@ -156,8 +199,14 @@ __all__ = [
     'list_by_extension', 'findall', 'find',
     'MaybeParserT',
 
+    # anyconfig.metrics
+    'stats',
+
+    # anyconfig.profiling
+    'Profiler',
+
     # anyconfig.query
-    'try_query',
+    'try_query', 'query_many',
 
     # anyconfig.validate
     'validate', 'is_valid', 'gen_schema'
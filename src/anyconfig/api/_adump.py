@@ -0,0 +1,56 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Provides the coroutine APIs to dump (serialize) objects.
+
+These do not do any non-blocking I/O. They only run the corresponding
+blocking synchronous APIs, including serialization and file I/O, in an
+executor not to block the event loop. The executor is the default one of the
+event loop shared with others unless another one was given with 'ac_executor'
+keyword argument.
+"""
+from .. import common, ioinfo
+from . import _dump
+from ._aload import MaybeExecutorT
+from .utils import run_in_executor
+
+
+async def adump(data: common.InDataExT, out: ioinfo.PathOrIOInfoT,
+                ac_executor: MaybeExecutorT = None, **options) -> None:
+    """Coroutine version of :func:`anyconfig.api.dump`.
+
+    It only runs the blocking :func:`anyconfig.api.dump` in an executor.
+
+    :param data: See :func:`anyconfig.api.dump`
+    :param out: See :func:`anyconfig.api.dump`
+    :param ac_executor:
+        An executor to run serialization and file I/O, e.g. a dedicated
+        thread pool not to share the default executor of the event loop, or
+        None to use the default one
+    :param options: See :func:`anyconfig.api.dump`
+
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    await run_in_executor(ac_executor, _dump.dump, data, out, **options)
+
+
+async def adumps(data: common.InDataExT, ac_executor: MaybeExecutorT = None,
+                 **options) -> str:
+    """Coroutine version of :func:`anyconfig.api.dumps`.
+
+    It only runs the blocking :func:`anyconfig.api.dumps` in an executor.
+
+    :param data: See :func:`anyconfig.api.dumps`
+    :param ac_executor:
+        An executor to run serialization, e.g. a dedicated thread pool not to
+        share the default executor of the event loop, or None to use the
+        default one
+    :param options: See :func:`anyconfig.api.dumps`
+
+    :return: Backend-specific string representation for the given data
+    :raises: ValueError, UnknownProcessorTypeError
+    """
+    return await run_in_executor(ac_executor, _dump.dumps, data, **options)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,122 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Provides the coroutine APIs to load objects from given files.
+
+These do not do any non-blocking I/O. They only run the corresponding
+blocking synchronous APIs, including file I/O and parsing, in an executor not
+to block the event loop, so that results are same as the ones of them. The
+executor is the default one of the event loop shared with others unless
+another one was given with 'ac_executor' keyword argument.
+"""
+import concurrent.futures
+import typing
+
+from .. import ioinfo
+from ..common import InDataExT
+from . import _load
+from .utils import run_in_executor
+
+
+MaybeExecutorT = typing.Optional[concurrent.futures.Executor]
+InputsT = typing.Union[
+    typing.Iterable[ioinfo.PathOrIOInfoT], ioinfo.PathOrIOInfoT
+]
+
+
+async def asingle_load(input_: ioinfo.PathOrIOInfoT,
+                       ac_executor: MaybeExecutorT = None,
+                       **options) -> InDataExT:
+    r"""Coroutine version of :func:`anyconfig.api.single_load`.
+
+    It only runs the blocking :func:`anyconfig.api.single_load` in an executor.
+
+    :param input\_: See :func:`anyconfig.api.single_load`
+    :param ac_executor:
+        An executor to run file I/O and parsing, e.g. a dedicated thread pool
+        not to share the default executor of the event loop, or None to use
+        the default one
+    :param options: See :func:`anyconfig.api.single_load`
+
+    :return: Mapping object
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    return await run_in_executor(ac_executor, _load.single_load, input_,
+                                 **options)
+
+
+async def amulti_load(inputs: InputsT,
+                      ac_executor: MaybeExecutorT = None,
+                      **options) -> InDataExT:
+    """Coroutine version of :func:`anyconfig.api.multi_load`.
+
+    It only runs the blocking :func:`anyconfig.api.multi_load` in an executor.
+
+    Data are loaded from ``inputs`` concurrently by default, that is,
+    'ac_parallel' option of :func:`anyconfig.api.multi_load` is True unless
+    it was given explicitly. Files small in total are loaded sequentially
+    even in that case, same as :func:`anyconfig.api.multi_load` does.
+
+    :param inputs: See :func:`anyconfig.api.multi_load`
+    :param ac_executor:
+        An executor to run file I/O and parsing, e.g. a dedicated thread pool
+        not to share the default executor of the event loop, or None to use
+        the default one
+    :param options: See :func:`anyconfig.api.multi_load`
+
+    :return: Mapping object or any query result might be primitive objects
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    options.setdefault('ac_parallel', True)
+    return await run_in_executor(ac_executor, _load.multi_load, inputs,
+                                 **options)
+
+
+async def aload(path_specs, ac_executor: MaybeExecutorT = None,
+                **options) -> InDataExT:
+    """Coroutine version of :func:`anyconfig.api.load`.
+
+    It only runs the blocking :func:`anyconfig.api.load` in an executor.
+
+    :param path_specs: See :func:`anyconfig.api.load`
+    :param ac_executor:
+        An executor to run file I/O and parsing, e.g. a dedicated thread pool
+        not to share the default executor of the event loop, or None to use
+        the default one
+    :param options: See :func:`anyconfig.api.load`
+
+    :return: Mapping object or any query result might be primitive objects
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    iois = await run_in_executor(ac_executor, ioinfo.makes, path_specs)
+    if not iois:
+        raise ValueError(f'Maybe invalid input: {path_specs!r}')
+
+    if len(iois) == 1:
+        return await asingle_load(iois[0], ac_executor=ac_executor,
+                                  **options)
+
+    return await amulti_load(iois, ac_executor=ac_executor, **options)
+
+
+async def aloads(content: str, ac_executor: MaybeExecutorT = None,
+                 **options) -> InDataExT:
+    """Coroutine version of :func:`anyconfig.api.loads`.
+
+    It only runs the blocking :func:`anyconfig.api.loads` in an executor.
+
+    :param content: See :func:`anyconfig.api.loads`
+    :param ac_executor:
+        An executor to run parsing, e.g. a dedicated thread pool not to share
+        the default executor of the event loop, or None to use the default
+        one
+    :param options: See :func:`anyconfig.api.loads`
+
+    :return: Mapping object or any query result might be primitive objects
+    :raises: ValueError, UnknownProcessorTypeError
+    """
+    return await run_in_executor(ac_executor, _load.loads, content,
+                                 **options)
+
+# vim:sw=4:ts=4:et:
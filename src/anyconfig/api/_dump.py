@@ -3,16 +3,29 @@
 # SPDX-License-Identifier: MIT
 #
 """Provides the API to dump (serialize) objects."""
-from .. import common, ioinfo, parsers
+from .. import common, dicts, ioinfo, parsers
 from . import datatypes
 
 
+def _thaw(data: common.InDataExT) -> common.InDataExT:
+    """Make a mutable copy of ``data`` if it's a snapshot.
+
+    Backends cannot dump snapshots as they are.
+    """
+    if isinstance(data, (dicts.FrozenDict, dicts.FrozenList)):
+        return dicts.thaw(data)
+
+    return data
+
+
 def dump(data: common.InDataExT, out: ioinfo.PathOrIOInfoT,
          ac_parser: parsers.MaybeParserT = None, **options
          ) -> None:
     """Save ``data`` to ``out`` in specified or detected format.
 
-    :param data: A mapping object may have configurations data to dump
+    :param data:
+        A mapping object may have configurations data to dump. Snapshots made
+        by :func:`anyconfig.dicts.freeze` are also supported.
     :param out:
         An output file path, a file, a file-like object, :class:`pathlib.Path`
         object represents the file or a namedtuple 'anyconfig.ioinfo.IOInfo'
@@ -26,7 +39,7 @@ def dump(data: common.InDataExT, out: ioinfo.PathOrIOInfoT,
     """
     ioi = ioinfo.make(out)
     psr: datatypes.ParserT = parsers.find(ioi, forced_type=ac_parser)
-    psr.dump(data, ioi, **options)
+    psr.dump(_thaw(data), ioi, **options)
 
 
 def dumps(data: common.InDataExT,
@@ -42,6 +55,6 @@ def dumps(data: common.InDataExT,
     :raises: ValueError, UnknownProcessorTypeError
     """
     psr: datatypes.ParserT = parsers.find(None, forced_type=ac_parser)
-    return psr.dumps(data, **options)
+    return psr.dumps(_thaw(data), **options)
 
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,66 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+r"""Provides the API to load data from inputs consist of multiple documents.
+
+.. versionadded:: 0.13.1
+"""
+import typing
+
+from .. import ioinfo
+from ..common import InDataExT
+from ..parsers import find as parsers_find
+from ..query import try_query
+from ..schema import is_valid
+from ._load import MaybeParserOrIdOrTypeT, try_to_load_schema
+from .datatypes import ParserT
+
+
+def iter_load(input_: ioinfo.PathOrIOInfoT,
+              ac_parser: MaybeParserOrIdOrTypeT = None,
+              **options) -> typing.Iterator[InDataExT]:
+    r"""Load data from single input ``input\_`` one by one.
+
+    Data will be loaded from inputs consist of multiple documents or records
+    such as YAML multi-document streams, concatenated or newline delimited
+    JSON (NDJSON) values, concatenated MessagePack objects and CBOR data items
+    one by one so that the memory needed is bounded by the largest one. Other
+    inputs are loaded as a single document.
+
+    .. note::
+
+       Options ac_template, ac_context, ac_cache and ac_cache_dir are not
+       supported and ignored.
+
+    :param input\_:
+        File path or file or file-like object or pathlib.Path object represents
+        the file or a namedtuple 'anyconfig.ioinfo.IOInfo' object represents
+        some input to load some data from
+    :param ac_parser: Forced parser type or parser object itself
+    :param options:
+        Optional keyword arguments such as ac_dict, ac_ordered, ac_schema,
+        ac_query and backend specific options :func:`single_load` supports.
+        The schema and the query are applied to each document.
+
+    :return:
+        A generator yields mapping objects or any query results, or None for
+        documents failed to validate
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    for key in ('ac_template', 'ac_context', 'ac_cache', 'ac_cache_dir'):
+        options.pop(key, None)
+
+    ioi = ioinfo.make(input_)
+    psr: ParserT = parsers_find(ioi, forced_type=ac_parser)
+    schema = try_to_load_schema(**options)
+    query = options.get('ac_query', False)
+
+    for cnf in psr.load_iter(ioi, **options):
+        if schema and not is_valid(cnf, schema, **options):
+            yield None
+            continue
+
+        yield try_query(cnf, query, **options)
+
+# vim:sw=4:ts=4:et:
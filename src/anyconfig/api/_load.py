@@ -4,15 +4,28 @@
 #
 # pylint: disable=unused-import,import-error,invalid-name
 """Provides the API to load objects from given files."""
+import collections
+import concurrent.futures
+import functools
+import pickle
+import threading
 import typing
 import warnings
 
-from .. import ioinfo
+from .. import ioinfo, profiling
+from ..cache import (
+    get_cache, get_disk_cache
+)
+from ..cache.utils import (
+    copy_data, file_signature
+)
 from ..common import (
     InDataT, InDataExT
 )
 from ..dicts import (
+    LayeredDict,
     convert_to as dicts_convert_to,
+    freeze as dicts_freeze,
     merge as dicts_merge
 )
 from ..parsers import find as parsers_find
@@ -29,10 +42,96 @@ from .utils import are_same_file_types
 MappingT = typing.Dict[str, typing.Any]
 MaybeParserOrIdOrTypeT = typing.Optional[typing.Union[str, ParserT]]
 
+# Max number of schemas loaded to keep.
+SCHEMA_CACHE_SIZE: int = 32
+
+# Options do not affect schemas loaded.
+_SCHEMA_IGNORED_OPTS: typing.Tuple[str, ...] = (
+    'ac_profile', 'ac_cache', 'ac_cache_dir', 'ac_parallel', 'ac_context',
+    'ac_frozen', 'ac_schema_safe', 'ac_schema_errors',
+)
+
+_SCHEMAS: 'collections.OrderedDict[typing.Hashable, InDataT]' = \
+    collections.OrderedDict()
+_SCHEMAS_LOCK = threading.Lock()
+
+
+def _schema_key(src: typing.Any, **options
+                ) -> typing.Optional[typing.Hashable]:
+    """Make a key of the schema loaded from ``src`` with ``options``.
+
+    :param src:
+        Tuple of the resolved paths and signatures of schema files, or the
+        content of the schema
+    :return: A hashable object or None if the schema cannot be cached
+    """
+    if options.get('ac_template'):  # It depends on the context.
+        return None
+
+    okey = tuple(sorted((key, val) for key, val in options.items()
+                        if key not in _SCHEMA_IGNORED_OPTS))
+    try:
+        hash(okey)
+    except TypeError:
+        return None
+
+    return (src, okey)
+
+
+def _load_schema_with_cache(key: typing.Optional[typing.Hashable],
+                            load_fn: typing.Callable[[], InDataExT]
+                            ) -> typing.Optional[InDataT]:
+    """Load the schema with ``load_fn`` or get it from the cache by ``key``.
+
+    The schema cached is shared among callers and must not be modified.
+
+    :return: Mapping object or None if the data loaded is not a mapping
+    """
+    if key is not None:
+        with _SCHEMAS_LOCK:
+            if key in _SCHEMAS:
+                _SCHEMAS.move_to_end(key)
+                return _SCHEMAS[key]
+
+    data = load_fn()
+    if not is_dict_like(data):
+        return None
+
+    schema = typing.cast(InDataT, data)
+    if key is None:
+        return schema
+
+    with _SCHEMAS_LOCK:
+        _SCHEMAS[key] = schema
+        while len(_SCHEMAS) > SCHEMA_CACHE_SIZE:
+            _SCHEMAS.popitem(last=False)
+
+    return schema
+
+
+def _schema_files_key(path_specs: typing.Any, **options
+                      ) -> typing.Optional[typing.Hashable]:
+    """Make a key of the schema from files ``path_specs`` and ``options``."""
+    try:
+        iois = ioinfo.makes(path_specs)
+    except (ValueError, TypeError):
+        return None
+
+    sigs = tuple((ioi.path, file_signature(ioi)) for ioi in iois)
+    if not sigs or any(sig is None for _path, sig in sigs):
+        return None  # Streams or missing files.
+
+    return _schema_key(sigs, **options)
+
 
 def try_to_load_schema(**options) -> typing.Optional[InDataT]:
     """Try to load a schema object for validation.
 
+    .. versionchanged:: 0.13.1
+
+       Schemas loaded are cached and reused until the files are modified.
+       The schema returned is shared among callers and must not be modified.
+
     :param options: Optional keyword arguments such as
 
         - ac_template: Assume configuration file may be a template file and try
@@ -48,11 +147,48 @@ def try_to_load_schema(**options) -> typing.Optional[InDataT]:
         # may be different from the original config file's format, perhaps.
         options["ac_parser"] = None
         options["ac_schema"] = None  # Avoid infinite loop.
-        return load(ac_schema, **options)
+        options["ac_frozen"] = False
+        return _load_schema_with_cache(
+            _schema_files_key(ac_schema, **options),
+            lambda: load(ac_schema, **options)
+        )
 
     return None
 
 
+def _try_to_load_schema(hook: typing.Optional[profiling.HookT], **options
+                        ) -> typing.Optional[InDataT]:
+    """Call :func:`try_to_load_schema` and profile it if needed."""
+    if options.get('ac_schema') is None:
+        return None
+
+    with profiling.stage(hook, profiling.STAGE_SCHEMA):
+        return try_to_load_schema(**options)
+
+
+def _load_with_caches(psr: ParserT, ioi: ioinfo.IOInfo, **options
+                      ) -> InDataExT:
+    """Load data from a given ``ioi`` through caches if enabled.
+
+    The in-process cache is looked up first and then the on-disk cache.
+
+    :param psr: Parser object to load data
+    :param ioi: 'anyconfig.ioinfo.IOInfo' object to load data from
+    :param options: Optional keyword arguments such as ac_cache, ac_cache_dir
+    :return: Data loaded
+    """
+    load_fn = psr.load
+    dcache = get_disk_cache(options.get('ac_cache_dir'))
+    if dcache is not None:
+        load_fn = functools.partial(dcache.load, psr)
+
+    cache = get_cache(options.get('ac_cache'))
+    if cache is None:
+        return load_fn(ioi, **options)
+
+    return cache.load(psr, ioi, load_fn=load_fn, **options)
+
+
 def _single_load(ioi: ioinfo.IOInfo,
                  ac_parser: MaybeParserOrIdOrTypeT = None,
                  ac_template: bool = False,
@@ -76,15 +212,24 @@ def _single_load(ioi: ioinfo.IOInfo,
     :return: Mapping object
     :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
     """
-    psr: ParserT = parsers_find(ioi, forced_type=ac_parser)
-    filepath = ioi.path
+    hook = options.get('ac_profile')
+    with profiling.stage(hook, profiling.STAGE_FIND, ioi):
+        psr: ParserT = parsers_find(ioi, forced_type=ac_parser)
 
+    filepath = ioi.path
     if ac_template and filepath:
-        content = try_render(filepath=filepath, ctx=ac_context, **options)
+        with profiling.stage(hook, profiling.STAGE_RENDER, ioi):
+            content = try_render(filepath=filepath, ctx=ac_context,
+                                 **options)
         if content is not None:
-            return psr.loads(content, **options)
+            with profiling.stage(hook, profiling.STAGE_PARSE, ioi):
+                return psr.loads(content, **options)
+
+    with profiling.stage(hook, profiling.STAGE_PARSE, ioi):
+        if ac_template:
+            return psr.load(ioi, **options)
 
-    return psr.load(ioi, **options)
+        return _load_with_caches(psr, ioi, **options)
 
 
 def single_load(input_: ioinfo.PathOrIOInfoT,
@@ -130,6 +275,24 @@ def single_load(input_: ioinfo.PathOrIOInfoT,
 
           - ac_schema: JSON schema file path to validate given config file
           - ac_query: JMESPath expression to query data
+          - ac_cache: True to cache data loaded from files in the default
+            in-process cache or an :class:`anyconfig.cache.Cache` object to
+            use instead of it. Cached data will be used while the files are
+            not changed. Data from streams and templates are not cached.
+          - ac_cache_dir: Path to the dir to cache data loaded from files
+            persistently, or an :class:`anyconfig.cache.DiskCache` object.
+            Cached data will be used while the contents of the files are not
+            changed. The dir must not be writable by anyone untrusted.
+          - ac_profile: A callable called with an
+            :class:`anyconfig.profiling.StageRecord` object has the wall
+            clock time, the CPU time and optionally the peak memory usage of
+            each stage of loading such as parsing and merging for each input,
+            e.g. an :class:`anyconfig.profiling.Profiler` object. See also
+            :func:`anyconfig.profiling.profile`.
+          - ac_frozen: Return a read-only and hashable snapshot, a
+            :class:`anyconfig.dicts.FrozenDict` object, which can be shared
+            among threads without copies if True. See also
+            :func:`anyconfig.dicts.freeze`.
 
         - Common backend options:
 
@@ -142,16 +305,234 @@ def single_load(input_: ioinfo.PathOrIOInfoT,
     :return: Mapping object
     :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
     """
-    ioi = ioinfo.make(input_)
+    hook = options['ac_profile'] = profiling.get_hook(options)
+    with profiling.stage(hook, profiling.STAGE_IOINFO, input_):
+        ioi = ioinfo.make(input_)
+
     cnf = _single_load(ioi, ac_parser=ac_parser, ac_template=ac_template,
                        ac_context=ac_context, **options)
-    schema = try_to_load_schema(
-        ac_template=ac_template, ac_context=ac_context, **options
+    schema = _try_to_load_schema(hook, ac_template=ac_template,
+                                 ac_context=ac_context, **options)
+    return _validate_and_query(cnf, schema, hook, **options)
+
+
+def _validate_and_query(cnf: InDataExT, schema: typing.Optional[InDataT],
+                        hook: typing.Optional[profiling.HookT], **options
+                        ) -> InDataExT:
+    """Validate ``cnf`` with ``schema`` if given and query it."""
+    if schema:
+        with profiling.stage(hook, profiling.STAGE_VALIDATE):
+            if not is_valid(cnf, schema, **options):
+                return None
+
+    query = options.get('ac_query', False)
+    if query:
+        with profiling.stage(hook, profiling.STAGE_QUERY):
+            cnf = try_query(cnf, query, **options)
+
+    return _try_to_freeze(cnf, **options)
+
+
+def _try_to_freeze(cnf: InDataExT, **options) -> InDataExT:
+    """Make a snapshot of ``cnf`` if the option ac_frozen is True."""
+    return dicts_freeze(cnf) if options.get('ac_frozen') else cnf
+
+
+PARALLEL_THREAD: str = 'thread'
+PARALLEL_PROCESS: str = 'process'
+
+# Files smaller than this in total are loaded sequentially even if
+# 'ac_parallel' was given, as costs to run workers exceed gains.
+PARALLEL_MIN_SIZE: int = 1 << 20
+
+# Executors shared among calls not to start workers every time.
+_EXECUTORS: typing.Dict[typing.Tuple[bool, typing.Optional[int]],
+                        concurrent.futures.Executor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def _is_picklable(*objs: typing.Any) -> bool:
+    """Test if given objects can be pickled to pass to other processes."""
+    try:
+        pickle.dumps(objs)
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+    return True
+
+
+def _get_executor(use_processes: bool, max_workers: typing.Optional[int]
+                  ) -> concurrent.futures.Executor:
+    """Get the executor shared among calls or make it if not made yet.
+
+    :param use_processes: Get a process pool if True or a thread pool
+    :param max_workers: The maximum number of workers or None (default)
+    """
+    key = (use_processes, max_workers)
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            executor_cls: typing.Union[
+                typing.Type[concurrent.futures.ThreadPoolExecutor],
+                typing.Type[concurrent.futures.ProcessPoolExecutor]
+            ] = concurrent.futures.ThreadPoolExecutor
+            if use_processes:
+                executor_cls = concurrent.futures.ProcessPoolExecutor
+
+            executor = _EXECUTORS[key] = executor_cls(max_workers=max_workers)
+
+        return executor
+
+
+def _drop_executor(executor: concurrent.futures.Executor) -> None:
+    """Drop the broken ``executor`` not to use it any more."""
+    with _EXECUTORS_LOCK:
+        for key, exe in list(_EXECUTORS.items()):
+            if exe is executor:
+                del _EXECUTORS[key]
+
+
+def _is_small(iois: typing.List[ioinfo.IOInfo]) -> bool:
+    """Test if the files ``iois`` are small enough to load sequentially."""
+    size = 0
+    for ioi in iois:
+        sig = file_signature(ioi)
+        if sig is None:  # Streams or missing files.
+            return False
+
+        size += sig[2]
+        if size >= PARALLEL_MIN_SIZE:
+            return False
+
+    return True
+
+
+def _load_in_parallel(iois: typing.List[ioinfo.IOInfo],
+                      ac_parser: MaybeParserOrIdOrTypeT = None,
+                      ac_parallel: typing.Union[bool, str] = PARALLEL_THREAD,
+                      ac_workers: typing.Optional[int] = None,
+                      **options) -> typing.Iterator[InDataExT]:
+    """Load data from ``iois`` concurrently.
+
+    :param iois: A list of 'anyconfig.ioinfo.IOInfo' objects to load data from
+    :param ac_parser: Forced parser type or parser object itself
+    :param ac_parallel:
+        'process' to use a process pool, or 'thread' or True to use a thread
+        pool. A thread pool is used instead of a process pool if some of the
+        arguments cannot be passed to other processes, e.g. streams.
+    :param ac_workers: The maximum number of workers or None (default)
+    :param options: Optional keyword arguments passed to :func:`_single_load`
+
+    :return: An iterator yields data loaded in the order of ``iois``
+    """
+    # Stages processed in other processes cannot be profiled.
+    use_processes = (ac_parallel == PARALLEL_PROCESS
+                     and not options.get('ac_profile')
+                     and _is_picklable(iois, ac_parser, options))
+
+    executor = _get_executor(use_processes, ac_workers)
+    try:
+        futures = [
+            executor.submit(_single_load, ioi, ac_parser=ac_parser,
+                            **options)
+            for ioi in iois
+        ]
+        # Results are yielded in order to merge them in the same order as
+        # sequential loading even if some finished earlier than others.
+        for future in futures:
+            yield future.result()
+    except concurrent.futures.BrokenExecutor:
+        _drop_executor(executor)
+        raise
+
+
+def _load_all(iois: typing.List[ioinfo.IOInfo],
+              ac_parser: MaybeParserOrIdOrTypeT = None,
+              ac_template: bool = False,
+              ac_context: typing.Optional[MappingT] = None,
+              **options) -> typing.Iterable[InDataExT]:
+    """Load data from ``iois`` sequentially or concurrently.
+
+    Data are loaded sequentially and lazily if ac_template is True as
+    ``ac_context`` to render templates is updated with data loaded before,
+    or files are smaller than :data:`PARALLEL_MIN_SIZE` in total.
+
+    :return: An iterable yields data loaded in the order of ``iois``
+    :raises: ValueError if 'ac_parallel' was wrong
+    """
+    parallel = options.get('ac_parallel')
+    if parallel and not ac_template and len(iois) > 1:
+        if parallel not in (True, PARALLEL_THREAD, PARALLEL_PROCESS):
+            raise ValueError(f'Wrong parallel loading type: {parallel!r}')
+
+        if not _is_small(iois):
+            return _load_in_parallel(iois, ac_parser=ac_parser, **options)
+
+    return (
+        _single_load(ioi, ac_parser=ac_parser, ac_template=ac_template,
+                     ac_context=ac_context, **options)
+        for ioi in iois
     )
-    if schema and not is_valid(cnf, schema, **options):
-        return None
 
-    return try_query(cnf, options.get('ac_query', False), **options)
+
+def _merge_results(iois: typing.List[ioinfo.IOInfo],
+                   results: typing.Iterable[InDataExT], ctx: MappingT,
+                   ac_template: bool = False, layered: bool = False,
+                   **options) -> typing.Tuple[InDataExT,
+                                              typing.List[MappingT]]:
+    """Merge data loaded from ``iois`` in order.
+
+    :param results: An iterable yields data loaded from ``iois``
+    :param ctx: Context to render templates updated with data if ac_template
+    :param layered: Collect mapping objects as layers instead of merging them
+    :return: A tuple of (data merged or None, layers)
+    :raises: ValueError if some of data is not a mapping object to merge
+    """
+    hook = options.get('ac_profile')
+    cnf: InDataExT = None
+    layers: typing.List[MappingT] = []
+
+    # Data shared with the cache must be copied before merging except for
+    # the last one, as merging modifies the first and nested objects of
+    # others merged into it.
+    cache = get_cache(options.get('ac_cache'))
+    shared = cache is not None and not cache.copy and not layered
+    last = len(iois) - 1
+
+    for idx, (ioi, cups) in enumerate(zip(iois, results)):
+        if not cups:
+            continue
+
+        if not is_dict_like(cups):
+            if len(iois) > 1:
+                raise ValueError(
+                    f'Object loaded from {ioi!r} is not a mapping object and '
+                    'cannot be merged with later ones will be loaded from '
+                    'other inputs.'
+                )
+            cnf = cups
+            continue
+
+        if layered:
+            layers.append(typing.cast(MappingT, cups))
+            continue
+
+        if shared and idx < last:
+            cups = copy_data(cups)
+
+        with profiling.stage(hook, profiling.STAGE_MERGE, ioi):
+            if cnf is None:
+                cnf = cups
+            else:
+                dicts_merge(typing.cast(MappingT, cnf),
+                            typing.cast(MappingT, cups), **options)
+            if ac_template:  # The context is needed only in this case.
+                dicts_merge(ctx, typing.cast(MappingT, cups), **options)
+
+    if layers:
+        cnf = layers[0]
+
+    return (cnf, layers)
 
 
 def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
@@ -191,9 +572,10 @@ def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
     :param ac_context: Mapping object presents context to instantiate template
     :param options: Optional keyword arguments:
 
-        - ac_dict, ac_ordered, ac_schema and ac_query are the options common in
-          :func:`single_load`, :func:`multi_load`, :func:`load`: and
-          :func:`loads`. See the descriptions of them in :func:`single_load`.
+        - ac_dict, ac_ordered, ac_schema, ac_query, ac_cache, ac_cache_dir
+          and ac_frozen are the options common in :func:`single_load`,
+          :func:`multi_load`, :func:`load`: and :func:`loads`. See the
+          descriptions of them in :func:`single_load`.
 
         - Options specific to this function and :func:`load`:
 
@@ -202,6 +584,27 @@ def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
             :mod:`dicts` for more details of strategies. The default
             is dicts.MS_DICTS.
 
+          - ac_parallel: Load data from inputs concurrently if True or
+            'thread' with a thread pool, or 'process' with a process pool
+            which may help if loading is CPU-bound, e.g. with pure python
+            YAML parser. Results are merged in the order of inputs same as
+            sequential loading. It's ignored if ac_template is True as
+            contexts to render templates need results of previous inputs.
+
+            Workers are started at the first time and shared among calls.
+            It helps only if inputs are large or slow to read, e.g. on
+            network file systems, so that files smaller than
+            :data:`PARALLEL_MIN_SIZE` (1 MiB) in total are loaded
+            sequentially even if it's given.
+
+          - ac_workers: The maximum number of workers for ac_parallel
+
+          - ac_layered: Return a read-only :class:`anyconfig.dicts.LayeredDict`
+            object merges results lazily on lookup instead of merging them
+            eagerly if True. It's ignored if ac_template is True, and results
+            are merged eagerly before validation and query if ac_schema or
+            ac_query was given, or into a snapshot if ac_frozen is True.
+
         - Common backend options:
 
           - ignore_missing: Ignore and just return empty result if given file
@@ -212,50 +615,41 @@ def multi_load(inputs: typing.Union[typing.Iterable[ioinfo.PathOrIOInfoT],
     :return: Mapping object or any query result might be primitive objects
     :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
     """
-    schema = try_to_load_schema(
-        ac_template=ac_template, ac_context=ac_context, **options
-    )
+    hook = options['ac_profile'] = profiling.get_hook(options)
+    schema = _try_to_load_schema(hook, ac_template=ac_template,
+                                 ac_context=ac_context, **options)
     options['ac_schema'] = None  # Avoid to load schema more than twice.
 
-    iois = ioinfo.makes(inputs)
-    if are_same_file_types(iois):
-        ac_parser = parsers_find(iois[0], forced_type=ac_parser)
-
-    cnf = None
-    ctx = dicts_convert_to({}, **options)
-    if ac_context:
-        ctx = ac_context.copy()
+    with profiling.stage(hook, profiling.STAGE_IOINFO, inputs):
+        iois = ioinfo.makes(inputs)
 
-    for ioi in iois:
-        cups = _single_load(
-            ioi, ac_parser=ac_parser, ac_template=ac_template,
-            ac_context=ctx, **options
-        )
-        if cups:
-            if cnf is None:
-                cnf = cups  # type: ignore
+    if are_same_file_types(iois):
+        with profiling.stage(hook, profiling.STAGE_FIND, iois[0]):
+            ac_parser = parsers_find(iois[0], forced_type=ac_parser)
 
-            if is_dict_like(cups):
-                dicts_merge(
-                    typing.cast(MappingT, cnf),
-                    typing.cast(MappingT, cups),
-                    **options
-                )
-                dicts_merge(ctx, typing.cast(MappingT, cups), **options)
-            elif len(iois) > 1:
-                raise ValueError(
-                    f'Object loaded from {ioi!r} is not a mapping object and '
-                    'cannot be merged with later ones will be loaded from '
-                    'other inputs.'
-                )
+    layered = bool(options.get('ac_layered')) and not ac_template
+    ctx = ac_context.copy() if ac_context else dicts_convert_to({}, **options)
+    results = _load_all(iois, ac_parser=ac_parser, ac_template=ac_template,
+                        ac_context=ctx, **options)
+    (cnf, layers) = _merge_results(iois, results, ctx,
+                                   ac_template=ac_template, layered=layered,
+                                   **options)
 
     if cnf is None:
-        return dicts_convert_to({}, **options)
-
-    if schema and not is_valid(cnf, schema, **options):
-        return None
+        return _try_to_freeze(dicts_convert_to({}, **options), **options)
+
+    if layers:
+        cnf = LayeredDict(layers, **options)
+        if schema or options.get('ac_query'):
+            with profiling.stage(hook, profiling.STAGE_MERGE):
+                cnf = cnf.materialize(
+                    ac_ordered=options.get('ac_ordered', False),
+                    ac_dict=options.get('ac_dict')
+                )
+        else:
+            return _try_to_freeze(cnf, **options)
 
-    return try_query(cnf, options.get('ac_query', False), **options)
+    return _validate_and_query(cnf, schema, hook, **options)
 
 
 def load(path_specs, ac_parser=None, ac_dict=None, ac_template=False,
@@ -289,7 +683,10 @@ def load(path_specs, ac_parser=None, ac_dict=None, ac_template=False,
     :return: Mapping object or any query result might be primitive objects
     :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
     """
-    iois = ioinfo.makes(path_specs)
+    hook = options['ac_profile'] = profiling.get_hook(options)
+    with profiling.stage(hook, profiling.STAGE_IOINFO, path_specs):
+        iois = ioinfo.makes(path_specs)
+
     if not iois:
         raise ValueError(f'Maybe invalid input: {path_specs!r}')
 
@@ -330,24 +727,32 @@ def loads(content, ac_parser=None, ac_dict=None, ac_template=False,
                       "parser to load configurations from string.")
         return None
 
-    psr = parsers_find(None, forced_type=ac_parser)
+    hook = options['ac_profile'] = profiling.get_hook(options)
+    with profiling.stage(hook, profiling.STAGE_FIND):
+        psr = parsers_find(None, forced_type=ac_parser)
+
     schema = None
     ac_schema = options.get('ac_schema', None)
     if ac_schema is not None:
         options['ac_schema'] = None
-        schema = loads(ac_schema, ac_parser=psr, ac_dict=ac_dict,
-                       ac_template=ac_template, ac_context=ac_context,
-                       **options)
+        with profiling.stage(hook, profiling.STAGE_SCHEMA):
+            schema = _load_schema_with_cache(
+                _schema_key((ac_schema, psr.cid()), ac_dict=ac_dict,
+                            ac_template=ac_template, **options),
+                lambda: loads(ac_schema, ac_parser=psr, ac_dict=ac_dict,
+                              ac_template=ac_template, ac_context=ac_context,
+                              **dict(options, ac_frozen=False))
+            )
 
     if ac_template:
-        compiled = try_render(content=content, ctx=ac_context, **options)
+        with profiling.stage(hook, profiling.STAGE_RENDER):
+            compiled = try_render(content=content, ctx=ac_context, **options)
         if compiled is not None:
             content = compiled
 
-    cnf = psr.loads(content, ac_dict=ac_dict, **options)
-    if not is_valid(cnf, schema, **options):
-        return None
+    with profiling.stage(hook, profiling.STAGE_PARSE):
+        cnf = psr.loads(content, ac_dict=ac_dict, **options)
 
-    return try_query(cnf, options.get('ac_query', False), **options)
+    return _validate_and_query(cnf, schema, hook, **options)
 
 # vim:sw=4:ts=4:et:
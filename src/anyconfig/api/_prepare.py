@@ -0,0 +1,228 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+r"""Provides the API to make loaders with options resolved only once.
+
+.. versionadded:: 0.13.1
+
+Load APIs find the parser, resolve the container factory, filter backend
+options, load the schema and compile the query every time. :func:`prepare`
+does all of them once and returns a :class:`PreparedLoader` object, so that
+loading data from many inputs with same options costs little more than
+parsing them.
+"""
+import typing
+import warnings
+
+from .. import ioinfo, profiling
+from ..backend.base import (
+    GenContainerT, OptionsT
+)
+from ..common import InDataExT
+from ..dicts import freeze
+from ..parsers import find as parsers_find
+from ..query import make_query
+from ..schema import make_validator
+from ..template import try_render
+from . import _load
+from .datatypes import ParserT
+
+
+# Options need the general path of load APIs and cannot be prepared.
+_UNPREPARABLE_OPTIONS: typing.Tuple[str, ...] = (
+    'ac_template', 'ac_cache', 'ac_cache_dir'
+)
+
+
+class _Entry(typing.NamedTuple):
+    """A parser and the options resolved for it."""
+
+    parser: ParserT
+    container: GenContainerT
+    options: OptionsT
+
+
+class PreparedLoader:
+    """Callable loads data from an input with options resolved once.
+
+    Objects of this class are made by :func:`prepare` and can be shared among
+    threads.
+
+    :param ac_parser: See :func:`prepare`
+    :param ac_schema: See :func:`prepare`
+    :param ac_query: See :func:`prepare`
+    :param options: See :func:`prepare`
+    """
+
+    def __init__(self, ac_parser: _load.MaybeParserOrIdOrTypeT = None,
+                 ac_schema: typing.Optional[str] = None,
+                 ac_query: typing.Optional[str] = None,
+                 **options) -> None:
+        """Initialize."""
+        self.options = options
+        self._template = bool(options.pop('ac_template', False))
+        self._context = options.pop('ac_context', None)
+        self._ignore_missing = bool(options.get('ac_ignore_missing', False))
+        self._frozen = bool(options.get('ac_frozen', False))
+        # Cache objects may be evaluated as False if they're empty.
+        self._general = self._template or any(
+            options.get(opt) not in (None, False)
+            for opt in _UNPREPARABLE_OPTIONS
+        )
+
+        # Parsers and options resolved for them keyed by file extensions.
+        self._entries: typing.Dict[str, _Entry] = {}
+        self._entry: typing.Optional[_Entry] = None
+        if ac_parser is not None:
+            self._entry = self._make_entry(
+                parsers_find(None, forced_type=ac_parser)
+            )
+
+        schema = _load.try_to_load_schema(ac_schema=ac_schema,
+                                          ac_template=self._template,
+                                          ac_context=self._context,
+                                          **options)
+        self._validator = (make_validator(schema, **options) if schema
+                           else None)
+        self._query = make_query(ac_query, **options) if ac_query else None
+
+    def _make_entry(self, psr: ParserT) -> _Entry:
+        """Resolve the options for the parser ``psr``."""
+        (container, options) = psr.prepare(**self.options)
+        return _Entry(psr, container, options)
+
+    def _find(self, ioi: ioinfo.IOInfo) -> _Entry:
+        """Find the parser and the options resolved for ``ioi``."""
+        if self._entry is not None:
+            return self._entry
+
+        ent = self._entries.get(ioi.extension)
+        if ent is None:
+            ent = self._entries[ioi.extension] = self._make_entry(
+                parsers_find(ioi)
+            )
+
+        return ent
+
+    def _validate_and_query(self, cnf: InDataExT,
+                            hook: typing.Optional[profiling.HookT]
+                            ) -> InDataExT:
+        """Validate ``cnf`` and query it if needed."""
+        if self._validator is not None:
+            with profiling.stage(hook, profiling.STAGE_VALIDATE):
+                if not self._validator(cnf):
+                    return None
+
+        if self._query is not None:
+            with profiling.stage(hook, profiling.STAGE_QUERY):
+                cnf = self._query(cnf)
+
+        return freeze(cnf) if self._frozen else cnf
+
+    def __call__(self, input_: ioinfo.PathOrIOInfoT) -> InDataExT:
+        r"""Load data from single input ``input\_``.
+
+        :param input\_:
+            File path or file or file-like object or pathlib.Path object
+            represents the file or a namedtuple 'anyconfig.ioinfo.IOInfo'
+            object represents some input to load some data from
+        :return: Mapping object or any query result
+        :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+        """
+        hook = profiling.get_hook(self.options)
+        with profiling.stage(hook, profiling.STAGE_IOINFO, input_):
+            ioi = ioinfo.make(input_)
+
+        with profiling.stage(hook, profiling.STAGE_FIND, ioi):
+            ent = self._find(ioi)
+
+        if self._general:
+            options = dict(self.options, ac_profile=hook)
+            cnf = _load._single_load(ioi, ac_parser=ent.parser,
+                                     ac_template=self._template,
+                                     ac_context=self._context, **options)
+        else:
+            with profiling.stage(hook, profiling.STAGE_PARSE, ioi):
+                cnf = ent.parser.load_prepared(
+                    ioi, ent.container, ent.options,
+                    ac_ignore_missing=self._ignore_missing
+                )
+
+        return self._validate_and_query(cnf, hook)
+
+    def loads(self, content: str) -> InDataExT:
+        """Load data from a str, ``content``.
+
+        :param content: Configuration file's content (a string)
+        :return: Mapping object or any query result, or None if the parser
+            was not given to :func:`prepare`
+        """
+        if self._entry is None:
+            warnings.warn("ac_parser was not given but it's must to find "
+                          "correct parser to load configurations from "
+                          "string.")
+            return None
+
+        hook = profiling.get_hook(self.options)
+        if self._template:
+            with profiling.stage(hook, profiling.STAGE_RENDER):
+                compiled = try_render(content=content, ctx=self._context,
+                                      **self.options)
+            if compiled is not None:
+                content = compiled
+
+        ent = self._entry
+        with profiling.stage(hook, profiling.STAGE_PARSE):
+            cnf = ent.parser.loads_prepared(content, ent.container,
+                                            ent.options)
+
+        return self._validate_and_query(cnf, hook)
+
+
+def prepare(ac_parser: _load.MaybeParserOrIdOrTypeT = None,
+            ac_dict: typing.Optional[typing.Callable[..., typing.Any]] = None,
+            ac_schema: typing.Optional[str] = None,
+            ac_query: typing.Optional[str] = None,
+            **options) -> PreparedLoader:
+    """Make a loader loads data with options resolved only once.
+
+    The parser, the container factory, backend specific options, the
+    validator of the schema and the compiled query are resolved once, and
+    loading data with the loader made runs the backend parser only, e.g.:
+
+    .. code-block:: python
+
+       load = anyconfig.prepare(ac_parser='json', ac_schema='schema.json')
+       for path in paths:
+           cnf = load(path)
+
+       cnf = load.loads('{"a": 1}')
+
+    .. note::
+
+       The loader loads data from single input. Use :func:`load` to load
+       and merge data from multiple inputs. Options ac_template, ac_cache and
+       ac_cache_dir are supported but need the general path of
+       :func:`single_load` which resolves some of options every time.
+
+    :param ac_parser:
+        Forced parser type or ID or parser object. Parsers are found by file
+        extensions of inputs and cached if it's not given.
+    :param ac_dict: See :func:`single_load`
+    :param ac_schema: JSON schema file path to validate data loaded
+    :param ac_query: JMESPath expression to query data loaded
+    :param options:
+        Optional keyword arguments :func:`single_load` supports such as
+        ac_ordered, ac_ignore_missing, ac_profile, ac_frozen and backend
+        specific options
+
+    :return: A :class:`PreparedLoader` object
+    :raises:
+        ValueError, UnknownProcessorTypeError, UnknownFileTypeError, and
+        errors on loading the schema and compiling the query
+    """
+    return PreparedLoader(ac_parser=ac_parser, ac_schema=ac_schema,
+                          ac_query=ac_query, ac_dict=ac_dict, **options)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,286 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+r"""Provides the API to watch files and reload data on changes.
+
+:func:`watch` returns a :class:`Watcher` object holds data loaded from files
+same as :func:`anyconfig.api.multi_load` does. It checks if the files were
+changed, added or removed by polling, and reloads data on changes.
+
+Data loaded from each file (layer) and the intermediate results of merging
+them are kept, so that only the changed files are parsed again and results
+are merged again from the first changed layer onward. The intermediate
+results are kept as snapshots, :class:`anyconfig.dicts.FrozenDict` objects,
+share subtrees not changed by later layers, so that merging a layer costs
+proportional to the size of the layer instead of the whole data.
+"""
+import threading
+import typing
+import warnings
+
+from .. import ioinfo
+from ..cache.utils import (
+    copy_data, file_signature
+)
+from ..common import InDataExT
+from ..dicts import (
+    FrozenDict,
+    convert_to as dicts_convert_to,
+    freeze as dicts_freeze,
+    thaw as dicts_thaw
+)
+from ..query import try_query
+from ..schema import is_valid
+from ..utils import is_dict_like
+from . import _load
+
+
+CallbackT = typing.Callable[[InDataExT, typing.List[str]], None]
+
+
+class _Layer(typing.NamedTuple):
+    """Data loaded from an input and the result of merging data so far.
+
+    ``merged`` is a snapshot if it's a mapping object.
+    """
+
+    path: str
+    sig: typing.Optional[typing.Tuple[int, int, int]]
+    data: InDataExT
+    merged: InDataExT
+
+
+def _key(ioi: ioinfo.IOInfo) -> str:
+    """Get the key of the layer made from ``ioi``."""
+    return ioi.path or repr(ioi.src)
+
+
+class Watcher:
+    """Object holds data loaded from files and reloads it on changes.
+
+    :param path_specs: See :func:`anyconfig.api.multi_load`
+    :param options: See :func:`anyconfig.api.multi_load`
+    """
+
+    def __init__(self, path_specs: typing.Any, **options) -> None:
+        """Initialize and load data from ``path_specs``."""
+        self.path_specs = path_specs
+        self.options = options
+
+        self._layers: typing.List[_Layer] = []
+        self._snapshot: InDataExT = None
+        self._callbacks: typing.List[CallbackT] = []
+        self._lock = threading.RLock()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self._schema = _load.try_to_load_schema(**options)
+        self.options['ac_schema'] = None  # It's loaded only once.
+
+        self.poll()
+
+    @property
+    def snapshot(self) -> InDataExT:
+        """Get the current data loaded.
+
+        .. note::
+
+           It must not be modified. Use the option ac_frozen to make it a
+           read-only :class:`anyconfig.dicts.FrozenDict` object.
+        """
+        return self._snapshot
+
+    @property
+    def paths(self) -> typing.List[str]:
+        """Get the list of paths of the files loaded."""
+        return [layer.path for layer in self._layers]
+
+    def add_callback(self, callback: CallbackT) -> None:
+        """Add ``callback`` called with the new data and paths changed."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def _load_layers(self, iois: typing.List[ioinfo.IOInfo], start: int
+                     ) -> typing.List[_Layer]:
+        """Load and merge data from ``iois[start:]`` to make layers.
+
+        Data of layers were not changed are reused.
+        """
+        opts = self.options
+        olds = {layer.path: layer for layer in self._layers[start:]}
+        layers = self._layers[:start]
+        merged = layers[-1].merged if layers else None
+
+        for ioi in iois[start:]:
+            key = _key(ioi)
+            sig = file_signature(ioi)
+            old = olds.get(key)
+            if old is not None and sig is not None and old.sig == sig:
+                data = old.data
+            else:
+                data = _load._single_load(ioi, **opts)
+
+            if data:
+                if is_dict_like(data):
+                    if isinstance(merged, FrozenDict):
+                        merged = merged.merge(
+                            typing.cast(_load.MappingT, data), **opts
+                        )
+                    else:
+                        merged = dicts_freeze(data)
+                elif len(iois) > 1:
+                    raise ValueError(
+                        f'Object loaded from {ioi!r} is not a mapping object '
+                        'and cannot be merged with other ones.'
+                    )
+                elif merged is None:
+                    merged = data
+
+            layers.append(_Layer(key, sig, data, merged))
+
+        return layers
+
+    def _first_changed(self, iois: typing.List[ioinfo.IOInfo]
+                       ) -> typing.Optional[int]:
+        """Find the index of the first layer changed, or None."""
+        for idx, (ioi, layer) in enumerate(zip(iois, self._layers)):
+            if _key(ioi) != layer.path or file_signature(ioi) != layer.sig:
+                return idx
+
+        if len(iois) != len(self._layers):
+            return min(len(iois), len(self._layers))
+
+        return None
+
+    def poll(self) -> bool:
+        """Check changes of files and reload data if changed.
+
+        Data will be reloaded from the first layer changed onward, or all of
+        layers if 'ac_template' option was given as results of rendering
+        templates depend on the data of previous layers.
+
+        :return: True if data was reloaded
+        :raises: Any exceptions raised on loading data
+        """
+        with self._lock:
+            iois = ioinfo.makes(self.path_specs)
+            if self._snapshot is not None or self._layers:
+                start = self._first_changed(iois)
+                if start is None:
+                    return False
+            else:
+                start = 0
+
+            if self.options.get('ac_template'):
+                snapshot = _load.multi_load(iois, **self.options)
+                layers = [_Layer(_key(i), file_signature(i), None, None)
+                          for i in iois]
+            else:
+                layers = self._load_layers(iois, start)
+                snapshot = self._make_snapshot(layers)
+
+            olds = set((layer.path, layer.sig) for layer in self._layers)
+            news = set((layer.path, layer.sig) for layer in layers)
+            changed = sorted(set(path for path, _sig in olds ^ news))
+            (self._layers, self._snapshot) = (layers, snapshot)
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback(snapshot, changed)
+
+        return True
+
+    def _make_snapshot(self, layers: typing.List[_Layer]) -> InDataExT:
+        """Make a snapshot from the last layer."""
+        opts = self.options
+        frozen = opts.get('ac_frozen', False)
+        cnf = layers[-1].merged if layers else None
+        if cnf is None:
+            cnf = dicts_convert_to({}, **opts)
+            return dicts_freeze(cnf) if frozen else cnf
+
+        query = opts.get('ac_query', False)
+        if frozen and not self._schema and not query:
+            return cnf if isinstance(cnf, FrozenDict) else dicts_freeze(cnf)
+
+        # Validate and query mutable copies same as multi_load does, as
+        # validators may not accept snapshots.
+        if isinstance(cnf, FrozenDict):
+            cnf = dicts_thaw(cnf, ac_ordered=opts.get('ac_ordered', False),
+                             ac_dict=opts.get('ac_dict'))
+        else:
+            cnf = copy_data(cnf)
+
+        if self._schema and not is_valid(cnf, self._schema, **opts):
+            return None
+
+        cnf = try_query(cnf, query, **opts)
+        return dicts_freeze(cnf) if frozen else cnf
+
+    def _run(self, interval: float) -> None:
+        """Poll changes periodically until stopped."""
+        while not self._stop.wait(interval):
+            try:
+                self.poll()
+            except Exception as exc:  # pylint: disable=broad-except
+                warnings.warn(f'Failed to reload: {self.path_specs!r}, '
+                              f'exc={exc!r}')
+
+    def start(self, interval: float = 1.0) -> None:
+        """Start a daemon thread to poll changes every ``interval`` secs."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run,
+                                            args=(interval, ), daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread polling changes if running."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def __enter__(self) -> 'Watcher':
+        """Use this as a context manager stops polling on exit."""
+        return self
+
+    def __exit__(self, *_args) -> None:
+        """Stop polling."""
+        self.stop()
+
+
+def watch(path_specs: typing.Any,
+          ac_interval: typing.Optional[float] = None,
+          **options) -> Watcher:
+    r"""Load data from files and return an object reloads it on changes.
+
+    :param path_specs:
+        A list of file path or a glob pattern such as r'/a/b/\*.json' to
+        list of files, file or file-like object or pathlib.Path object
+        represents the file or a namedtuple 'anyconfig.ioinfo.IOInfo' object
+        represents some inputs to load some data from. Glob patterns are
+        expanded on every checks so that files added or removed are found.
+    :param ac_interval:
+        Interval in seconds to check changes in a background thread, or None
+        not to start the thread. Call :meth:`Watcher.poll` to check changes
+        in the latter case.
+    :param options: See :func:`anyconfig.api.multi_load`
+
+    :return: A :class:`Watcher` object
+    :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
+    """
+    watcher = Watcher(path_specs, **options)
+    if ac_interval is not None:
+        watcher.start(ac_interval)
+
+    return watcher
+
+# vim:sw=4:ts=4:et:
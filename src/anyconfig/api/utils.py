@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: MIT
 #
 """Utility funtions for anyconfig.api."""
+import concurrent.futures
+import functools
 import typing
 
 if typing.TYPE_CHECKING:
@@ -17,4 +19,26 @@ def are_same_file_types(objs: typing.List['ioinfo.IOInfo']) -> bool:
     ext = objs[0].extension
     return all(p.extension == ext for p in objs[1:])
 
+
+async def run_in_executor(
+    executor: typing.Optional[concurrent.futures.Executor],
+    func: typing.Callable[..., typing.Any], *args, **kwargs
+) -> typing.Any:
+    """Run ``func`` in ``executor`` not to block the running event loop.
+
+    :param executor:
+        An executor to run ``func`` or None to use the default executor of
+        the event loop
+    :param func: A callable to run
+    :param args: Positional arguments passed to ``func``
+    :param kwargs: Keyword arguments passed to ``func``
+    """
+    # It's imported here as it takes long and is not needed in most cases.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
 # vim:sw=4:ts=4:et:
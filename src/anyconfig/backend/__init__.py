@@ -2,82 +2,116 @@
 # Copyright (C) 2011 - 2021 Satoru SATOH <satoru.satoh @ gmail.com>
 # SPDX-License-Identifier: MIT
 #
-# Suppress import positions after some global variables are defined
-# pylint: disable=wrong-import-position
-"""A collection of backend modules available by default."""
+"""A collection of backend modules available by default.
+
+.. versionchanged:: 0.13.1
+
+   - Backend modules are not imported until parsers in them are needed.
+     :data:`LAZY_PARSERS` provides the metadata of parsers to find them
+     without importing backend modules, and :data:`PARSERS` imports all of
+     them on access to keep backward compatibility.
+"""
+import importlib
+import typing
 import warnings
 
-from . import (
-    ini,
-    json,
-    pickle,
-    properties,
-    shellvars,
-    yaml,
-    xml
-)
+from ..models.processor import LazyProcessor
 from .base import (
     ParserT, ParsersT, ParserClssT
 )
 
 
-PARSERS: ParserClssT = [
-    ini.Parser, pickle.Parser, properties.Parser, shellvars.Parser, xml.Parser
-] + json.PARSERS
-
 _NA_MSG = "'{}' module is not available. Disabled {} support."
 
-if yaml.PARSERS:
-    PARSERS.extend(yaml.PARSERS)
-else:
-    warnings.warn(_NA_MSG.format('yaml', 'YAML'), ImportWarning)
-
-try:
-    from . import toml
-    PARSERS.append(toml.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('toml', 'TOML'), ImportWarning)
-
-try:
-    from . import configobj
-    PARSERS.append(configobj.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('configobj', 'ConfigObj'), ImportWarning)
-
-try:
-    from . import json5
-    PARSERS.append(json5.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('json5', 'JSON5'), ImportWarning)
-
-try:
-    from . import bson
-    PARSERS.append(bson.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('bson', 'BSON'), ImportWarning)
-
-try:
-    from . import cbor2
-    PARSERS.append(cbor2.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('cbor2', 'CBOR2'), ImportWarning)
-
-try:
-    from . import msgpack
-    PARSERS.append(msgpack.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('msgpack', 'MSGPACK'), ImportWarning)
-
-try:
-    from . import ion
-    PARSERS.append(ion.Parser)
-except ImportError:
-    warnings.warn(_NA_MSG.format('ion', 'ION'), ImportWarning)
+# .. note::
+#    Metadata here must be same as the parser classes have and the order of
+#    them is the order to register them.
+_PARSER_SPECS: typing.List[LazyProcessor] = [
+    LazyProcessor(f'{__name__}.ini', 'ini', 'ini', 0, ['ini']),
+    LazyProcessor(f'{__name__}.pickle', 'pickle', 'pickle', 0,
+                  ['pkl', 'pickle']),
+    LazyProcessor(f'{__name__}.properties', 'properties', 'properties', 0,
+                  ['properties']),
+    LazyProcessor(f'{__name__}.shellvars', 'shellvars', 'shellvars', 0,
+                  ['sh']),
+    LazyProcessor(f'{__name__}.xml', 'xml', 'xml', 0, ['xml']),
+    LazyProcessor(f'{__name__}.json.default', 'std.json', 'json', 30,
+                  ['json', 'jsn', 'js', 'ndjson', 'jsonl']),
+    LazyProcessor(f'{__name__}.json.simplejson', 'simplejson', 'json', 0,
+                  ['json', 'jsn', 'js', 'ndjson', 'jsonl'],
+                  requires=['simplejson']),
+    LazyProcessor(f'{__name__}.yaml.pyyaml', 'pyyaml', 'yaml', 30,
+                  ['yaml', 'yml'], requires=['yaml']),
+    LazyProcessor(f'{__name__}.yaml.ruamel_yaml', 'ruamel.yaml', 'yaml', 0,
+                  ['yaml', 'yml'], requires=['ruamel.yaml']),
+    LazyProcessor(f'{__name__}.toml', 'toml', 'toml', 0, ['toml'],
+                  requires=['toml']),
+    LazyProcessor(f'{__name__}.configobj', 'configobj', 'configobj', 10,
+                  ['cobj', 'configobj'], requires=['configobj']),
+    LazyProcessor(f'{__name__}.json5', 'json5', 'json5', 0, ['json5'],
+                  requires=['json5']),
+    LazyProcessor(f'{__name__}.bson', 'bson', 'bson', 0, ['bson', 'bsn'],
+                  requires=['bson']),
+    LazyProcessor(f'{__name__}.cbor2', 'cbor2', 'cbor', 10, ['cbor'],
+                  requires=['cbor2']),
+    LazyProcessor(f'{__name__}.msgpack', 'base', 'msgpack', 0,
+                  ['mpk', 'msgpack'], requires=['msgpack']),
+    LazyProcessor(f'{__name__}.ion', 'base', 'ion', 0, ['ion'],
+                  requires=['amazon.ion']),
+]
+
+# Backend modules and the names of formats to warn if they are not available.
+_MODULES: typing.Tuple[str, ...] = (
+    'ini', 'json', 'pickle', 'properties', 'shellvars', 'yaml', 'xml',
+    'toml', 'configobj', 'json5', 'bson', 'cbor2', 'msgpack', 'ion'
+)
+_FORMATS: typing.Dict[str, str] = {
+    'yaml': 'YAML', 'toml': 'TOML', 'configobj': 'ConfigObj',
+    'json5': 'JSON5', 'bson': 'BSON', 'cbor2': 'CBOR2', 'msgpack': 'MSGPACK',
+    'ion': 'ION',
+}
+
+
+def _list_available_parsers() -> typing.List[LazyProcessor]:
+    """List the parsers available without importing backend modules."""
+    res = [spec for spec in _PARSER_SPECS if spec.is_available()]
+
+    # e.g. 'anyconfig.backend.yaml.pyyaml' -> 'yaml'
+    mods = set(spec.module.split('.')[2] for spec in res)
+    for mod, fmt in _FORMATS.items():
+        if mod not in mods:
+            warnings.warn(_NA_MSG.format(mod, fmt), ImportWarning)
+
+    return res
+
+
+LAZY_PARSERS: typing.List[LazyProcessor] = _list_available_parsers()
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import backend modules and the parser classes on access.
+
+    :data:`PARSERS` is a list of all of the parser classes available.
+    """
+    if name == 'PARSERS':
+        pclss = []
+        for spec in LAZY_PARSERS:
+            try:
+                pclss.append(spec.load_class())
+            except ImportError:
+                warnings.warn(_NA_MSG.format(spec.module, spec.type()),
+                              ImportWarning)
+        return pclss
+
+    if name in _MODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 __all__ = [
     'ParserT', 'ParsersT', 'ParserClssT',
-    'PARSERS',
+    'LAZY_PARSERS', 'PARSERS',
 ]
 
 # vim:sw=4:ts=4:et:
@@ -11,7 +11,7 @@ from .datatypes import (
     InDataExT, IoiT
 )
 from .utils import (
-    ensure_outdir_exists, not_implemented
+    ensure_outdir_exists, not_implemented, record_dump
 )
 
 
@@ -80,7 +80,10 @@ class DumperMixin:
         :return: string represents the configuration
         """
         kwargs = utils.filter_options(self._dump_opts, kwargs)
-        return self.dump_to_string(cnf, **kwargs)
+        content = self.dump_to_string(cnf, **kwargs)
+        record_dump(self, content=content)
+
+        return content
 
     def dump(self, cnf: InDataExT, ioi: IoiT, **kwargs):
         """Dump config 'cnf' to output object of which 'ioi' referring.
@@ -97,9 +100,11 @@ class DumperMixin:
 
         if ioinfo.is_stream(ioi):
             self.dump_to_stream(cnf, typing.cast(typing.IO, ioi.src), **kwargs)
+            record_dump(self)
         else:
             ensure_outdir_exists(ioi.path)
             self.dump_to_path(cnf, ioi.path, **kwargs)
+            record_dump(self, path=ioi.path)
 
 
 class BinaryDumperMixin(DumperMixin):
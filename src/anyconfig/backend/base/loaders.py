@@ -6,13 +6,16 @@
 import collections
 import io
 import pathlib
+import time
 import typing
 
 from ... import ioinfo, utils
 from .datatypes import (
     InDataExT, IoiT, GenContainerT, OptionsT
 )
-from .utils import not_implemented
+from .utils import (
+    not_implemented, record_load
+)
 
 
 DATA_DEFAULT: InDataExT = {}
@@ -27,6 +30,11 @@ class LoaderMixin:
     - :meth:`load_from_stream`: Load config from a file or file-like object
     - :meth:`load_from_path`: Load config from file of given path
 
+    and may override the following method optionally.
+
+    - :meth:`load_iter_from_stream`: Load data from a file or file-like object
+      consists of multiple documents or records one by one
+
     Member variables:
 
     - _load_opts: Backend specific options on load
@@ -140,6 +148,92 @@ class LoaderMixin:
         not_implemented(self, stream, container, **kwargs)
         return DATA_DEFAULT
 
+    def load_iter_from_stream(self, stream: typing.IO,
+                              container: GenContainerT, **kwargs
+                              ) -> typing.Iterator[InDataExT]:
+        """Load data from given file like object 'stream' one by one.
+
+        Parsers support inputs consist of multiple documents or records such
+        as YAML multi-document streams should override this to yield each of
+        them. It yields the data loaded by :meth:`load_from_stream` by default.
+
+        :param stream:  Config file or file like object
+        :param container: callble to make a container object later
+        :param kwargs: optional keyword parameters to be sanitized :: dict
+
+        :return: A generator yields dict-like objects or primitive objects
+        """
+        yield self.load_from_stream(stream, container, **kwargs)
+
+    def prepare(self, **options) -> typing.Tuple[GenContainerT, OptionsT]:
+        """Resolve the container factory and backend specific options.
+
+        Results can be passed to :meth:`loads_prepared` and
+        :meth:`load_prepared` many times to load data with same options
+        without resolving them every time.
+
+        .. versionadded:: 0.13.1
+
+        :param options: Keyword options same as the ones of :meth:`load`
+        :return: A tuple of (container factory, backend specific options)
+        """
+        container = self._container_factory(**options)
+        return (container, self._load_options(container, **options))
+
+    def loads_prepared(self, content: str, container: GenContainerT,
+                       options: OptionsT) -> InDataExT:
+        """Load config from given string 'content' with resolved options.
+
+        .. versionadded:: 0.13.1
+
+        :param content: Config file content
+        :param container: The container factory :meth:`prepare` returned
+        :param options: Backend specific options :meth:`prepare` returned
+        :return: dict or dict-like object holding configurations
+        """
+        if not content or content is None:
+            return container()
+
+        started = time.perf_counter()
+        cnf = self.load_from_string(content, container, **options)
+        record_load(self, started, content=content)
+
+        return cnf
+
+    def load_prepared(self, ioi: IoiT, container: GenContainerT,
+                      options: OptionsT, ac_ignore_missing: bool = False
+                      ) -> InDataExT:
+        """Load config from ``ioi`` with resolved options.
+
+        .. versionadded:: 0.13.1
+
+        :param ioi:
+            'anyconfig.ioinfo.IOInfo' namedtuple object provides various info
+            of input object to load data from
+        :param container: The container factory :meth:`prepare` returned
+        :param options: Backend specific options :meth:`prepare` returned
+        :param ac_ignore_missing: See :meth:`load`
+        :return: dict or dict-like object holding configurations
+        """
+        if not ioi:
+            return container()
+
+        if ioinfo.is_stream(ioi):
+            started = time.perf_counter()
+            cnf = self.load_from_stream(
+                typing.cast(typing.IO, ioi.src), container, **options
+            )
+            record_load(self, started)
+        else:
+            if ac_ignore_missing and not pathlib.Path(ioi.path).exists():
+                return container()
+
+            started = time.perf_counter()
+            cnf = self.load_from_path(ioi.path, container, **options)
+            record_load(self, started, path=ioi.path)
+
+        return cnf
+
     def loads(self, content: str, **options) -> InDataExT:
         """Load config from given string 'content' after some checks.
 
@@ -152,12 +246,8 @@ class LoaderMixin:
 
         :return: dict or dict-like object holding configurations
         """
-        container = self._container_factory(**options)
-        if not content or content is None:
-            return container()
-
-        options = self._load_options(container, **options)
-        return self.load_from_string(content, container, **options)
+        (container, options) = self.prepare(**options)
+        return self.loads_prepared(content, container, options)
 
     def load(self, ioi: IoiT, ac_ignore_missing: bool = False,
              **options) -> InDataExT:
@@ -178,23 +268,42 @@ class LoaderMixin:
 
         :return: dict or dict-like object holding configurations
         """
+        (container, options) = self.prepare(**options)
+        return self.load_prepared(ioi, container, options,
+                                  ac_ignore_missing=ac_ignore_missing)
+
+    def load_iter(self, ioi: IoiT, ac_ignore_missing: bool = False,
+                  **options) -> typing.Iterator[InDataExT]:
+        """Load data from ``ioi`` consists of multiple documents one by one.
+
+        :param ioi:
+            'anyconfig.ioinfo.IOInfo' namedtuple object provides various info
+            of input object to load data from
+        :param ac_ignore_missing:
+            Ignore and yield nothing if given `ioi` object does not exist in
+            actual.
+        :param options: See :meth:`load`
+
+        :return: A generator yields dict-like objects or primitive objects
+        """
         container = self._container_factory(**options)
         options = self._load_options(container, **options)
 
         if not ioi:
-            return container()
+            return
 
         if ioinfo.is_stream(ioi):
-            cnf = self.load_from_stream(
+            yield from self.load_iter_from_stream(
                 typing.cast(typing.IO, ioi.src), container, **options
             )
         else:
             if ac_ignore_missing and not pathlib.Path(ioi.path).exists():
-                return container()
-
-            cnf = self.load_from_path(ioi.path, container, **options)
+                return
 
-        return cnf
+            with self.ropen(ioi.path) as inp:
+                yield from self.load_iter_from_stream(
+                    inp, container, **options
+                )
 
 
 class BinaryLoaderMixin(LoaderMixin):
@@ -66,9 +66,24 @@ class StreamParser(Parser, FromStreamLoaderMixin, ToStreamDumperMixin):
 
 
 LoadFnT = typing.Callable[..., InDataExT]
+LoadIterFnT = typing.Callable[..., typing.Iterable[InDataExT]]
 DumpFnT = typing.Callable[..., typing.Optional[str]]
 
 
+def _to_container(ret: InDataExT, container: GenContainerT,
+                  allow_primitives: bool = False) -> InDataExT:
+    """Convert ``ret`` loaded by backend functions to a container object.
+
+    :param ret: Data loaded
+    :param container: callble to make a container object
+    :param allow_primitives: See :func:`load_with_fn`
+    """
+    if is_dict_like(ret):
+        return container() if (ret is None or not ret) else container(ret)
+
+    return ret if allow_primitives else container(ret)
+
+
 def load_with_fn(load_fn: typing.Optional[LoadFnT],
                  content_or_strm: typing.Union[str, typing.IO],
                  container: GenContainerT,
@@ -89,11 +104,8 @@ def load_with_fn(load_fn: typing.Optional[LoadFnT],
     if load_fn is None:
         raise TypeError('The first argument "load_fn" must be a callable!')
 
-    ret = load_fn(content_or_strm, **options)
-    if is_dict_like(ret):
-        return container() if (ret is None or not ret) else container(ret)
-
-    return ret if allow_primitives else container(ret)
+    return _to_container(load_fn(content_or_strm, **options), container,
+                         allow_primitives)
 
 
 def dump_with_fn(dump_fn: typing.Optional[DumpFnT],
@@ -132,6 +144,11 @@ class StringStreamFnParser(Parser, FromStreamLoaderMixin, ToStreamDumperMixin):
     - _dump_to_string_fn: Callable to dump data to string
     - _dump_to_stream_fn: Callable to dump data to stream (file object)
 
+    and may define the following optionally.
+
+    - _load_iter_from_stream_fn: Callable returns an iterable yields data
+      loaded from stream consists of multiple documents or records
+
     .. note::
        Callables have to be wrapped with :func:`to_method` to make 'self'
        passed to the methods created from them ignoring it.
@@ -141,6 +158,7 @@ class StringStreamFnParser(Parser, FromStreamLoaderMixin, ToStreamDumperMixin):
 
     _load_from_string_fn: typing.Optional[LoadFnT] = None
     _load_from_stream_fn: typing.Optional[LoadFnT] = None
+    _load_iter_from_stream_fn: typing.Optional[LoadIterFnT] = None
     _dump_to_string_fn: typing.Optional[DumpFnT] = None
     _dump_to_stream_fn: typing.Optional[DumpFnT] = None
 
@@ -172,6 +190,26 @@ class StringStreamFnParser(Parser, FromStreamLoaderMixin, ToStreamDumperMixin):
                             allow_primitives=self.allow_primitives(),
                             **options)
 
+    def load_iter_from_stream(self, stream: typing.IO,
+                              container: GenContainerT, **options
+                              ) -> typing.Iterator[InDataExT]:
+        """Load data from given stream 'stream' one by one.
+
+        :param stream: Stream provides configuration data
+        :param container: callble to make a container object
+        :param options: keyword options passed to '_load_iter_from_stream_fn'
+
+        :return: A generator yields container objects holding the data
+        """
+        if self._load_iter_from_stream_fn is None:
+            yield from super().load_iter_from_stream(stream, container,
+                                                     **options)
+            return
+
+        allow_primitives = self.allow_primitives()
+        for ret in self._load_iter_from_stream_fn(stream, **options):
+            yield _to_container(ret, container, allow_primitives)
+
     def dump_to_string(self, cnf: InDataExT, **kwargs) -> str:
         """Dump config 'cnf' to a string.
 
@@ -4,9 +4,13 @@
 #
 """Provides utility functions in anyconfig.backend.base."""
 import functools
+import os
 import pathlib
+import time
 import typing
 
+from ... import metrics
+
 
 def not_implemented(*_args, **_kwargs) -> None:
     """Raise NotImplementedError."""
@@ -36,4 +40,65 @@ def to_method(func: typing.Callable[..., typing.Any]
 
     return wrapper
 
+
+def _parser_id(parser: typing.Any) -> str:
+    """Get the ID of ``parser`` to label metrics."""
+    cid = getattr(parser, 'cid', None)
+    return cid() if cid is not None else type(parser).__name__
+
+
+def _nbytes(content: typing.Optional[typing.AnyStr] = None,
+            path: typing.Optional[str] = None) -> int:
+    """Get the size of ``content`` or the file at ``path`` in bytes."""
+    if content is not None:
+        if isinstance(content, bytes) or content.isascii():
+            return len(content)
+
+        return len(content.encode('utf-8'))
+
+    if path:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            pass
+
+    return 0
+
+
+def record_load(parser: typing.Any, started: float,
+                content: typing.Optional[typing.AnyStr] = None,
+                path: typing.Optional[str] = None) -> None:
+    """Update metrics of a load by ``parser`` started at ``started``.
+
+    :param parser: Parser object loaded data
+    :param started: The value of :func:`time.perf_counter` before the load
+    :param content: The str or bytes loaded from or None
+    :param path: Path to the file loaded from or None
+    """
+    if not metrics.is_enabled():
+        return
+
+    elapsed = time.perf_counter() - started
+    cid = _parser_id(parser)
+    metrics.update(((metrics.LOADS, cid, 1),
+                    (metrics.READ_BYTES, cid, _nbytes(content, path))),
+                   ((metrics.PARSE_SECONDS, cid, elapsed), ))
+
+
+def record_dump(parser: typing.Any,
+                content: typing.Optional[typing.AnyStr] = None,
+                path: typing.Optional[str] = None) -> None:
+    """Update metrics of a dump by ``parser``.
+
+    :param parser: Parser object dumped data
+    :param content: The str or bytes dumped or None
+    :param path: Path to the file dumped to or None
+    """
+    if not metrics.is_enabled():
+        return
+
+    cid = _parser_id(parser)
+    metrics.update(((metrics.DUMPS, cid, 1),
+                    (metrics.WRITTEN_BYTES, cid, _nbytes(content, path))))
+
 # vim:sw=4:ts=4:et:
@@ -16,6 +16,11 @@ r"""CBOR backend:
   - See also: https://github.com/agronholm/cbor2/blob/master/cbor2/
 
 Changelog:
+
+.. versionchanged:: 0.13.1
+
+   - enhancement: add support of loading concatenated data items one by one
+
 .. versionchanged:: 0.0.4
 
    - enhancement: add _cid to allow users to chose this than cbor explicitely
@@ -33,6 +38,27 @@ from .. import base
 from ..base import to_method
 
 
+def load_iter(stream, **options):
+    """Load CBOR data items concatenated in ``stream`` one by one.
+
+    :param stream: A file or file-like object of CBOR data items
+    :param options: Keyword options passed to cbor2.CBORDecoder
+    :return: A generator yields objects loaded
+    """
+    decoder = cbor2.CBORDecoder(stream, **options)
+    peek = getattr(stream, "peek", None)
+    if peek is not None:  # It can detect truncated data items.
+        while peek(1):
+            yield decoder.decode()
+        return
+
+    while True:
+        try:
+            yield decoder.decode()
+        except EOFError:  # cbor2.CBORDecodeEOF
+            return
+
+
 class Parser(base.StringStreamFnParser,
              base.BinaryFilesMixin):
     """Parser for CBOR files.
@@ -47,6 +73,7 @@ class Parser(base.StringStreamFnParser,
 
     _load_from_string_fn = to_method(cbor2.loads)
     _load_from_stream_fn = to_method(cbor2.load)
+    _load_iter_from_stream_fn = to_method(load_iter)
     _dump_to_string_fn = to_method(cbor2.dumps)
     _dump_to_stream_fn = to_method(cbor2.dump)
 
@@ -8,6 +8,10 @@ Changelog:
 
 .. versionadded:: 0.9.8
 """
+import json
+import re
+import typing
+
 from .. import base
 
 
@@ -19,13 +23,61 @@ JSON_DUMP_OPTS = ['skipkeys', 'ensure_ascii', 'check_circular', 'allow_nan',
 
 JSON_DICT_OPTS = ['object_pairs_hook', 'object_hook']
 
+_CHUNK_SIZE: int = 65536
+_WHITESPACES_RE = re.compile(r'[ \t\n\r]*')
+
+
+def load_iter(stream: typing.IO,
+              decoder_cls: typing.Type[json.JSONDecoder] = json.JSONDecoder,
+              chunk_size: int = _CHUNK_SIZE, **options
+              ) -> typing.Iterator[typing.Any]:
+    """Load JSON values from ``stream`` one by one.
+
+    It can load data from streams of concatenated or newline delimited JSON
+    (NDJSON, JSON Lines) values. The size of buffer to decode data is bounded
+    by the size of the largest JSON value in ``stream`` roughly.
+
+    :param stream: A file or file-like object of JSON values
+    :param decoder_cls: A class to decode JSON data, may be overriden by 'cls'
+    :param chunk_size: Minimum size of data to read from ``stream`` at once
+    :param options: Keyword options passed to ``decoder_cls``
+    :return: A generator yields JSON values
+    """
+    decoder = (options.pop('cls', None) or decoder_cls)(**options)
+    (buf, idx, eof) = ('', 0, False)
+
+    while True:
+        # The buffer is not copied until the next chunk is read.
+        idx = _WHITESPACES_RE.match(buf, idx).end()  # type: ignore
+        if idx < len(buf):
+            try:
+                (obj, end) = decoder.raw_decode(buf, idx)
+                # Numbers may continue in the data not read yet.
+                if end < len(buf) or eof or buf[end - 1] in '}]"':
+                    yield obj
+                    idx = end
+                    continue
+            except ValueError:
+                if eof:
+                    raise
+        elif eof:
+            return
+
+        # Read more data enough to avoid decoding large values many times.
+        (buf, idx) = (buf[idx:], 0)
+        chunk = stream.read(max(chunk_size, len(buf)))
+        if chunk:
+            buf += chunk
+        else:
+            eof = True
+
 
 class Parser(base.StringStreamFnParser):
     """Parser for JSON files."""
 
     _cid = 'std.json'
     _type = 'json'
-    _extensions = ['json', 'jsn', 'js']
+    _extensions = ['json', 'jsn', 'js', 'ndjson', 'jsonl']
     _ordered = True
     _allow_primitives = True
 
@@ -21,6 +21,11 @@
 
 Changelog:
 
+.. versionchanged:: 0.13.1
+
+   - Add support of loading JSON values one by one from streams of
+     concatenated or newline delimited JSON (NDJSON) values.
+
 .. versionchanged:: 0.9.8
 
    - Moved from ..json.py
@@ -35,7 +40,9 @@ Changelog:
 import json
 
 from .. import base
-from .common import Parser as BaseParser
+from .common import (
+    Parser as BaseParser, load_iter
+)
 
 
 class Parser(BaseParser):
@@ -46,6 +53,7 @@ class Parser(BaseParser):
 
     _load_from_string_fn = base.to_method(json.loads)
     _load_from_stream_fn = base.to_method(json.load)
+    _load_iter_from_stream_fn = base.to_method(load_iter)
     _dump_to_string_fn = base.to_method(json.dumps)
     _dump_to_stream_fn = base.to_method(json.dump)
 
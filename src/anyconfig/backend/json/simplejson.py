@@ -18,15 +18,22 @@
 
 Changelog:
 
+.. versionchanged:: 0.13.1
+
+   - Add support of loading JSON values one by one from streams of
+     concatenated or newline delimited JSON (NDJSON) values.
+
 .. versionchanged:: 0.9.8
 
    - Exported from ..json.py
 """
+import decimal
+
 import simplejson as json
 
 from .. import base
 from .common import (
-    JSON_LOAD_OPTS, JSON_DUMP_OPTS, Parser as BaseParser
+    JSON_LOAD_OPTS, JSON_DUMP_OPTS, Parser as BaseParser, load_iter
 )
 
 
@@ -37,6 +44,17 @@ JSON_DUMP_OPTS.extend(['use_decimal', 'namedtuple_as_object', 'tuple_as_array',
                        'iterable_as_array'])
 
 
+def _load_iter(stream, use_decimal=False, **options):
+    """Load JSON values from ``stream`` one by one.
+
+    .. seealso:: :func:`anyconfig.backend.json.common.load_iter`
+    """
+    if use_decimal:  # simplejson.JSONDecoder does not support it.
+        options['parse_float'] = decimal.Decimal
+
+    return load_iter(stream, decoder_cls=json.JSONDecoder, **options)
+
+
 class Parser(BaseParser):
     """Parser for JSON files using simplejson."""
 
@@ -46,6 +64,7 @@ class Parser(BaseParser):
 
     _load_from_string_fn = base.to_method(json.loads)
     _load_from_stream_fn = base.to_method(json.load)
+    _load_iter_from_stream_fn = base.to_method(_load_iter)
     _dump_to_string_fn = base.to_method(json.dumps)
     _dump_to_stream_fn = base.to_method(json.dump)
 
@@ -19,6 +19,10 @@ r"""MessagePack backend:
 
 Changelog:
 
+    .. versionchanged:: 0.13.1
+
+       - Add support of loading concatenated objects one by one.
+
     .. versionadded:: 0.0.11
 """
 from __future__ import absolute_import
@@ -50,6 +54,7 @@ class Parser(base.StringStreamFnParser,
 
     _load_from_string_fn = to_method(msgpack.unpackb)
     _load_from_stream_fn = to_method(msgpack.unpack)
+    _load_iter_from_stream_fn = to_method(msgpack.Unpacker)
     _dump_to_string_fn = to_method(msgpack.packb)
     _dump_to_stream_fn = to_method(msgpack.pack)
 
@@ -27,6 +27,11 @@
 
 Changelog:
 
+.. versionchanged:: 0.13.1
+
+   - Add support of loading YAML documents one by one from multi-document
+     streams.
+
 .. versionchanged:: 0.9.6
 
    - Add support of loading primitives other than mapping objects.
@@ -149,13 +154,11 @@ def yml_fnc_(fname, *args, **options):
     return fnc(*args, **common.filter_from_options('ac_safe', options))
 
 
-def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
-    """Call yaml.safe_load and yaml.load.
+def _yml_load_options(container, **options):
+    """Get the container and options to load YAML data.
 
-    :param stream: a file or file-like object to load YAML content
     :param container: callble to make a container object
-
-    :return: Mapping object
+    :return: A tuple of (container, options)
     """
     if options.get('ac_safe', False):
         # .. note:: yaml.safe_load does not support any keyword options.
@@ -168,14 +171,38 @@ def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
 
         options['Loader'] = _customized_loader(container)
 
-    ret = yml_fnc('load', stream,
-                  **common.filter_from_options('ac_dict', options))
+    return (container, common.filter_from_options('ac_dict', options))
+
+
+def yml_load(stream, container, yml_fnc=yml_fnc_, **options):
+    """Call yaml.safe_load and yaml.load.
+
+    :param stream: a file or file-like object to load YAML content
+    :param container: callble to make a container object
+
+    :return: Mapping object
+    """
+    (container, options) = _yml_load_options(container, **options)
+    ret = yml_fnc('load', stream, **options)
     if ret is None:
         return container()
 
     return ret
 
 
+def yml_load_all(stream, container, yml_fnc=yml_fnc_, **options):
+    """Call yaml.safe_load_all and yaml.load_all.
+
+    :param stream: a file or file-like object to load YAML documents
+    :param container: callble to make a container object
+
+    :return: A generator yields mapping objects
+    """
+    (container, options) = _yml_load_options(container, **options)
+    for ret in yml_fnc('load_all', stream, **options):
+        yield container() if ret is None else ret
+
+
 def yml_dump(data, stream, yml_fnc=yml_fnc_, **options):
     """Call yaml.safe_dump and yaml.dump.
 
@@ -213,6 +240,7 @@ class Parser(common.Parser):
     _extensions = ['yaml', 'yml']
 
     load_from_stream = base.to_method(yml_load)
+    load_iter_from_stream = base.to_method(yml_load_all)
     dump_to_stream = base.to_method(yml_dump)
 
 # vim:sw=4:ts=4:et:
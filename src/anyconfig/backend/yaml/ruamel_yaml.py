@@ -9,7 +9,8 @@
 - Development Status :: 4 - Beta
 - Limitations:
 
-  - Multi-documents YAML stream load and dump are not supported.
+  - Multi-documents YAML stream load and dump are not supported except for
+    loading them one by one with :func:`anyconfig.iter_load`.
 
 - Special options:
 
@@ -100,6 +101,12 @@ def yml_load(stream, container, **options):
     return ret
 
 
+def yml_load_all(stream, container, **options):
+    """See :func:`anyconfig.backend.yaml.pyyaml.yml_load_all`."""
+    for ret in yml_fnc('load_all', stream, **options):
+        yield container() if ret is None else ret
+
+
 def yml_dump(data, stream, **options):
     """See :func:`anyconfig.backend.yaml.pyyaml.yml_dump`."""
     # .. todo:: Needed?
@@ -121,6 +128,7 @@ class Parser(common.Parser):
     _extensions = ['yaml', 'yml']
 
     load_from_stream = base.to_method(yml_load)
+    load_iter_from_stream = base.to_method(yml_load_all)
     dump_to_stream = base.to_method(yml_dump)
 
 # vim:sw=4:ts=4:et:
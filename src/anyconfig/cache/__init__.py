@@ -0,0 +1,25 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Caches of data loaded from files.
+
+.. versionadded:: 0.13.1
+
+   - Added an in-process cache, :class:`Cache`, used from load APIs if
+     'ac_cache' keyword option was given.
+   - Added a persistent on-disk cache, :class:`DiskCache`, used from load APIs
+     if 'ac_cache_dir' keyword option was given.
+"""
+from .datatypes import CacheStats
+from .disk import DiskCache, get_disk_cache
+from .memory import Cache, get_cache
+
+
+__all__ = [
+    'CacheStats',
+    'DiskCache', 'get_disk_cache',
+    'Cache', 'get_cache',
+]
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,26 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=inherit-non-class,too-few-public-methods
+"""Common data types for anyconfig.cache."""
+import typing
+
+
+class CacheStats(typing.NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+
+# (inode, mtime in nsec, size) of the file to detect changes.
+FileSigT = typing.Tuple[int, int, int]
+
+# (path, parser cid, load options)
+CacheKeyT = typing.Tuple[str, str, typing.Tuple[typing.Any, ...]]
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,236 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Persistent on-disk cache of data loaded from files.
+
+Data loaded from files are stored in the cache dir as pickle files keyed on
+the hash of the content of the files, the parser and the options affect
+results of loading. It helps short-lived processes load large files in
+formats slow to parse, YAML and XML for example, repeatedly.
+
+Files in the cache dir are written atomically, so that processes can share
+the cache dir safely.
+
+.. warning::
+   Loading pickle files may execute arbitrary code. The cache dir must not be
+   writable by anyone untrusted.
+"""
+import hashlib
+import io
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+import typing
+import warnings
+
+from .. import ioinfo, metrics
+from ..common import InDataExT
+from .datatypes import CacheStats
+from .utils import (
+    file_signature, options_key, stable_options_key
+)
+
+if typing.TYPE_CHECKING:
+    from ..backend import base
+
+
+CACHE_FILE_EXT: str = '.pickle'
+
+# Bump this if the format of cache files was changed.
+CACHE_FORMAT_VERSION: str = '1'
+
+
+def _make_stream(psr: 'base.Parser', content: bytes) -> typing.IO:
+    """Make a stream to read ``content`` in the mode ``psr`` opens files."""
+    flags = getattr(psr, '_open_flags', None)
+    mode = flags[0] if flags else getattr(psr, '_open_read_mode', 'r')
+    strm = io.BytesIO(content)
+
+    # Decode it with the default encoding same as open() does in text mode.
+    return strm if 'b' in mode else io.TextIOWrapper(strm)
+
+
+class DiskCache:
+    """On-disk cache of data loaded from files.
+
+    :param cachedir: Path to the cache dir, created if it does not exist
+    """
+
+    def __init__(self, cachedir: typing.Union[str, pathlib.Path]) -> None:
+        """Initialize."""
+        self.cachedir = pathlib.Path(cachedir).expanduser().resolve()
+        self._lock = threading.Lock()
+        (self._hits, self._misses) = (0, 0)
+
+    def stats(self) -> CacheStats:
+        """Get the statistics of this cache.
+
+        .. note:: It scans the cache dir to get the number of entries.
+        """
+        paths = list(self.cachedir.glob(f'*/*{CACHE_FILE_EXT}'))
+        nbytes = sum(p.stat().st_size for p in paths)
+        with self._lock:
+            return CacheStats(self._hits, self._misses, 0, len(paths),
+                              nbytes)
+
+    def clear(self) -> None:
+        """Remove all of the cache files and reset the statistics."""
+        for path in self.cachedir.glob(f'*/*{CACHE_FILE_EXT}'):
+            try:
+                path.unlink()
+            except FileNotFoundError:  # Removed by others.
+                pass
+
+        with self._lock:
+            (self._hits, self._misses) = (0, 0)
+
+    def make_key(self, content: bytes, psr: 'base.Parser', **options
+                 ) -> typing.Optional[str]:
+        """Make a key of data loaded from ``content``.
+
+        :param content: The content of the file to load data from
+        :param psr: A parser object to load data
+        :param options: Keyword options passed to load data
+        :return: A key (hex digest) or None if it's not cacheable
+        """
+        okey = options_key(psr, **options)
+        sokey = None if okey is None else stable_options_key(okey)
+        if sokey is None:
+            return None
+
+        pcls = type(psr)
+        hobj = hashlib.sha256(content)
+        hobj.update(
+            f'\0{CACHE_FORMAT_VERSION}\0{pcls.__module__}.{pcls.__qualname__}'
+            f'\0{psr.cid()}\0{sokey}'.encode('utf-8')
+        )
+        return hobj.hexdigest()
+
+    def path(self, key: str) -> pathlib.Path:
+        """Get the path of the cache file of ``key``."""
+        return self.cachedir / key[:2] / f'{key}{CACHE_FILE_EXT}'
+
+    def get(self, key: str) -> typing.Tuple[bool, InDataExT]:
+        """Get the data of ``key`` from the cache.
+
+        :param key: A cache key
+        :return: A tuple of (True if found, data or None)
+        """
+        path = self.path(key)
+        try:
+            with path.open('rb') as inp:
+                data = pickle.load(inp)
+        except FileNotFoundError:
+            found = False
+        except Exception as exc:  # pylint: disable=broad-except
+            warnings.warn(f'Broken cache file was found: {path!s}, '
+                          f'exc={exc!r}')
+            found = False
+        else:
+            found = True
+
+        with self._lock:
+            if found:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        metrics.inc(metrics.CACHE_HITS if found else metrics.CACHE_MISSES,
+                    metrics.CACHE_DISK)
+        return (found, data if found else None)
+
+    def put(self, key: str, data: InDataExT) -> None:
+        """Put the data of ``key`` into the cache atomically.
+
+        Errors on write are warned and ignored.
+
+        :param key: A cache key
+        :param data: Data loaded
+        """
+        path = self.path(key)
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp',
+                                             delete=False) as out:
+                tmp = out.name
+                pickle.dump(data, out, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp, path)
+            tmp = None
+        except Exception as exc:  # pylint: disable=broad-except
+            warnings.warn(f'Failed to write a cache file: {path!s}, '
+                          f'exc={exc!r}')
+        finally:
+            if tmp is not None:
+                os.unlink(tmp)
+
+    def load(self, psr: 'base.Parser', ioi: ioinfo.IOInfo,
+             **options) -> InDataExT:
+        """Load data from ``ioi`` with ``psr`` through this cache.
+
+        Data from streams and with options which cannot be represented in
+        the key are not cached and loaded with ``psr`` every time.
+
+        :param psr: A parser object to load data
+        :param ioi: An 'anyconfig.ioinfo.IOInfo' object to load data from
+        :param options: Keyword options passed to ``psr.load``
+        :return: Data loaded
+        """
+        if file_signature(ioi) is None:
+            return psr.load(ioi, **options)
+
+        try:
+            content = pathlib.Path(ioi.path).read_bytes()
+        except OSError:
+            return psr.load(ioi, **options)
+
+        key = self.make_key(content, psr, **options)
+        if key is None:
+            return psr.load(ioi, **options)
+
+        (found, data) = self.get(key)
+        if found:
+            return data
+
+        # Load data from 'content' read already not to read the file again.
+        with _make_stream(psr, content) as strm:
+            data = psr.load(ioinfo.make(strm), **options)
+
+        self.put(key, data)
+        return data
+
+
+_CACHES: typing.Dict[pathlib.Path, DiskCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+MaybeDiskCacheT = typing.Optional[
+    typing.Union[str, pathlib.Path, DiskCache]
+]
+
+
+def get_disk_cache(ac_cache_dir: MaybeDiskCacheT = None
+                   ) -> typing.Optional[DiskCache]:
+    """Get the cache object from the value of 'ac_cache_dir' option.
+
+    :param ac_cache_dir: Path to the cache dir or a :class:`DiskCache` object
+    :return: A :class:`DiskCache` object or None if caching is not enabled
+    """
+    if ac_cache_dir is None or not ac_cache_dir:
+        return None
+
+    if isinstance(ac_cache_dir, DiskCache):
+        return ac_cache_dir
+
+    cachedir = pathlib.Path(ac_cache_dir).expanduser().resolve()
+    with _CACHES_LOCK:
+        cache = _CACHES.get(cachedir)
+        if cache is None:
+            cache = _CACHES[cachedir] = DiskCache(cachedir)
+
+    return cache
+
+# vim:sw=4:ts=4:et:
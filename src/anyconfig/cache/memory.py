@@ -0,0 +1,226 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""In-process cache of data loaded from files.
+
+Entries are keyed on the resolved path of the file, the ID of the parser and
+the options affect results of loading, and validated with the file's inode,
+mtime (in nsec) and size on lookup, so that changes of files are detected.
+
+Data are stored as pickled bytes if possible and unpickled on hits as it's
+faster than copying data. Its size is limited by the number of entries and the
+total size of the pickled data, or the size of files loaded if not pickled.
+The least recently used entries will be evicted if it exceeds these.
+"""
+import collections
+import pickle
+import threading
+import typing
+
+from .. import ioinfo, metrics
+from ..common import InDataExT
+from .datatypes import (
+    CacheKeyT, CacheStats, FileSigT
+)
+from .utils import (
+    copy_data, file_signature, options_key
+)
+
+if typing.TYPE_CHECKING:
+    from ..backend import base
+
+
+LoadFnT = typing.Callable[..., InDataExT]
+
+MAX_ENTRIES: int = 128
+MAX_BYTES: int = 64 * 1024 * 1024  # 64 MiB
+
+
+class _Entry(typing.NamedTuple):
+    """Cache entry.
+
+    :param sig: The signature of the file data was loaded from
+    :param data: Data loaded, or pickled bytes of it if ``pickled``
+    :param nbytes: The size of the entry in bytes
+    :param pickled: True if ``data`` is pickled
+    """
+
+    sig: FileSigT
+    data: typing.Union[InDataExT, bytes]
+    nbytes: int
+    pickled: bool = False
+
+
+def _make_entry(sig: FileSigT, data: InDataExT, copy: bool) -> _Entry:
+    """Make a cache entry of ``data`` pickled or copied if ``copy``."""
+    if copy:
+        try:
+            pdata = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            return _Entry(sig, pdata, len(pdata), True)
+        except Exception:  # pylint: disable=broad-except
+            data = copy_data(data)
+
+    return _Entry(sig, data, sig[2])
+
+
+def _get_data(ent: _Entry, copy: bool) -> InDataExT:
+    """Get data from a cache entry ``ent``."""
+    if ent.pickled:
+        return pickle.loads(typing.cast(bytes, ent.data))
+
+    data = typing.cast(InDataExT, ent.data)
+    return copy_data(data) if copy else data
+
+
+class Cache:
+    """LRU cache of data loaded from files.
+
+    :param max_entries: The maximum number of entries
+    :param max_bytes:
+        The maximum total size in bytes of data in the cache, the size of
+        pickled data or files data were loaded from. Data larger than this are
+        not cached.
+    :param copy:
+        Return a copy of the data in the cache if True (default). Otherwise
+        the data itself is returned and callers must not modify it.
+        :func:`anyconfig.api.multi_load` copies such data before merging.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES,
+                 max_bytes: int = MAX_BYTES, copy: bool = True) -> None:
+        """Initialize."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.copy = copy
+
+        self._entries: 'collections.OrderedDict[CacheKeyT, _Entry]' = \
+            collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        (self._hits, self._misses, self._evictions) = (0, 0, 0)
+
+    def __len__(self) -> int:
+        """Get the number of entries."""
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        """Get the statistics of this cache."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions,
+                              len(self._entries), self._nbytes)
+
+    def clear(self) -> None:
+        """Remove all of the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            (self._hits, self._misses, self._evictions) = (0, 0, 0)
+
+    def _pop(self, key: CacheKeyT) -> None:
+        """Remove an entry of ``key`` if exists. The lock must be held."""
+        ent = self._entries.pop(key, None)
+        if ent is not None:
+            self._nbytes -= ent.nbytes
+
+    def get(self, key: CacheKeyT, sig: FileSigT
+            ) -> typing.Tuple[bool, InDataExT]:
+        """Get the data of ``key`` from the cache.
+
+        :param key: A cache key
+        :param sig: The signature of the file to validate the entry
+        :return: A tuple of (True if found, data or None)
+        """
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is None or ent.sig != sig:
+                self._misses += 1
+                metrics.inc(metrics.CACHE_MISSES, metrics.CACHE_MEMORY)
+                return (False, None)
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+        metrics.inc(metrics.CACHE_HITS, metrics.CACHE_MEMORY)
+
+        return (True, _get_data(ent, self.copy))
+
+    def put(self, key: CacheKeyT, sig: FileSigT, data: InDataExT) -> None:
+        """Put the data of ``key`` into the cache.
+
+        :param key: A cache key
+        :param sig: The signature of the file ``data`` was loaded from
+        :param data: Data loaded
+        """
+        if self.max_entries < 1:
+            return
+
+        ent = _make_entry(sig, data, self.copy)
+        if ent.nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = ent
+            self._nbytes += ent.nbytes
+
+            while (len(self._entries) > self.max_entries
+                   or self._nbytes > self.max_bytes):
+                (_key, old) = self._entries.popitem(last=False)
+                self._nbytes -= old.nbytes
+                self._evictions += 1
+
+    def load(self, psr: 'base.Parser', ioi: ioinfo.IOInfo,
+             load_fn: typing.Optional[LoadFnT] = None,
+             **options) -> InDataExT:
+        """Load data from ``ioi`` with ``psr`` through this cache.
+
+        Data from streams and with options of unhashable values are not
+        cached and loaded with ``psr`` every time.
+
+        :param psr: A parser object to load data
+        :param ioi: An 'anyconfig.ioinfo.IOInfo' object to load data from
+        :param load_fn:
+            A callable to load data from ``ioi`` with ``options`` on cache
+            misses instead of ``psr.load``, e.g. the method of another cache
+        :param options: Keyword options passed to ``psr.load``
+        :return: Data loaded
+        """
+        if load_fn is None:
+            load_fn = psr.load
+
+        sig = file_signature(ioi)
+        okey = options_key(psr, **options)
+        if sig is None or okey is None:
+            return load_fn(ioi, **options)
+
+        key: CacheKeyT = (ioi.path, psr.cid(), okey)
+        (found, data) = self.get(key, sig)
+        if found:
+            return data
+
+        data = load_fn(ioi, **options)
+        self.put(key, sig, data)
+        return data
+
+
+_DEFAULT_CACHE = Cache()
+
+MaybeCacheT = typing.Optional[typing.Union[bool, Cache]]
+
+
+def get_cache(ac_cache: MaybeCacheT = None) -> typing.Optional[Cache]:
+    """Get the cache object from the value of 'ac_cache' option.
+
+    :param ac_cache: True to use the default one or a :class:`Cache` object
+    :return: A :class:`Cache` object or None if caching is not enabled
+    """
+    if isinstance(ac_cache, Cache):
+        return ac_cache
+
+    if ac_cache:
+        return _DEFAULT_CACHE
+
+    return None
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,117 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Utility functions for anyconfig.cache."""
+import copy
+import os
+import typing
+
+from .. import ioinfo
+from ..utils import filter_options
+from .datatypes import FileSigT
+
+if typing.TYPE_CHECKING:
+    from ..backend import base
+
+
+# Options affect results of loading in addition to backend specific ones.
+COMMON_LOAD_OPTS: typing.Tuple[str, ...] = ('ac_dict', 'ac_ordered')
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def file_signature(ioi: ioinfo.IOInfo) -> typing.Optional[FileSigT]:
+    """Get the signature of the file ``ioi`` refers to detect its changes.
+
+    :param ioi: An 'anyconfig.ioinfo.IOInfo' object
+    :return: A tuple of (inode, mtime in nsec, size) or None if it's not a
+        file, e.g. a stream, or it does not exist
+    """
+    if ioinfo.is_stream(ioi) or not ioi.path:
+        return None
+
+    try:
+        stat = os.stat(ioi.path)
+    except OSError:
+        return None
+
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def options_key(psr: 'base.Parser', **options
+                ) -> typing.Optional[typing.Tuple[typing.Any, ...]]:
+    """Make a hashable key from the options affect results of loading.
+
+    :param psr: A parser object to load data
+    :param options: Keyword options passed to load data
+    :return: A tuple of (key, value) pairs sorted by keys or None if some of
+        the values are not hashable
+    """
+    keys = [*COMMON_LOAD_OPTS, *psr.dict_options(),
+            *getattr(psr, '_load_opts', [])]
+    res = tuple(sorted(filter_options(keys, options).items()))
+    try:
+        hash(res)
+    except TypeError:
+        return None
+
+    return res
+
+
+def _stable_repr(val: typing.Any) -> typing.Optional[str]:
+    """Get a str represents ``val`` does not vary between processes.
+
+    :return: A str or None if it's not possible, e.g. lambda functions
+    """
+    if isinstance(val, (tuple, list)):
+        items = [_stable_repr(x) for x in val]
+        if any(x is None for x in items):
+            return None
+        return '(' + ', '.join(typing.cast(typing.List[str], items)) + ')'
+
+    if isinstance(val, _IMMUTABLE_TYPES):
+        return repr(val)
+
+    name = getattr(val, '__qualname__', None)
+    if callable(val) and name and '<' not in name:
+        return f'{val.__module__}.{name}'
+
+    return None
+
+
+def stable_options_key(okey: typing.Tuple[typing.Any, ...]
+                       ) -> typing.Optional[str]:
+    """Get a str represents ``okey`` does not vary between processes.
+
+    :param okey: A key made by :func:`options_key`
+    :return: A str or None if it's not possible
+    """
+    return _stable_repr(okey)
+
+
+def copy_data(obj: typing.Any) -> typing.Any:
+    """Copy mapping and list objects loaded from files recursively.
+
+    Containers are copied with their types kept and primitive objects are
+    shared as these are immutable. It's faster than :func:`copy.deepcopy`.
+
+    :param obj: An object loaded from some file
+    :return: A copy of ``obj``
+    """
+    if isinstance(obj, _IMMUTABLE_TYPES):
+        return obj
+
+    if isinstance(obj, dict):
+        res = copy.copy(obj)  # Keep the type and attributes of 'obj'.
+        for key, val in obj.items():
+            if not isinstance(val, _IMMUTABLE_TYPES):
+                res[key] = copy_data(val)
+        return res
+
+    if type(obj) is list:  # pylint: disable=unidiomatic-typecheck
+        return [copy_data(x) for x in obj]
+
+    return copy.deepcopy(obj)
+
+# vim:sw=4:ts=4:et:
@@ -50,6 +50,7 @@ GET_HELP = ("Specify key path to get part of config, for example, "
             "This option is not used with --query option at the same time. ")
 SET_HELP = ("Specify key path to set (update) part of config, for "
             "example, '--set a.b.c=1' to a config {'a': {'b': {'c': 0, "
-            "'d': 1}}} gives {'a': {'b': {'c': 1, 'd': 1}}}.")
+            "'d': 1}}} gives {'a': {'b': {'c': 1, 'd': 1}}}. It can be "
+            "given multiple times.")
 
 # vim:sw=4:ts=4:et:
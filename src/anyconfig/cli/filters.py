@@ -29,8 +29,8 @@ def do_filter(cnf: typing.Dict[str, typing.Any], args: 'argparse.Namespace'):
         return cnf
 
     if args.set:
-        (key, val) = args.set.split('=')
-        api.set_(cnf, key, parser.parse(val))
+        items = (item.split('=', 1) for item in args.set)
+        api.set_many(cnf, [(key, parser.parse(val)) for key, val in items])
 
     return cnf
 
@@ -75,7 +75,7 @@ def make_parser(defaults: typing.Optional[typing.Dict] = None,
     gspog = apsr.add_argument_group('Query/Get/set options')
     gspog.add_argument('-Q', '--query', help=constants.QUERY_HELP)
     gspog.add_argument('--get', help=constants.GET_HELP)
-    gspog.add_argument('--set', help=constants.SET_HELP)
+    gspog.add_argument('--set', action='append', help=constants.SET_HELP)
 
     cpog = apsr.add_argument_group('Common options')
     cpog.add_argument('-x', '--ignore-missing', action='store_true',
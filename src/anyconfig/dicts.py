@@ -7,12 +7,20 @@
 #
 r"""Utility functions to operate on mapping objects such as get, set and merge.
 
+.. versionadded:: 0.13.1
+   added :class:`LayeredDict` to merge mapping objects lazily, and
+   :class:`FrozenDict`, :func:`freeze` and :func:`thaw` to make immutable
+   snapshots share subtrees among them, :func:`compile_path` and
+   :func:`get_many` to get values at paths may have wildcards quickly, and
+   :func:`set_many` to set values at many paths at once
+
 .. versionadded: 0.8.3
    define _update_* and merge functions based on classes in
    :mod:`m9dicts.dicts`
 
 """
 import collections
+import collections.abc
 import functools
 import operator
 import re
@@ -37,6 +45,9 @@ _JSNP_GET_ARRAY_IDX_REG: typing.Pattern = re.compile(r'(?:0|[1-9][0-9]*)')
 
 DictT = typing.Dict[str, typing.Any]
 
+PairsT = typing.Iterable[typing.Tuple[str, typing.Any]]
+UpdatesT = typing.Union[PairsT, DictT]
+
 
 def _jsnp_unescape(jsn_s: str) -> str:
     """Parse and decode given encoded JSON Pointer expression.
@@ -110,15 +121,387 @@ def get(dic: DictT, path: str, seps: typing.Tuple[str, ...] = PATH_SEPS,
         return (None, str(exc))
 
 
+# Wildcard and ranges of indices in path expressions of compiled paths.
+PATH_WILDCARD: str = '*'
+_PATH_RANGE_REG: typing.Pattern = re.compile(
+    r'^(-?[0-9]*):(-?[0-9]*)(?::(-?[0-9]*))?$'
+)
+
+
+class _Step(typing.NamedTuple):
+    """A step of compiled paths to select values.
+
+    :param key: Key of mapping objects
+    :param idx: Index of lists if ``key`` is an index or None
+    :param range_: Range of indices of lists if ``key`` is a range or None
+    :param wildcard: True if ``key`` is the wildcard
+    """
+
+    key: str
+    idx: typing.Optional[int]
+    range_: typing.Optional[typing.Tuple[typing.Optional[int], ...]]
+    wildcard: bool
+
+    @property
+    def multi(self) -> bool:
+        """Test if this step may select multiple values."""
+        return self.wildcard or self.range_ is not None
+
+
+def _path_keys(path: str, seps: typing.Tuple[str, ...] = PATH_SEPS
+               ) -> typing.Tuple[str, ...]:
+    """Parse a path expression and return a tuple of keys unescaped."""
+    if '~' not in path:  # Nothing to unescape.
+        return tuple(_split_path(path, seps))
+
+    return tuple(_jsnp_unescape(key) for key in _split_path(path, seps))
+
+
+def _make_step(key: str) -> _Step:
+    """Make a step from a path item ``key``."""
+    idx = None
+    if key[:1].isdigit() and _JSNP_GET_ARRAY_IDX_REG.fullmatch(key.strip()):
+        idx = int(key)
+
+    range_ = None
+    match = _PATH_RANGE_REG.match(key) if ':' in key else None
+    if match:
+        range_ = tuple(int(x) if x else None for x in match.groups())
+
+    return _Step(key, idx, range_, key == PATH_WILDCARD)
+
+
+def _select(obj: typing.Any, step: _Step) -> typing.Any:
+    """Select a value from ``obj`` by ``step`` of a single value.
+
+    :raises: TypeError, KeyError, IndexError
+    """
+    if step.idx is not None and _is_list_like(obj):
+        return obj[step.idx]
+
+    return obj[step.key]
+
+
+def _select_all(obj: typing.Any, step: _Step) -> typing.List[typing.Any]:
+    """Select all of values match with ``step`` from ``obj``."""
+    if step.wildcard:
+        if _is_dict_like(obj):
+            return list(obj.values())
+        return list(obj) if _is_list_like(obj) else []
+
+    if step.range_ is not None and _is_list_like(obj):
+        return list(obj[slice(*step.range_)])
+
+    try:
+        return [_select(obj, step)]
+    except (TypeError, KeyError, IndexError):
+        return []
+
+
+class CompiledPath:
+    """Accessor compiled from a path expression to get values quickly.
+
+    .. versionadded:: 0.13.1
+
+    Path expressions are same as :func:`get`'s except that items of lists can
+    be selected at any steps and the followings are wildcards:
+
+    - '*' matches all of values of mapping objects and items of lists
+    - Ranges of indices such as '1:3', ':2' and '::2' match items of lists
+      in the ranges same as slices. These are keys of mapping objects.
+
+    Paths have wildcards get lists of all of values matched and values do not
+    match are skipped, e.g. 'servers/*/port' gets ports of all of servers
+    have ports.
+
+    Values are set at paths by :meth:`set_` walking and making nested dicts
+    in place. Steps are keys of mapping objects always on set, and paths
+    have the wildcard '*' cannot be used to set values.
+
+    Objects of this class are made and cached by :func:`compile_path`.
+
+    :param path: Path expression
+    :param seps: Separator char candidates
+    """
+
+    __slots__ = ('path', 'steps', 'keys', 'multi', 'wildcard')
+
+    def __init__(self, path: str, seps: typing.Tuple[str, ...] = PATH_SEPS
+                 ) -> None:
+        """Initialize."""
+        self.path = path
+        self.keys = _path_keys(path, seps)
+        self.steps: typing.Tuple[_Step, ...] = tuple(
+            _make_step(key) for key in self.keys
+        )
+        self.multi = any(step.multi for step in self.steps)
+        self.wildcard = PATH_WILDCARD in self.keys
+
+    def __repr__(self) -> str:
+        """Get a string represents this object."""
+        return f'<{type(self).__name__} path={self.path!r}>'
+
+    def get(self, dic: DictT) -> typing.Tuple[typing.Any, str]:
+        """Get the value at the path from ``dic``.
+
+        :param dic: a dict[-like] object
+        :return:
+            A tuple of (result_object, error_message) same as :func:`get`, or
+            (a list of values matched, '') if the path has wildcards
+        """
+        if self.multi:
+            objs = [dic]
+            for step in self.steps:
+                objs = [res for obj in objs for res in _select_all(obj, step)]
+            return (objs, '')
+
+        obj: typing.Any = dic
+        try:
+            for step in self.steps:
+                obj = (obj[step.key] if type(obj) is dict
+                       else _select(obj, step))
+        except (TypeError, KeyError, IndexError) as exc:
+            return (None, str(exc))
+
+        return (obj, '')
+
+    def set_(self, dic: DictT, val: typing.Any
+             ) -> typing.Optional['FrozenDict']:
+        """Set ``val`` at the path in ``dic``.
+
+        Mapping values are merged into mapping objects at the path, and
+        other values replace values at the path. Mapping objects are made at
+        steps of the path if these are missing or not mapping objects.
+
+        :param dic: a dict[-like] object or a :class:`FrozenDict` object
+        :param val: Value to set
+        :return:
+            A new :class:`FrozenDict` object if ``dic`` is a snapshot, or None
+            but ``dic`` will be updated
+        :raises: ValueError if the path has the wildcard
+        """
+        if self.wildcard:
+            raise ValueError(f'Values cannot be set at {self.path!r}')
+
+        if isinstance(dic, FrozenDict):
+            return _set_frozen(dic, self.keys, val) if self.keys else dic
+
+        if self.keys:
+            _set_path([dic], self.keys, val)
+
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(path: str, seps: typing.Tuple[str, ...] = PATH_SEPS
+                 ) -> CompiledPath:
+    """Compile a path expression to get values quickly and cache it.
+
+    .. versionadded:: 0.13.1
+
+    :param path: Path expression may have wildcards, see
+        :class:`CompiledPath`
+    :param seps: Separator char candidates
+    :return: A :class:`CompiledPath` object
+    """
+    return CompiledPath(path, seps)
+
+
+class _PathNode:
+    """A node of the trie of compiled paths shares their prefixes.
+
+    :param step: The step to select values of this node from the parent's
+    """
+
+    __slots__ = ('step', 'multi', 'children', 'ends')
+
+    def __init__(self, step: _Step = _Step('', None, None, False)) -> None:
+        """Initialize."""
+        self.step = step
+        self.multi = step.multi
+        self.children: typing.Dict[str, _PathNode] = {}
+        self.ends: typing.List[int] = []  # Indices of paths end here.
+
+
+@functools.lru_cache(maxsize=64)
+def _make_path_trie(paths: typing.Tuple[str, ...],
+                    seps: typing.Tuple[str, ...]) -> _PathNode:
+    """Make the trie of ``paths`` shares their common prefixes."""
+    root = _PathNode()
+    for idx, path in enumerate(paths):
+        node = root
+        for step in compile_path(path, seps).steps:
+            child = node.children.get(step.key)
+            if child is None:
+                child = node.children[step.key] = _PathNode(step)
+            node = child
+        node.ends.append(idx)
+
+    return root
+
+
+def get_many(dic: DictT, paths: typing.Iterable[str],
+             seps: typing.Tuple[str, ...] = PATH_SEPS
+             ) -> typing.List[typing.Tuple[typing.Any, str]]:
+    """Get values at multiple paths from nested dicts.
+
+    .. versionadded:: 0.13.1
+
+    Values at common prefixes of ``paths`` are looked up only once, e.g.
+    'a/b' is looked up once to get values at 'a/b/c' and 'a/b/d'.
+
+    :param dic: a dict[-like] object
+    :param paths: Path expressions may have wildcards, see
+        :class:`CompiledPath`
+    :param seps: Separator char candidates
+    :return:
+        A list of tuples of (result_object, error_message) same as
+        :meth:`CompiledPath.get` gives in the order of ``paths``
+    """
+    paths = tuple(paths)
+    root = _make_path_trie(paths, seps)
+    # Results of paths end at the root, e.g. '', are ``dic`` itself.
+    res: typing.List[typing.Tuple[typing.Any, str]] = [(dic, '')] * len(paths)
+
+    # Nodes, the value or the list of values selected by wildcards, if it's
+    # the latter, and the error on the selection.
+    # (node, the object or the list of objects selected, multi, error)
+    stack: typing.List[typing.Tuple[_PathNode, typing.Any, bool, str]] = [
+        (root, dic, False, '')
+    ]
+    while stack:
+        (node, obj, multi, err) = stack.pop()
+        for child in node.children.values():
+            step = child.step
+            (cobj, cmulti, cerr) = (None, multi, err)
+            if multi or child.multi:
+                objs = obj if multi else ([] if err else [obj])
+                cobj = [sub for val in objs for sub in _select_all(val, step)]
+                (cmulti, cerr) = (True, '')
+            elif not err:
+                try:
+                    cobj = (obj[step.key] if type(obj) is dict
+                            else _select(obj, step))
+                except (TypeError, KeyError, IndexError) as exc:
+                    cerr = str(exc)
+
+            ent = (None, cerr) if cerr else (cobj, '')
+            for idx in child.ends:
+                res[idx] = ent
+
+            if child.children:
+                stack.append((child, cobj, cmulti, cerr))
+
+    return res
+
+
+def _set_path(chain: typing.List[typing.Any], keys: typing.Tuple[str, ...],
+              val: typing.Any) -> None:
+    """Set ``val`` at ``keys`` walking from the last item of ``chain``.
+
+    :param chain:
+        Mapping objects at prefixes of ``keys`` walked already, that is,
+        chain[i] is the mapping object at keys[:i]. Mapping objects walked
+        or made are appended to it.
+    :param keys: Keys of nested mapping objects to set ``val`` at
+    :param val: Value to set
+    """
+    target = chain[-1]
+    for key in keys[len(chain) - 1:-1]:
+        child = target.get(key)
+        if not _is_dict_like(child):
+            child = target[key] = {}
+
+        chain.append(child)
+        target = child
+
+    key = keys[-1]
+    if _is_dict_like(val) and _is_dict_like(target.get(key)):
+        res = merge(target[key], val, ac_merge=MS_DICTS)
+        if res is not None:  # It was a snapshot.
+            target[key] = res
+    else:
+        target[key] = val
+
+
+def set_many(dic: DictT, items: UpdatesT,
+             seps: typing.Tuple[str, ...] = PATH_SEPS
+             ) -> typing.Optional['FrozenDict']:
+    """Set values at multiple paths in nested dicts at once.
+
+    .. versionadded:: 0.13.1
+
+    Values are set in the order of ``items`` same as :meth:`CompiledPath.set_`
+    does, and mapping objects at common prefixes of consecutive paths are
+    walked only once, so that it costs proportional to the total length of
+    paths. Nodes of snapshots in paths are copied only once also, e.g.:
+
+    .. code-block:: python
+
+       set_many(cnf, [('a.b.c', 1), ('a.b.d', 2), ('a.e', 3)])
+
+    .. note::
+
+       Unlike :func:`set_`, values replace mapping objects at paths instead
+       of errors, and ~0 and ~1 in paths are unescaped same as :func:`get`.
+
+    :param dic: a dict[-like] object or a :class:`FrozenDict` object
+    :param items:
+        A mapping object of paths and values or an iterable yields tuples of
+        (path, value)
+    :param seps: Separator char candidates
+    :return:
+        A new :class:`FrozenDict` object if ``dic`` is a snapshot, or None
+        but ``dic`` will be updated
+    :raises: ValueError if some paths have the wildcard
+    """
+    pairs: typing.Iterable[typing.Tuple[str, typing.Any]] = (
+        items.items() if utils.is_dict_like(items) else items  # type: ignore
+    )
+
+    if isinstance(dic, FrozenDict):
+        return _set_many_frozen(dic, pairs, seps)
+
+    chain: typing.List[typing.Any] = [dic]
+    prev: typing.Tuple[str, ...] = ()
+    for path, val in pairs:
+        keys = _path_keys(path, seps)
+        if not keys:
+            continue
+        if PATH_WILDCARD in keys:
+            raise ValueError(f'Values cannot be set at {path!r}')
+
+        # Mapping objects at common prefixes with the previous path can be
+        # reused except for the value at the previous path itself.
+        depth = 0
+        limit = min(len(prev), len(keys)) - 1
+        while depth < limit and keys[depth] == prev[depth]:
+            depth += 1
+
+        del chain[depth + 1:]
+        _set_path(chain, keys, val)
+        prev = keys
+
+    return None
+
+
 def set_(dic: DictT, path: str, val: typing.Any,
-         seps: typing.Tuple[str, ...] = PATH_SEPS) -> None:
+         seps: typing.Tuple[str, ...] = PATH_SEPS
+         ) -> typing.Optional['FrozenDict']:
     """Setter for nested dicts.
 
+    .. versionchanged:: 0.13.1
+
+       Return a new snapshot if ``dic`` is a :class:`FrozenDict` object.
+
     :param dic: a dict[-like] object support recursive merge operations
     :param path: Path expression to point object wanted
     :param seps: Separator char candidates
+    :return:
+        A new :class:`FrozenDict` object if ``dic`` is a snapshot, or None
+        but ``dic`` will be updated
     """
-    merge(dic, mk_nested_dic(path, val, seps), ac_merge=MS_DICTS)
+    return merge(dic, mk_nested_dic(path, val, seps), ac_merge=MS_DICTS)
 
 
 def _are_list_like(*objs: typing.Any) -> bool:
@@ -165,6 +548,51 @@ def _update_wo_replace(self: DictT, other: DictT, key: str,
         self[key] = other.get(key, val)
 
 
+# Types of values never be dict-like to skip checks of ABCs quickly.
+_NOT_DICT_TYPES: typing.FrozenSet[type] = frozenset(
+    (str, int, float, bool, type(None), list, tuple)
+)
+
+# Lists smaller than this are merged without making sets.
+_SMALL_LIST_MERGE: int = 64
+
+
+def _new_items(lst0: typing.Any, lst: typing.Iterable[typing.Any]
+               ) -> typing.List[typing.Any]:
+    """Find items in ``lst`` not in ``lst0`` in linear time if possible.
+
+    Items are looked up in a set made from hashable items in ``lst0`` and
+    the list of other items in it, so that the result is the same as
+    ``[x for x in lst if x not in lst0]``.
+    """
+    items = lst if isinstance(lst, (list, tuple)) else list(lst)
+    if len(items) * len(lst0) <= _SMALL_LIST_MERGE:
+        return [x for x in items if x not in lst0]
+
+    hashables: typing.Set[typing.Any] = set()
+    others: typing.List[typing.Any] = []
+    for item in lst0:
+        try:
+            hashables.add(item)
+        except TypeError:
+            others.append(item)
+
+    if not hashables:  # Items cannot be looked up in a set at all.
+        return [x for x in items if x not in others]
+
+    res = []
+    for item in items:
+        try:
+            found = item in hashables or (bool(others) and item in others)
+        except TypeError:  # It's not hashable.
+            found = item in lst0
+
+        if not found:
+            res.append(item)
+
+    return res
+
+
 def _merge_list(self: DictT, key: str,
                 lst: typing.Iterable[typing.Any]) -> None:
     """Update a dict ``self`` using an iterable ``lst``.
@@ -172,21 +600,110 @@ def _merge_list(self: DictT, key: str,
     :param key: self[key] will be updated
     :param lst: Other list to merge
     """
-    self[key] += [x for x in lst if x not in self[key]]
+    self[key] += _new_items(self[key], lst)
 
 
-def _merge_other(self: DictT, key: str, val: typing.Any) -> None:
-    """Update an item in a dict ``self`` using a pair of key and value.
+def _is_dict_like(obj: typing.Any) -> bool:
+    """Test if ``obj`` is dict-like quickly with fast paths of exact types."""
+    otype = type(obj)
+    return otype is dict or (otype not in _NOT_DICT_TYPES
+                             and utils.is_dict_like(obj))
 
-    :param key: self[key] will be updated
-    :param val: Other val to merge (update/replace)
+
+def _is_list_like(obj: typing.Any) -> bool:
+    """Test if ``obj`` is list-like quickly with the fast path of lists."""
+    return type(obj) is list or utils.is_list_like(obj)
+
+
+def _iter_pairs(pairs: PairsT
+                ) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """Iterate pairs of keys and values over ``pairs`` only once.
+
+    None values are replaced with the last values of same keys.
     """
-    self[key] = val  # Just overwrite it by default implementation.
+    lpairs = list(pairs)
+    dpairs: typing.Optional[DictT] = None
+    for key, val in lpairs:
+        if val is None:
+            if dpairs is None:
+                dpairs = dict(lpairs)
+            val = dpairs[key]
+
+        yield (key, val)
+
+
+# A mapping object to merge items into, an iterator yields the items as
+# pairs and the original object of pairs or None if it's a dict.
+_FrameT = typing.Tuple[DictT, typing.Iterator[typing.Tuple[str, typing.Any]],
+                       typing.Any]
+
+
+def _as_mapping(other: UpdatesT
+                ) -> typing.Optional[typing.Mapping[str, typing.Any]]:
+    """Get ``other`` as a mapping object or None if it's pairs."""
+    if _is_dict_like(other):
+        return typing.cast(typing.Mapping[str, typing.Any], other)
+
+    return None
+
+
+def _iter_items(other: UpdatesT
+                ) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    """Iterate pairs of keys and values over ``other`` to merge."""
+    mother = _as_mapping(other)
+    if mother is None:
+        return _iter_pairs(typing.cast(PairsT, other))
+
+    return iter(mother.items())
+
+
+def _make_frame(self: DictT, other: UpdatesT) -> _FrameT:
+    """Make a frame to merge ``other`` into ``self``."""
+    return (self, _iter_items(other),
+            None if _is_dict_like(other) else other)
+
+
+def _merge_frames(frame: _FrameT, merge_lists: bool = False) -> None:
+    """Merge items into mapping objects recursively without recursive calls.
+
+    Frames are processed depth first in the same order as recursive calls
+    with an explicit stack, so that deeply nested data can be merged.
+
+    :param frame: The first frame to process
+    :param merge_lists: Merge not only dicts but also lists
+    :raises: ValueError, TypeError if ``other`` was wrong
+    """
+    stack = [frame]
+    try:
+        while stack:
+            (target, items, _other) = stack[-1]
+            for key, val in items:
+                if key not in target:
+                    target[key] = val
+                    continue
+
+                val0 = target[key]
+                if _is_dict_like(val0):  # It needs recursive updates.
+                    stack.append(_make_frame(val0, val))
+                    break
+
+                if merge_lists and _is_list_like(val) and _is_list_like(val0):
+                    _merge_list(target, key, val)
+                else:
+                    target[key] = val
+            else:
+                stack.pop()
+
+    except (ValueError, TypeError) as exc:  # Re-raise w/ info.
+        for (_target, _items, other) in reversed(stack):
+            if other is not None:
+                exc = type(exc)(f'{exc!s} other={other!r}')
+        raise exc
 
 
 def _update_with_merge(self: DictT, other: DictT, key: str,
                        val: typing.Any = None,
-                       merge_lists: bool = False, **options) -> None:
+                       merge_lists: bool = False, **_options) -> None:
     """Update a dict ``self`` using ``other`` and optional arguments.
 
     Merge the value of self with other's recursively. Behavior of merge will be
@@ -209,16 +726,7 @@ def _update_with_merge(self: DictT, other: DictT, key: str,
     if val is None:
         val = other[key]
 
-    if key in self:
-        val0 = self[key]  # Original value
-        if utils.is_dict_like(val0):  # It needs recursive updates.
-            merge(self[key], val, merge_lists=merge_lists, **options)
-        elif merge_lists and _are_list_like(val, val0):
-            _merge_list(self, key, val)
-        else:
-            _merge_other(self, key, val)
-    else:
-        self[key] = val
+    _merge_frames((self, iter(((key, val), )), None), merge_lists)
 
 
 def _update_with_merge_lists(self: DictT, other: DictT, key: str,
@@ -258,95 +766,763 @@ def _get_update_fn(strategy: str) -> typing.Callable[..., None]:
         raise ValueError(f'Wrong merge strategy: {strategy!r}') from exc
 
 
-UpdatesT = typing.Union[
-    typing.Iterable[typing.Tuple[str, typing.Any]],
-    DictT
-]
-
-
 def merge(self: DictT, other: UpdatesT, ac_merge: str = MS_DICTS,
-          **options) -> None:
+          **options) -> typing.Optional['FrozenDict']:
     """Update (merge) a mapping object ``self`` with ``other``.
 
     ``other`` may be a mapping object or an iterable yields (key, value) tuples
     based on merge strategy 'ac_merge'.
 
+    .. versionchanged:: 0.13.1
+
+       Mapping objects are merged with the strategies to merge recursively
+       without recursive calls, lists are merged in linear time if items in
+       them are hashable, and iterables of pairs are iterated only once.
+
+       A new snapshot is returned if ``self`` is a :class:`FrozenDict`
+       object. See also :meth:`FrozenDict.merge`.
+
     :param others: a list of dict[-like] objects or (key, value) tuples
     :param another: optional keyword arguments to update self more
     :param ac_merge: Merge strategy to choose
+    :return:
+        A new :class:`FrozenDict` object if ``self`` is a snapshot, or None
+        but ``self`` will be updated
     """
+    if isinstance(self, FrozenDict):
+        return self.merge(other, ac_merge=ac_merge, **options)
+
+    if ac_merge is None or ac_merge in (MS_DICTS, MS_DICTS_AND_LISTS):
+        merge_lists = (ac_merge == MS_DICTS_AND_LISTS
+                       or bool(options.get('merge_lists', False)))
+        _merge_frames(_make_frame(self, other), merge_lists)
+        return None
+
     _update_fn = _get_update_fn(ac_merge)
 
-    if isinstance(other, dict):
-        for key in other.keys():
-            _update_fn(self, other, key, **options)
+    mother = _as_mapping(other)
+    if mother is not None:
+        for key in mother.keys():
+            _update_fn(self, mother, key, **options)
     else:
         try:
-            iother = typing.cast(
-                typing.Iterable[typing.Tuple[str, typing.Any]],
-                other
-            )
-            for key, val in iother:
-                _update_fn(self, dict(other), key, val=val, **options)
+            pairs = list(typing.cast(PairsT, other))
+            dother = dict(pairs)
+            for key, val in pairs:
+                _update_fn(self, dother, key, val=val, **options)
         except (ValueError, TypeError) as exc:  # Re-raise w/ info.
             raise type(exc)(f'{exc!s} other={other!r}')
 
+    return None
 
-def _make_recur(obj: typing.Any, make_fn: typing.Callable,
-                ac_ordered: bool = False,
-                ac_dict: typing.Optional[typing.Callable] = None,
-                **options) -> DictT:
-    """Apply ``make_fn`` to ``obj`` recursively.
 
-    :param obj: A mapping objects or other primitive object
-    :param make_fn: Function to make/convert to
-    :param ac_ordered: Use OrderedDict instead of dict to keep order of items
-    :param ac_dict: Callable to convert 'obj' to mapping object
-    :param options: Optional keyword arguments.
+_MISSING = object()
+
+
+def _resolve_wo_replace(layers: typing.Sequence[DictT], key: str
+                        ) -> typing.Any:
+    """Resolve the value of ``key`` from ``layers`` with MS_NO_REPLACE."""
+    for layer in layers:
+        if key in layer:
+            return layer[key]
+
+    return _MISSING
+
+
+def _resolve_with_replace(layers: typing.Sequence[DictT], key: str
+                          ) -> typing.Any:
+    """Resolve the value of ``key`` from ``layers`` with MS_REPLACE."""
+    res: typing.Any = _MISSING
+    for idx, layer in enumerate(layers):
+        if key in layer:
+            val = layer[key]
+            if not idx or val is not None:
+                res = val
+
+    return res
+
+
+def _pairs_to_dict(val: typing.Any) -> DictT:
+    """Make a dict from pairs ``val`` to merge into mapping objects.
+
+    :raises: ValueError, TypeError same as :func:`merge` if it's not pairs
+    """
+    try:
+        return dict(_iter_pairs(val))
+    except (ValueError, TypeError) as exc:
+        raise type(exc)(f'{exc!s} other={val!r}')
+
+
+def _resolve_with_merge(layers: typing.Sequence[DictT], key: str,
+                        strategy: str) -> typing.Any:
+    """Resolve the value of ``key`` from ``layers`` with MS_DICTS[_AND_LISTS].
+
+    Mapping values are resolved into a :class:`LayeredDict` object. Values
+    following mapping values are merged into them as :func:`merge` does,
+    so that these must be mapping objects or pairs.
+    """
+    merge_lists = strategy == MS_DICTS_AND_LISTS
+    res: typing.Any = _MISSING
+    dics: typing.List[DictT] = []  # Mapping values to merge.
+    for layer in layers:
+        if key not in layer:
+            continue
+
+        val = layer[key]
+        if _is_dict_like(val):
+            dics.append(val)
+        elif dics:
+            dics.append(_pairs_to_dict(val))
+        elif (merge_lists and res is not _MISSING
+              and _are_list_like(res, val)):
+            res = list(res) + _new_items(res, val)
+        else:
+            res = val
+
+    if dics:
+        return LayeredDict(dics, ac_merge=strategy)
+
+    return res
+
+
+class LayeredDict(collections.abc.Mapping):
+    """Read-only mapping object to merge mapping objects (layers) lazily.
+
+    The value of each key is resolved from layers on its lookup by following
+    the merge strategy same as :func:`merge` merges layers in order, and
+    cached. Mapping values are resolved into :class:`LayeredDict` objects
+    merge them lazily too, so that only parts of data actually accessed are
+    merged.
+
+    .. note:: Layers must not be modified after this object was made.
+    """
+
+    def __init__(self, layers: typing.Iterable[DictT],
+                 ac_merge: str = MS_DICTS, **_options) -> None:
+        """Initialize.
+
+        :param layers: A list of mapping objects to merge in order
+        :param ac_merge: Merge strategy to choose from MERGE_STRATEGIES
+        """
+        if ac_merge is None:
+            ac_merge = MS_DICTS
+        if ac_merge not in MERGE_STRATEGIES:
+            raise ValueError(f'Wrong merge strategy: {ac_merge!r}')
+
+        # Empty layers are kept as the first layer is special in MS_REPLACE.
+        self._layers: typing.List[DictT] = list(layers)
+        self._strategy = ac_merge
+        self._cache: DictT = {}
+        self._keys: typing.Optional[typing.List[str]] = None
+
+    def _resolve(self, key: str) -> typing.Any:
+        """Resolve the value of ``key`` from layers.
+
+        :return: The value or _MISSING if any layers do not have ``key``
+        :raises: ValueError, TypeError same as :func:`merge` if values cannot
+            be merged
+        """
+        if self._strategy == MS_NO_REPLACE:
+            return _resolve_wo_replace(self._layers, key)
+
+        if self._strategy == MS_REPLACE:
+            return _resolve_with_replace(self._layers, key)
+
+        return _resolve_with_merge(self._layers, key, self._strategy)
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the value of ``key`` resolved from layers."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        val = self._resolve(key)
+        if val is _MISSING:
+            raise KeyError(key)
+
+        self._cache[key] = val
+        return val
+
+    def _list_keys(self) -> typing.List[str]:
+        """List keys in the order :func:`merge` would add them."""
+        keys: DictT = {}
+        for idx, layer in enumerate(self._layers):
+            for key in layer:
+                if key in keys:
+                    continue
+                if idx and self._strategy == MS_REPLACE and \
+                        layer[key] is None:
+                    continue
+                keys[key] = None
+
+        return list(keys)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate keys."""
+        if self._keys is None:
+            self._keys = self._list_keys()
+
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        if self._keys is None:
+            self._keys = self._list_keys()
+
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        """Get a string represents this object."""
+        return (f'<{type(self).__name__} layers={len(self._layers)} '
+                f'ac_merge={self._strategy!r}>')
+
+    def materialize(self, ac_ordered: bool = False,
+                    ac_dict: typing.Optional[typing.Callable] = None
+                    ) -> DictT:
+        """Merge layers eagerly and make a mapping object.
+
+        :param ac_ordered: Use OrderedDict instead of dict to keep order
+        :param ac_dict: Callable to make mapping objects
+        :return: A mapping object same as the result of :func:`merge`
+        """
+        if ac_dict is None:
+            ac_dict = collections.OrderedDict if ac_ordered else dict
+
+        return ac_dict(
+            (key, val.materialize(ac_dict=ac_dict)
+             if isinstance(val, LayeredDict) else val)
+            for key, val in self.items()
+        )
+
+
+class FrozenList(tuple):
+    """Read-only and hashable list, a node of snapshots.
+
+    .. versionadded:: 0.13.1
+
+    It's a tuple of frozen items, and equal to lists and tuples have same
+    items.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Test if ``other`` is a list or a tuple of same items."""
+        if isinstance(other, list):
+            other = tuple(other)
+
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: typing.Any) -> bool:
+        """Negation of :meth:`__eq__`."""
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        """Get a string represents this object."""
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def __copy__(self) -> 'FrozenList':
+        """It's not needed to copy immutable objects."""
+        return self
+
+    def __deepcopy__(self, memo: typing.Any) -> 'FrozenList':
+        """It's not needed to copy immutable objects."""
+        return self
+
+
+class FrozenDict(collections.abc.Mapping):
+    """Read-only and hashable mapping object, a node of snapshots.
+
+    .. versionadded:: 0.13.1
+
+    Values are frozen recursively with :func:`freeze` on initialization, so
+    that snapshots can be shared among threads without defensive copies.
+    :meth:`set_` and :meth:`merge` return new snapshots share subtrees not
+    updated with the original, so that only nodes in paths to values updated
+    are copied.
+    """
 
-    :return: Mapping object
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize.
+
+        :param args: Same as the arguments of dict
+        :param kwargs: Same as the keyword arguments of dict
+        """
+        self._data: DictT = {key: freeze(val)
+                             for key, val in dict(*args, **kwargs).items()}
+        self._hash: typing.Optional[int] = None
+
+    @classmethod
+    def _make(cls, data: DictT) -> 'FrozenDict':
+        """Make an object from a dict ``data`` of frozen values as it is."""
+        self = cls.__new__(cls)
+        self._data = data
+        self._hash = None
+        return self
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """Get the value of ``key``."""
+        return self._data[key]
+
+    def __contains__(self, key: typing.Any) -> bool:
+        """Test if this object has ``key``."""
+        return key in self._data
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Get the value of ``key`` or ``default`` if it's missing."""
+        return self._data.get(key, default)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate keys."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Get the number of keys."""
+        return len(self._data)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        """Test if ``other`` is a mapping object of same items."""
+        if isinstance(other, FrozenDict):
+            return self is other or self._data == other._data
+
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Get the hash value computed only once.
+
+        :raises: TypeError if some values are not hashable
+        """
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Get a string represents this object."""
+        return f'{type(self).__name__}({self._data!r})'
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        """Support pickle."""
+        return (type(self), (self._data, ))
+
+    def __copy__(self) -> 'FrozenDict':
+        """It's not needed to copy immutable objects."""
+        return self
+
+    def __deepcopy__(self, memo: typing.Any) -> 'FrozenDict':
+        """It's not needed to copy immutable objects."""
+        return self
+
+    def set_(self, path: str, val: typing.Any,
+             seps: typing.Tuple[str, ...] = PATH_SEPS) -> 'FrozenDict':
+        """Make a new snapshot ``val`` was set at ``path``.
+
+        Mapping values are merged into mapping objects at the path, and other
+        values replace values at the path same as :meth:`CompiledPath.set_`.
+
+        :param path: Path expression to point object wanted
+        :param val: Value to set
+        :param seps: Separator char candidates
+        :return: A new :class:`FrozenDict` object or this object if nothing
+            was changed
+        """
+        keys = _split_path(path, seps)
+        return _set_frozen(self, keys, val) if keys else self
+
+    def merge(self, other: UpdatesT, ac_merge: str = MS_DICTS,
+              **options) -> 'FrozenDict':
+        """Make a new snapshot ``other`` was merged into.
+
+        Nodes updated and their parents are copied, and other nodes are
+        shared with this object, so that it costs proportional to the size of
+        ``other`` instead of the size of this object.
+
+        :param other: a dict[-like] object or (key, value) tuples
+        :param ac_merge: Merge strategy to choose, see also :func:`merge`
+        :return: A new :class:`FrozenDict` object or this object if nothing
+            was changed
+        """
+        if ac_merge is None or ac_merge in (MS_DICTS, MS_DICTS_AND_LISTS):
+            merge_lists = (ac_merge == MS_DICTS_AND_LISTS
+                           or bool(options.get('merge_lists', False)))
+            return _merge_frozen(self, other, merge_lists)
+
+        if ac_merge in (MS_REPLACE, MS_NO_REPLACE):
+            return _update_frozen(self, other, ac_merge == MS_REPLACE)
+
+        # Other strategies need mutable mapping objects to update.
+        res = thaw(self)
+        merge(res, other, ac_merge=ac_merge, **options)
+        return typing.cast(FrozenDict, freeze(res))
+
+
+def _merge_frozen(self: FrozenDict, other: UpdatesT, merge_lists: bool
+                  ) -> FrozenDict:
+    """Merge ``other`` into a snapshot ``self`` recursively.
+
+    :param merge_lists: Merge not only dicts but also lists
+    :return: A new snapshot or ``self`` if nothing was changed
+    :raises: ValueError, TypeError if ``other`` was wrong
+    """
+    data: typing.Optional[DictT] = None  # It's copied on the first update.
+    try:
+        for key, val in _iter_items(other):
+            val0 = (self._data if data is None else data).get(key, _MISSING)
+            if val0 is _MISSING:
+                new = freeze(val)
+            elif isinstance(val0, FrozenDict):
+                new = _merge_frozen(val0, val, merge_lists)
+            elif merge_lists and _is_list_like(val) and \
+                    _is_list_like(val0):
+                items = _new_items(val0, val)
+                new = FrozenList((*val0, *(freeze(x) for x in items))
+                                 ) if items else val0
+            else:
+                new = freeze(val)
+
+            if new is not val0:
+                if data is None:
+                    data = dict(self._data)
+                data[key] = new
+
+    except (ValueError, TypeError) as exc:  # Re-raise w/ info.
+        if _is_dict_like(other):
+            raise
+        raise type(exc)(f'{exc!s} other={other!r}')
+
+    return self if data is None else FrozenDict._make(data)
+
+
+def _set_frozen(self: FrozenDict, keys: typing.Sequence[str],
+                val: typing.Any) -> FrozenDict:
+    """Set ``val`` at ``keys`` in a snapshot ``self`` by copying its path.
+
+    :return: A new snapshot or ``self`` if nothing was changed
+    """
+    key = keys[0]
+    val0 = self._data.get(key, _MISSING)
+    if len(keys) > 1:
+        child = val0 if isinstance(val0, FrozenDict) else FrozenDict._make({})
+        new = _set_frozen(child, keys[1:], val)
+    elif _is_dict_like(val) and isinstance(val0, FrozenDict):
+        new = _merge_frozen(val0, val, False)
+    else:
+        new = freeze(val)
+
+    if new is val0:
+        return self
+
+    data = dict(self._data)
+    data[key] = new
+    return FrozenDict._make(data)
+
+
+def _freeze_draft(draft: DictT) -> FrozenDict:
+    """Make a snapshot from a draft, a dict of frozen values and drafts."""
+    return FrozenDict._make({key: _freeze_draft(val) if type(val) is dict
+                             else val for key, val in draft.items()})
+
+
+def _set_many_frozen(self: FrozenDict, pairs: PairsT,
+                     seps: typing.Tuple[str, ...] = PATH_SEPS
+                     ) -> FrozenDict:
+    """Set values at multiple paths in a snapshot ``self`` at once.
+
+    Nodes in paths are copied to drafts, dicts can be updated, only once and
+    frozen again at last, so that it costs proportional to the total size of
+    nodes in paths instead of that times the number of paths.
+
+    :return: A new snapshot or ``self`` if nothing was set
+    :raises: ValueError if some paths have the wildcard
+    """
+    root: typing.Optional[DictT] = None  # It's copied on the first set.
+    for path, val in pairs:
+        keys = _path_keys(path, seps)
+        if not keys:
+            continue
+        if PATH_WILDCARD in keys:
+            raise ValueError(f'Values cannot be set at {path!r}')
+
+        if root is None:
+            root = dict(self._data)
+
+        target = root
+        for key in keys[:-1]:
+            child = target.get(key)
+            if type(child) is not dict:  # It's not a draft yet.
+                child = target[key] = (dict(child._data)
+                                       if isinstance(child, FrozenDict)
+                                       else {})
+            target = child
+
+        val0 = target.get(keys[-1], _MISSING)
+        if type(val0) is dict:
+            val0 = _freeze_draft(val0)
+
+        if _is_dict_like(val) and isinstance(val0, FrozenDict):
+            target[keys[-1]] = _merge_frozen(val0, val, False)
+        else:
+            target[keys[-1]] = freeze(val)
+
+    return self if root is None else _freeze_draft(root)
+
+
+def _update_frozen(self: FrozenDict, other: UpdatesT, replace: bool
+                   ) -> FrozenDict:
+    """Update a snapshot ``self`` with ``other`` w/ or w/o replacements.
+
+    :param replace: Replace values with ``other``'s not None if True
+    :return: A new snapshot or ``self`` if nothing was changed
+    """
+    try:
+        items = other if utils.is_dict_like(other) else dict(other)
+    except (ValueError, TypeError) as exc:  # Re-raise w/ info.
+        raise type(exc)(f'{exc!s} other={other!r}')
+
+    data: typing.Optional[DictT] = None
+    for key, val in items.items():  # type: ignore
+        if (val is None) if replace else (key in self._data):
+            continue
+
+        if data is None:
+            data = dict(self._data)
+        data[key] = freeze(val)
+
+    return self if data is None else FrozenDict._make(data)
+
+
+# Types of objects :func:`freeze` returns as they are.
+_SCALAR_TYPES: typing.FrozenSet[type] = frozenset(
+    (str, bytes, int, float, bool, type(None))
+)
+_IMMUTABLE_TYPES: typing.Tuple[type, ...] = (
+    FrozenDict, FrozenList, frozenset, str, bytes
+)
+
+
+def freeze(obj: typing.Any) -> typing.Any:
+    """Make a snapshot, a read-only and hashable copy of ``obj``.
+
+    .. versionadded:: 0.13.1
+
+    Mapping objects and lists in ``obj`` are converted recursively to
+    :class:`FrozenDict` and :class:`FrozenList` objects, and sets are
+    converted to frozensets. Objects frozen already are shared instead of
+    copied.
+
+    :param obj: A mapping object or any other object
+    :return: A :class:`FrozenDict` object if ``obj`` is a mapping object
+    """
+    if type(obj) in _SCALAR_TYPES or isinstance(obj, _IMMUTABLE_TYPES):
+        return obj
+
+    if _is_dict_like(obj):
+        return FrozenDict._make({key: freeze(val)
+                                 for key, val in obj.items()})
+
+    if isinstance(obj, collections.abc.Set):
+        return frozenset(obj)
+
+    if _is_list_like(obj):
+        return FrozenList(freeze(item) for item in obj)
+
+    return obj
+
+
+def thaw(obj: typing.Any, ac_ordered: bool = False,
+         ac_dict: typing.Optional[typing.Callable] = None) -> typing.Any:
+    """Make a mutable copy of a snapshot ``obj`` made by :func:`freeze`.
+
+    .. versionadded:: 0.13.1
+
+    :param obj: A :class:`FrozenDict` object or any other object
+    :param ac_ordered: Use OrderedDict instead of dict to keep order of items
+    :param ac_dict: Callable to make mapping objects
+    :return: A dict or a list or ``obj`` itself if it's not frozen
     """
     if ac_dict is None:
         ac_dict = collections.OrderedDict if ac_ordered else dict
 
-    return ac_dict((k, None if v is None else make_fn(v, **options))
-                   for k, v in obj.items())
+    if isinstance(obj, FrozenDict):
+        return ac_dict((key, thaw(val, ac_dict=ac_dict))
+                       for key, val in obj.items())
 
+    if isinstance(obj, FrozenList):
+        return [thaw(item, ac_dict=ac_dict) for item in obj]
 
-def _make_iter(obj: typing.Any, make_fn: typing.Callable, **options
-               ) -> DictT:
-    """Apply ``make_fn`` to ``obj`` iteratively.
+    return obj
 
-    :param obj: A mapping objects or other primitive object
-    :param make_fn: Function to make/convert to
-    :param options: Optional keyword arguments.
 
-    :return: Mapping object
+class _ConvFrame:
+    """A frame to convert a mapping or list-like object ``obj``.
+
+    Converted values are kept only after some of them were changed, so that
+    objects need not be converted are not copied.
     """
-    return type(obj)(make_fn(v, **options) for v in obj)
+
+    __slots__ = ('obj', 'keys', 'vals', 'items', 'res', 'pending')
+
+    def __init__(self, obj: typing.Any, is_map: bool) -> None:
+        """Initialize."""
+        self.obj = obj
+        self.keys: typing.Optional[typing.List[typing.Any]] = None
+        if is_map:
+            self.keys = list(obj.keys())
+            self.vals: typing.Sequence[typing.Any] = list(obj.values())
+        else:
+            self.vals = obj if isinstance(obj, (list, tuple)) else list(obj)
+
+        self.items = enumerate(self.vals)
+        self.res: typing.Optional[typing.List[typing.Any]] = None
+        self.pending = 0  # Index of the value being converted in a frame.
+
+    def add(self, idx: int, val: typing.Any, new: typing.Any) -> None:
+        """Add ``new`` converted from the ``idx``-th value ``val``."""
+        if self.res is None:
+            if new is val:
+                return
+            self.res = list(self.vals[:idx])
+
+        self.res.append(new)
+
+    def finish(self, ac_dict: typing.Callable, copy: bool) -> typing.Any:
+        """Make the object converted or return ``obj`` if it's not needed."""
+        vals = self.vals if self.res is None else self.res
+        if self.keys is None:
+            if self.res is None and not copy:
+                return self.obj
+            return type(self.obj)(vals)
+
+        if self.res is None and not copy and type(self.obj) is ac_dict:
+            return self.obj
+
+        return ac_dict(zip(self.keys, vals))
+
+
+def _container_kind(obj: typing.Any) -> typing.Optional[bool]:
+    """Get True if ``obj`` is dict-like, False if list-like or None."""
+    otype = type(obj)
+    if otype in _SCALAR_TYPES:
+        return None
+    if otype is dict or (otype is not list and utils.is_dict_like(obj)):
+        return True
+    if otype is list or (otype is not bytearray and utils.is_list_like(obj)):
+        return False
+
+    return None
+
+
+def _has_scalars_only(obj: typing.Any, is_map: bool) -> bool:
+    """Test if a mapping or list-like object ``obj`` has scalars only."""
+    return all(type(val) in _SCALAR_TYPES
+               for val in (obj.values() if is_map else obj))
+
+
+def _convert_leaf(obj: typing.Any, is_map: bool, ac_dict: typing.Callable,
+                  copy: bool) -> typing.Any:
+    """Convert ``obj`` has scalars only same as :meth:`_ConvFrame.finish`."""
+    if is_map:
+        if copy or type(obj) is not ac_dict:
+            return ac_dict(obj.items())
+    elif copy:
+        return type(obj)(obj)
+
+    return obj
+
+
+def _convert_frame_items(frame: _ConvFrame, ac_dict: typing.Callable,
+                         copy: bool) -> typing.Optional[_ConvFrame]:
+    """Convert values in ``frame`` until a value needs its own frame.
+
+    :return:
+        A new frame of the value needs to be converted next, or None if all
+        of values in ``frame`` were converted
+    """
+    for idx, val in frame.items:
+        if type(val) in _SCALAR_TYPES:  # Fast path of the most.
+            if frame.res is not None:
+                frame.res.append(val)
+            continue
+
+        kind = _container_kind(val)
+        if kind is None:
+            frame.add(idx, val, val)
+            continue
+
+        if _has_scalars_only(val, kind):  # Leaves need no frames.
+            frame.add(idx, val, _convert_leaf(val, kind, ac_dict, copy))
+            continue
+
+        frame.pending = idx
+        return _ConvFrame(val, kind)
+
+    return None
 
 
 def convert_to(obj: typing.Any, ac_ordered: bool = False,
                ac_dict: typing.Optional[typing.Callable] = None,
-               **options) -> DictT:
+               ac_copy: bool = False, **_options) -> DictT:
     """Convert a mapping objects to a dict or object of 'to_type' recursively.
 
     Borrowed basic idea and implementation from bunch.unbunchify. (bunch is
     distributed under MIT license same as this.)
 
+    .. versionchanged:: 0.13.1
+
+       Objects are converted without recursive calls, and mapping objects
+       of the type ``ac_dict`` and lists have nothing to convert in them are
+       returned as they are instead of copies unless ``ac_copy`` is True.
+       Circular references are detected.
+
+       Nested mapping objects are converted with ``ac_dict`` (or
+       OrderedDict if ``ac_ordered`` is True) also. Only the top level ones,
+       and ones in lists at the top level, were converted with it and other
+       nested ones were converted to dicts before.
+
     :param obj: A mapping objects or other primitive object
     :param ac_ordered: Use OrderedDict instead of dict to keep order of items
     :param ac_dict: Callable to convert 'obj' to mapping object
+    :param ac_copy: Make copies of all of mapping and list-like objects
     :param options: Optional keyword arguments.
 
     :return: A dict or OrderedDict or object of 'cls'
+    :raises: ValueError if ``obj`` has circular references
     """
-    options.update(ac_ordered=ac_ordered, ac_dict=ac_dict)
-    if utils.is_dict_like(obj):
-        return _make_recur(obj, convert_to, **options)
-    if utils.is_list_like(obj):
-        return _make_iter(obj, convert_to, **options)
+    kind = _container_kind(obj)
+    if kind is None:
+        return obj
+
+    if ac_dict is None:
+        ac_dict = collections.OrderedDict if ac_ordered else dict
+
+    active = {id(obj)}  # Objects in the stack to detect cycles.
+    stack = [_ConvFrame(obj, kind)]
+    while True:
+        frame = stack[-1]
+        child = _convert_frame_items(frame, ac_dict, ac_copy)
+        if child is not None:
+            if id(child.obj) in active:
+                raise ValueError('Circular reference was found in the '
+                                 f'{type(child.obj).__name__} object')
+
+            active.add(id(child.obj))
+            stack.append(child)
+            continue
+
+        stack.pop()
+        res = frame.finish(ac_dict, ac_copy)
+        active.discard(id(frame.obj))
+        if not stack:
+            return res
+
+        parent = stack[-1]
+        parent.add(parent.pending, frame.obj, res)
 
-    return obj
 
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,145 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Process-wide metrics of anyconfig operations.
+
+.. versionadded:: 0.13.1
+
+   - Added counters and histograms of loads and dumps by parsers, bytes read
+     and written, time to parse, cache hits and misses, validation failures
+     and template renders, :func:`stats` to get them and
+     :func:`export_prometheus` to export them in the Prometheus text format.
+
+Metrics are disabled by default not to add costs to load and dump data, and
+updated by anyconfig itself once enabled with :func:`enable`, e.g.:
+
+.. code-block:: python
+
+   anyconfig.metrics.enable()
+   anyconfig.load('/etc/app/conf.d/*.yml')
+   anyconfig.stats()['loads_total']  # {'pyyaml': 3}
+   anyconfig.metrics.export_prometheus('/var/lib/node_exporter/app.prom')
+"""
+import pathlib
+import typing
+
+from . import prometheus
+from .registry import (
+    Counter, Histogram, Metric, Registry, StatsT, TIME_BUCKETS
+)
+
+
+LOADS: str = 'loads_total'
+DUMPS: str = 'dumps_total'
+READ_BYTES: str = 'read_bytes_total'
+WRITTEN_BYTES: str = 'written_bytes_total'
+PARSE_SECONDS: str = 'parse_seconds'
+CACHE_HITS: str = 'cache_hits_total'
+CACHE_MISSES: str = 'cache_misses_total'
+VALIDATION_FAILURES: str = 'validation_failures_total'
+TEMPLATE_RENDERS: str = 'template_renders_total'
+
+# Label values of :data:`CACHE_HITS` and :data:`CACHE_MISSES`.
+CACHE_MEMORY: str = 'memory'
+CACHE_DISK: str = 'disk'
+
+# Label values of :data:`TEMPLATE_RENDERS`.
+RENDER_OK: str = 'ok'
+RENDER_FAILED: str = 'failed'
+
+REGISTRY: Registry = Registry()
+
+for _metric in (
+    Counter(LOADS, 'Number of loads by parsers.', 'parser'),
+    Counter(DUMPS, 'Number of dumps by parsers.', 'parser'),
+    Counter(READ_BYTES, 'Bytes read from files and strings by parsers.',
+            'parser'),
+    Counter(WRITTEN_BYTES, 'Bytes written to files and strings by parsers.',
+            'parser'),
+    Histogram(PARSE_SECONDS, 'Time to parse inputs in seconds.', 'parser',
+              TIME_BUCKETS),
+    Counter(CACHE_HITS, 'Number of cache hits.', 'cache'),
+    Counter(CACHE_MISSES, 'Number of cache misses.', 'cache'),
+    Counter(VALIDATION_FAILURES, 'Number of validation failures.'),
+    Counter(TEMPLATE_RENDERS, 'Number of templates rendered.', 'result'),
+):
+    REGISTRY.register(_metric)
+
+
+def inc(name: str, label: str = '', value: float = 1) -> None:
+    """Increase the counter ``name`` labeled ``label`` by ``value``."""
+    REGISTRY.inc(name, label, value)
+
+
+def observe(name: str, label: str, value: float) -> None:
+    """Observe ``value`` with the histogram ``name`` labeled ``label``."""
+    REGISTRY.observe(name, label, value)
+
+
+def update(incs: typing.Iterable[typing.Tuple[str, str, float]] = (),
+           observations: typing.Iterable[typing.Tuple[str, str, float]] = ()
+           ) -> None:
+    """Update multiple metrics at once.
+
+    .. seealso:: :meth:`anyconfig.metrics.registry.Registry.update`
+    """
+    REGISTRY.update(incs, observations)
+
+
+def is_enabled() -> bool:
+    """Test if metrics are enabled."""
+    return REGISTRY.enabled
+
+
+def enable() -> None:
+    """Enable metrics to update them on loads, dumps and so on."""
+    REGISTRY.enabled = True
+
+
+def disable() -> None:
+    """Disable metrics not to update them (default)."""
+    REGISTRY.enabled = False
+
+
+def stats() -> StatsT:
+    """Get a snapshot of metrics.
+
+    :return:
+        A mapping object of metric names and mapping objects of label values,
+        e.g. the IDs of parsers, and values, e.g.
+        {'loads_total': {'std.json': 2}, 'parse_seconds': {'std.json':
+        {'count': 2, 'sum': 0.001, 'buckets': {0.0001: 0, ...}}}, ...}
+    """
+    return REGISTRY.stats()
+
+
+def reset() -> None:
+    """Reset all of metrics."""
+    REGISTRY.reset()
+
+
+def to_prometheus() -> str:
+    """Get metrics in the Prometheus text format."""
+    return prometheus.to_text(REGISTRY)
+
+
+def export_prometheus(path: typing.Union[str, pathlib.Path]) -> None:
+    """Write metrics in the Prometheus text format to ``path`` atomically.
+
+    :param path: Path to the output file, e.g. /var/lib/node_exporter/a.prom
+    :raises: OSError
+    """
+    prometheus.export(path, REGISTRY)
+
+
+__all__ = [
+    'Counter', 'Histogram', 'Metric', 'Registry', 'StatsT', 'TIME_BUCKETS',
+    'LOADS', 'DUMPS', 'READ_BYTES', 'WRITTEN_BYTES', 'PARSE_SECONDS',
+    'CACHE_HITS', 'CACHE_MISSES', 'VALIDATION_FAILURES', 'TEMPLATE_RENDERS',
+    'CACHE_MEMORY', 'CACHE_DISK', 'RENDER_OK', 'RENDER_FAILED',
+    'REGISTRY', 'inc', 'observe', 'update', 'is_enabled', 'enable', 'disable',
+    'stats', 'reset', 'to_prometheus', 'export_prometheus',
+]
+
+# vim:sw=4:ts=4:et:
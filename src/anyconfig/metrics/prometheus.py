@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Export metrics in the Prometheus text exposition format.
+
+Files written by :func:`export` are intended to be collected by the textfile
+collector of the Prometheus node exporter, so these are written atomically.
+
+.. seealso:: https://prometheus.io/docs/instrumenting/exposition_formats/
+"""
+import os
+import pathlib
+import tempfile
+import typing
+
+from .registry import (
+    Histogram, Metric, Registry, METRIC_HISTOGRAM
+)
+
+
+PREFIX: str = 'anyconfig_'
+
+
+def _escape(val: str) -> str:
+    """Escape a label value."""
+    return val.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(*pairs: typing.Tuple[str, str]) -> str:
+    """Make a str represents labels from pairs of the name and the value."""
+    items = [f'{key}="{_escape(val)}"' for key, val in pairs if key]
+    return '{' + ','.join(items) + '}' if items else ''
+
+
+def _number(val: float) -> str:
+    """Format a number."""
+    if val == float('inf'):
+        return '+Inf'
+
+    return repr(float(val)) if isinstance(val, float) else str(val)
+
+
+def _metric_lines(metric: Metric) -> typing.Iterator[str]:
+    """Make lines of samples of ``metric``."""
+    name = PREFIX + metric.name
+    yield f'# HELP {name} {metric.doc}'
+    yield f'# TYPE {name} {metric.type}'
+
+    if metric.type != METRIC_HISTOGRAM:
+        for label, val in sorted(metric.snapshot().items()):
+            yield f'{name}{_labels((metric.label, label))} {_number(val)}'
+        return
+
+    for label, vals in sorted(typing.cast(Histogram,
+                                          metric).snapshot().items()):
+        for bound, count in vals['buckets'].items():
+            lbls = _labels((metric.label, label), ('le', _number(bound)))
+            yield f'{name}_bucket{lbls} {count}'
+
+        lbls = _labels((metric.label, label))
+        yield f'{name}_sum{lbls} {_number(vals["sum"])}'
+        yield f'{name}_count{lbls} {vals["count"]}'
+
+
+def to_text(registry: Registry) -> str:
+    """Make a str represents all of metrics in ``registry``."""
+    return ''.join(line + '\n' for metric in registry.metrics()
+                   for line in _metric_lines(metric))
+
+
+def export(path: typing.Union[str, pathlib.Path], registry: Registry
+           ) -> None:
+    """Write all of metrics in ``registry`` to ``path`` atomically.
+
+    :param path: Path to the output file, e.g. /var/lib/node_exporter/a.prom
+    :param registry: A registry of metrics
+    :raises: OSError
+    """
+    path = pathlib.Path(path)
+    content = to_text(registry)
+
+    tmp = None
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8',
+                                         dir=path.parent, suffix='.tmp',
+                                         delete=False) as out:
+            tmp = out.name
+            out.write(content)
+
+        os.chmod(tmp, 0o644)  # It's 0o600 by default.
+        os.replace(tmp, path)
+        tmp = None
+    finally:
+        if tmp is not None:
+            os.unlink(tmp)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,214 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Process-wide counters and histograms of anyconfig operations.
+
+Metrics have a label at most, e.g. the ID of the parser, to keep updating
+them cheap. All of metrics are updated under a lock of the registry so that
+they can be updated from multiple threads, only if the registry is enabled.
+"""
+import abc
+import bisect
+import threading
+import typing
+
+
+METRIC_COUNTER: str = 'counter'
+METRIC_HISTOGRAM: str = 'histogram'
+
+# Upper bounds of buckets of histograms of time in seconds by default.
+TIME_BUCKETS: typing.Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+
+StatsT = typing.Dict[str, typing.Dict[str, typing.Any]]
+
+
+class Metric(abc.ABC):
+    """Base class of metrics.
+
+    :param name: Name of the metric, e.g. 'loads_total'
+    :param doc: Description of the metric
+    :param label: Name of the label of the metric or '' if it has no label
+    """
+
+    type: str = ''
+
+    def __init__(self, name: str, doc: str, label: str = '') -> None:
+        """Initialize."""
+        self.name = name
+        self.doc = doc
+        self.label = label
+
+    @abc.abstractmethod
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        """Get a copy of values of this metric keyed by label values."""
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        """Reset values of this metric."""
+
+
+class Counter(Metric):
+    """A metric of monotonically increasing values."""
+
+    type: str = METRIC_COUNTER
+
+    def __init__(self, name: str, doc: str, label: str = '') -> None:
+        """Initialize."""
+        super().__init__(name, doc, label)
+        self._values: typing.Dict[str, float] = {}
+
+    def inc(self, label: str = '', value: float = 1) -> None:
+        """Increase the value labeled ``label`` by ``value``.
+
+        .. note:: It must be called with the lock of the registry held.
+        """
+        self._values[label] = self._values.get(label, 0) + value
+
+    def snapshot(self) -> typing.Dict[str, float]:
+        """Get a copy of values keyed by label values."""
+        if not self.label and not self._values:
+            return {'': 0}
+
+        return dict(self._values)
+
+    def reset(self) -> None:
+        """Reset values."""
+        self._values = {}
+
+
+class Histogram(Metric):
+    """A metric of the distribution of observed values.
+
+    :param buckets: Sorted upper bounds of buckets except for +Inf
+    """
+
+    type: str = METRIC_HISTOGRAM
+
+    def __init__(self, name: str, doc: str, label: str = '',
+                 buckets: typing.Sequence[float] = TIME_BUCKETS) -> None:
+        """Initialize."""
+        super().__init__(name, doc, label)
+        self.buckets = tuple(buckets)
+        # {label: [[count in each bucket and +Inf], sum]}
+        self._values: typing.Dict[str, typing.List[typing.Any]] = {}
+
+    def observe(self, label: str, value: float) -> None:
+        """Observe ``value`` labeled ``label``.
+
+        .. note:: It must be called with the lock of the registry held.
+        """
+        vals = self._values.get(label)
+        if vals is None:
+            vals = self._values[label] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        vals[0][bisect.bisect_left(self.buckets, value)] += 1
+        vals[1] += value
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Get a copy of values keyed by label values.
+
+        :return:
+            {label: {'count': N, 'sum': S, 'buckets': {upper_bound: N}}}
+            where counts of buckets are cumulative as Prometheus does
+        """
+        res = {}
+        for label, (counts, total) in self._values.items():
+            (buckets, acc) = ({}, 0)
+            for bound, count in zip((*self.buckets, float('inf')), counts):
+                acc += count
+                buckets[bound] = acc
+
+            res[label] = dict(count=acc, sum=total, buckets=buckets)
+
+        return res
+
+    def reset(self) -> None:
+        """Reset values."""
+        self._values = {}
+
+
+class Registry:
+    """Collection of metrics.
+
+    :param enabled: Update metrics if True. It can be changed later.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize."""
+        self._metrics: typing.Dict[str, Metric] = {}
+        # Same as the above but typed to look up them quickly on updates.
+        self._counters: typing.Dict[str, Counter] = {}
+        self._histograms: typing.Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self.enabled = enabled
+
+    def register(self, metric: Metric) -> Metric:
+        """Register ``metric``.
+
+        :raises: ValueError if other metric of same name was registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric was registered: {metric.name}')
+
+            self._metrics[metric.name] = metric
+            if isinstance(metric, Counter):
+                self._counters[metric.name] = metric
+            elif isinstance(metric, Histogram):
+                self._histograms[metric.name] = metric
+
+        return metric
+
+    def metrics(self) -> typing.List[Metric]:
+        """Get the list of metrics registered."""
+        with self._lock:
+            return list(self._metrics.values())
+
+    def inc(self, name: str, label: str = '', value: float = 1) -> None:
+        """Increase the counter ``name`` labeled ``label`` by ``value``."""
+        if self.enabled:
+            with self._lock:
+                self._counters[name].inc(label, value)
+
+    def observe(self, name: str, label: str, value: float) -> None:
+        """Observe ``value`` with the histogram ``name`` labeled ``label``."""
+        if self.enabled:
+            with self._lock:
+                self._histograms[name].observe(label, value)
+
+    def update(self, incs: typing.Iterable[typing.Tuple[str, str, float]] = (),
+               observations: typing.Iterable[typing.Tuple[str, str, float]
+                                             ] = ()) -> None:
+        """Update multiple metrics at once with the lock held only once.
+
+        :param incs: Tuples of (counter name, label, value to increase by)
+        :param observations: Tuples of (histogram name, label, value)
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            for name, label, value in incs:
+                self._counters[name].inc(label, value)
+            for name, label, value in observations:
+                self._histograms[name].observe(label, value)
+
+    def stats(self) -> StatsT:
+        """Get a snapshot of all of metrics.
+
+        :return: {metric_name: {label_value: value}}
+        """
+        with self._lock:
+            return {name: metric.snapshot()
+                    for name, metric in self._metrics.items()}
+
+    def reset(self) -> None:
+        """Reset values of all of metrics."""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric.reset()
+
+# vim:sw=4:ts=4:et:
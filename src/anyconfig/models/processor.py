@@ -4,10 +4,16 @@
 #
 """Abstract processor module.
 
+.. versionadded:: 0.13.1
+
+   - Add :class:`LazyProcessor` stands for processor classes to import later.
+
 .. versionadded:: 0.9.5
 
    - Add to abstract processors such like Parsers (loaders and dumpers).
 """
+import importlib
+import importlib.util
 import typing
 
 
@@ -60,4 +66,84 @@ class Processor:
             f'prio={self.priority()}, extensions={self.extensions()!r}'
         )
 
+
+class LazyProcessor:
+    """Placeholder of a processor class not imported yet.
+
+    It provides the metadata same as the processor class it stands for
+    without importing the module defines the class, and imports the module to
+    make an instance of the class on :meth:`load`.
+    """
+
+    def __init__(self, module: str, cid: str, type_: str, priority: int = 0,
+                 extensions: typing.Iterable[str] = (),
+                 requires: typing.Iterable[str] = (),
+                 name: str = 'Parser') -> None:
+        """Initialize.
+
+        :param module: Name of the module defines the processor class
+        :param cid: Processor class ID
+        :param type_: Processor's type
+        :param priority: Processor's priority
+        :param extensions: File extensions of files it can process
+        :param requires: Names of modules the module needs
+        :param name: Name of the processor class
+        """
+        self.module = module
+        self.name = name
+        self.requires = list(requires)
+        self._cid = cid
+        self._type = type_
+        self._priority = priority
+        self._extensions = list(extensions)
+
+    def cid(self) -> str:
+        """Processor class ID."""
+        return self._cid
+
+    def type(self) -> str:
+        """Processors' type."""
+        return self._type
+
+    def priority(self) -> int:
+        """Processors's priority."""
+        return self._priority
+
+    def extensions(self) -> typing.List[str]:
+        """Get the list of file extensions of files it can process."""
+        return self._extensions
+
+    def is_available(self) -> bool:
+        """Test if the modules it needs look available without importing."""
+        for req in self.requires:
+            try:
+                if importlib.util.find_spec(req) is None:
+                    return False
+            except ImportError:  # The parent package is not found.
+                return False
+
+        return True
+
+    def load_class(self) -> typing.Type[Processor]:
+        """Import the module and get the processor class.
+
+        :raises: ImportError
+        """
+        return getattr(importlib.import_module(self.module), self.name)
+
+    def load(self) -> Processor:
+        """Make an instance of the processor class.
+
+        :raises: ImportError
+        """
+        return self.load_class()()
+
+    def __repr__(self) -> str:
+        """Provide a string representation."""
+        return (
+            f'<LazyProcessor {self.module}.{self.name} cid={self.cid()}, '
+            f'type={self.type()}, prio={self.priority()}, '
+            f'extensions={self.extensions()!r}>'
+        )
+
 # vim:sw=4:ts=4:et:
@@ -4,10 +4,18 @@
 #
 # Suppress import positions after some global variables are defined
 # pylint: disable=wrong-import-position
-"""Provide config parser objects aggregated."""
+"""Provide config parser objects aggregated.
+
+.. versionchanged:: 0.13.1
+
+   - Initialize the instance only once. Plugins are not searched again until
+     :meth:`Parsers.load_plugins` is called explicitly.
+   - Backend modules are imported on demand when parsers are needed.
+"""
+import threading
 import typing
 
-from ..backend import ParserClssT, PARSERS
+from ..backend import ParserClssT, LAZY_PARSERS
 from ..processors import Processors
 from ..singleton import Singleton
 
@@ -16,13 +24,25 @@ class Parsers(Processors, Singleton):
     """Manager class for parsers."""
 
     _pgroup: str = 'anyconfig_backends'
+    _initialized: bool = False
+    _init_lock = threading.Lock()
 
     def __init__(self, prcs: typing.Optional[ParserClssT] = None
                  ) -> None:
-        """Initialize with PARSERS."""
-        if prcs is None:
-            prcs = PARSERS
+        """Initialize with LAZY_PARSERS only once.
+
+        As this class is a singleton, :meth:`__init__` is called every time
+        :class:`Parsers` is instantiated but it initializes the instance, and
+        searches plugins, only at the first time.
+        """
+        if self._initialized:
+            return
 
-        super().__init__(prcs)
+        with self._init_lock:
+            if not self._initialized:
+                super().__init__(
+                    LAZY_PARSERS if prcs is None else prcs  # type: ignore
+                )
+                self._initialized = True
 
 # vim:sw=4:ts=4:et:
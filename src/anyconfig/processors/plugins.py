@@ -0,0 +1,226 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Discover processor plugins registered as entry points.
+
+.. versionadded:: 0.13.1
+
+Entry points of plugins are listed with :mod:`importlib.metadata` instead of
+pkg_resources which is very slow to import, and results are cached per
+interpreter. Call :func:`clear_cache` to scan them again, for example, after
+new plugins were installed in the running interpreter.
+
+The list of entry points can be kept in an on-disk manifest file also, so
+that short-lived processes such as the anyconfig CLI invoked from build
+scripts do not need to scan installed distributions at all. It's enabled by
+setting the path to the manifest file in the environment variable
+:data:`MANIFEST_ENV`, and invalidated when any entries in :data:`sys.path`
+(site-packages dirs, for example) were changed, that is, some distributions
+were installed, upgraded or removed.
+"""
+import functools
+import importlib
+import json
+import os
+import pathlib
+import re
+import sys
+import tempfile
+import typing
+import warnings
+
+
+# The environment variable to set the path to the manifest file.
+MANIFEST_ENV: str = 'ANYCONFIG_PLUGINS_MANIFEST'
+
+# Bump this if the format of the manifest file was changed.
+MANIFEST_VERSION: int = 1
+
+# (name, value), e.g. ('toml', 'anyconfig_toml.backend:Parser')
+EntryPointT = typing.Tuple[str, str]
+EntryPointsT = typing.Tuple[EntryPointT, ...]
+SignatureT = typing.List[typing.List[typing.Any]]
+
+# .. seealso:: importlib.metadata.EntryPoint.pattern
+_VALUE_RE = re.compile(
+    r'(?P<module>[\w.]+)\s*'
+    r'(:\s*(?P<attr>[\w.]+)\s*)?'
+    r'((?P<extras>\[.*\])\s*)?$'
+)
+
+
+def _scan_with_pkg_resources(group: str) -> EntryPointsT:
+    """Scan entry points with pkg_resources as a last resort."""
+    import pkg_resources  # pylint: disable=import-outside-toplevel
+
+    res = []
+    for ept in pkg_resources.iter_entry_points(group):
+        value = ept.module_name
+        if ept.attrs:
+            value += ':' + '.'.join(ept.attrs)
+
+        res.append((ept.name, value))
+
+    return tuple(res)
+
+
+def scan(group: str) -> EntryPointsT:
+    """Scan installed distributions to list entry points in ``group``.
+
+    :param group: A string represents plugin type, e.g. anyconfig_backends
+    :return: A tuple of tuples of the name and the value of entry points
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib import metadata
+    except ImportError:  # python < 3.8
+        try:
+            import importlib_metadata as metadata  # type: ignore
+        except ImportError:
+            return _scan_with_pkg_resources(group)
+
+    all_eps = metadata.entry_points()
+    eps: typing.Iterable[metadata.EntryPoint]
+    if hasattr(all_eps, 'select'):  # python >= 3.10
+        eps = all_eps.select(group=group)
+    else:  # A dict of groups and lists of entry points.
+        eps = typing.cast(
+            typing.Dict[str, typing.List[metadata.EntryPoint]], all_eps
+        ).get(group, [])
+
+    # The same distribution may be found twice if its dir appears in
+    # sys.path twice.
+    return tuple(dict.fromkeys((ept.name, ept.value) for ept in eps))
+
+
+def site_signature() -> SignatureT:
+    """Get the signature of :data:`sys.path` to invalidate the manifest.
+
+    The mtime of dirs such as site-packages changes when distributions were
+    installed into or removed from them.
+    """
+    res = []
+    for path in sys.path:
+        if not path:  # The current dir changes too often.
+            continue
+
+        try:
+            res.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            pass
+
+    return res
+
+
+def _load_manifest(manifest: pathlib.Path, sig: SignatureT
+                   ) -> typing.Dict[str, typing.List[EntryPointT]]:
+    """Load entry points from the manifest file if it's still valid."""
+    try:
+        data = json.loads(manifest.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        warnings.warn(f'Failed to load the manifest: {manifest!s}, '
+                      f'exc={exc!r}')
+        return {}
+
+    if (not isinstance(data, dict)
+            or data.get('version') != MANIFEST_VERSION
+            or data.get('signature') != sig):
+        return {}
+
+    return {group: [tuple(ept) for ept in eps]
+            for group, eps in data.get('groups', {}).items()}
+
+
+def _save_manifest(manifest: pathlib.Path, sig: SignatureT,
+                   groups: typing.Dict[str, typing.List[EntryPointT]]
+                   ) -> None:
+    """Save entry points to the manifest file atomically."""
+    content = json.dumps(dict(version=MANIFEST_VERSION, signature=sig,
+                              groups=groups))
+    tmp = None
+    try:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8',
+                                         dir=manifest.parent, suffix='.tmp',
+                                         delete=False) as out:
+            tmp = out.name
+            out.write(content)
+
+        os.replace(tmp, manifest)
+        tmp = None
+    except OSError as exc:
+        warnings.warn(f'Failed to save the manifest: {manifest!s}, '
+                      f'exc={exc!r}')
+    finally:
+        if tmp is not None:
+            os.unlink(tmp)
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_points(group: str, manifest: typing.Optional[str] = None
+                  ) -> EntryPointsT:
+    """Get the entry points in ``group`` from ``manifest`` or by scan."""
+    if not manifest:
+        return scan(group)
+
+    path = pathlib.Path(manifest).expanduser()
+    sig = site_signature()
+    groups = _load_manifest(path, sig)
+    if group in groups:
+        return tuple(groups[group])  # type: ignore
+
+    res = scan(group)
+    groups[group] = list(res)
+    _save_manifest(path, sig, groups)
+
+    return res
+
+
+def entry_points(group: str, manifest: typing.Optional[str] = None
+                 ) -> EntryPointsT:
+    """Get the entry points in ``group``.
+
+    :param group: A string represents plugin type, e.g. anyconfig_backends
+    :param manifest:
+        Path to the manifest file, or None to get it from the environment
+        variable :data:`MANIFEST_ENV`. Entry points are not kept in any
+        files if neither of them was given.
+
+    :return: A tuple of tuples of the name and the value of entry points
+    """
+    if manifest is None:
+        manifest = os.environ.get(MANIFEST_ENV)
+
+    return _entry_points(group, manifest or None)
+
+
+def clear_cache() -> None:
+    """Clear entry points cached in memory to scan them again."""
+    _entry_points.cache_clear()
+
+
+def load(value: str) -> typing.Any:
+    """Load the object the value of an entry point refers to.
+
+    :param value: A string such as 'module.name:attr.name'
+    :return: The object the value refers to
+    :raises: ImportError, ValueError
+    """
+    match = _VALUE_RE.match(value)
+    if match is None:
+        raise ValueError(f'Invalid entry point value: {value!r}')
+
+    obj = importlib.import_module(match.group('module'))
+    attrs = match.group('attr')
+    try:
+        for attr in attrs.split('.') if attrs else []:
+            obj = getattr(obj, attr)
+    except AttributeError as exc:
+        raise ImportError(str(exc)) from exc
+
+    return obj
+
+# vim:sw=4:ts=4:et:
@@ -2,17 +2,62 @@
 # Copyright (C) 2018 - 2021 Satoru SATOH <satoru.satoh @ gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""A collection of models.processor.Processor and children classes."""
+"""A collection of models.processor.Processor and children classes.
+
+.. versionchanged:: 0.13.1
+
+   - Keep indexes of processors by cid, type and file extension updated on
+     registration to find and list processors without searching and sorting
+     them every time.
+   - Allow to register :class:`anyconfig.models.processor.LazyProcessor`
+     objects imported and replaced with the processors on demand.
+"""
 import operator
+import threading
 import typing
+import warnings
 
-from . import utils
+from .. import common, ioinfo
+from ..models.processor import LazyProcessor, Processor
+from . import plugins, utils
 from .datatypes import (
     ProcT, ProcsT, ProcClsT, ProcClssT, MaybeProcT
 )
 
-if typing.TYPE_CHECKING:
-    from .. import ioinfo
+
+IndexT = typing.Dict[str, ProcsT]
+
+
+def _add_to_index(index: IndexT, keys: typing.Iterable[str], proc: ProcT
+                  ) -> None:
+    """Add ``proc`` to ``index`` under ``keys``.
+
+    Lists in ``index`` are replaced with new ones and never modified in place.
+
+    :param index: A dict of {key: [processor sorted by priority]}
+    :param keys: Keys to add ``proc`` under
+    :param proc: A processor to add
+    """
+    for key in keys:
+        index[key] = utils.insert_by_prio(index.get(key, []), proc)
+
+
+def _replace_in_index(index: IndexT, old: typing.Any,
+                      new: typing.Optional[ProcT]) -> IndexT:
+    """Make a new index from ``index`` with ``old`` replaced with ``new``.
+
+    :param index: A dict of {key: [processor sorted by priority]}
+    :param old: A processor or a placeholder of it to replace
+    :param new: A processor to replace ``old`` with, or None to remove it
+    """
+    res = {}
+    for key, prs in index.items():
+        prs = [new if p is old else p for p in prs
+               if p is not old or new is not None]
+        if prs:
+            res[key] = prs
+
+    return res
 
 
 class Processors:
@@ -27,36 +72,114 @@ class Processors:
             A list of :class:`anyconfig.models.processor.Processor` or its
             children class objects to initialize this, or None
         """
-        # {<processor_class_id>: <processor_instance>}
+        # {<processor_class_id>: <processor_instance>}, and indexes
+        # {<type or file extension>: [<processor_instance>]} each values of
+        # which are sorted by priority of processors. Keys are sorted only
+        # when they are listed.
+        #
+        # .. note::
+        #    Writers add items to these dicts under the lock, and replace
+        #    lists in the indexes with new ones instead of modifying them in
+        #    place, so that readers can get items without locking. Readers
+        #    must take the lock to iterate over them.
         self._processors: typing.Dict[str, ProcT] = {}  # type: ignore
+        self._by_type: IndexT = {}
+        self._by_ext: IndexT = {}
+        self._lock = threading.RLock()
+
         if processors is not None:
             for pcls in processors:
                 self.register(pcls)
 
-        self.load_plugins()
+        self._load_plugins()
 
     def register(self, pcls: ProcClsT) -> None:
-        """Register processor or its children class objects."""
-        if pcls.cid() not in self._processors:
-            self._processors[pcls.cid()] = pcls()
+        """Register processor or its children class objects.
 
-    def load_plugins(self) -> None:
+        :param pcls:
+            A processor class or a
+            :class:`anyconfig.models.processor.LazyProcessor` object stands
+            for a processor class to import later when it's needed
+        """
+        with self._lock:
+            if pcls.cid() in self._processors:
+                return
+
+            proc = pcls if isinstance(pcls, LazyProcessor) else pcls()
+            _add_to_index(self._by_type, [proc.type()], proc)
+            _add_to_index(self._by_ext, proc.extensions(), proc)
+            self._processors[proc.cid()] = proc
+
+    def _load_lazy(self, lazy: LazyProcessor) -> None:
+        """Import the processor ``lazy`` stands for and replace it.
+
+        ``lazy`` will be removed if it failed to import the processor.
+        """
+        with self._lock:
+            if self._processors.get(lazy.cid()) is not lazy:
+                return  # It was processed already.
+
+            proc: typing.Optional[Processor]
+            try:
+                proc = lazy.load()
+            except ImportError as exc:
+                warnings.warn(f'Failed to load {lazy!r}: {exc!r}',
+                              ImportWarning)
+                proc = None
+
+            self._by_type = _replace_in_index(self._by_type, lazy, proc)
+            self._by_ext = _replace_in_index(self._by_ext, lazy, proc)
+            self._processors = {
+                cid: proc if prc is lazy else prc
+                for cid, prc in self._processors.items()
+                if prc is not lazy or proc is not None
+            }
+
+    def _sorted_items(self, index: typing.Dict[str, typing.Any]
+                      ) -> typing.List[typing.Tuple[str, typing.Any]]:
+        """Get the items of ``index`` sorted by keys under the lock."""
+        with self._lock:
+            return sorted(index.items(), key=operator.itemgetter(0))
+
+    def _load_all(self) -> None:
+        """Import all of processors not imported yet."""
+        with self._lock:
+            procs = list(self._processors.values())
+
+        for proc in procs:
+            if isinstance(proc, LazyProcessor):
+                self._load_lazy(proc)
+
+    def _load_plugins(self) -> None:
         """Load and register pluggable processor classes internally."""
         if self._pgroup:
             for pcls in utils.load_plugins(self._pgroup):
                 self.register(pcls)
 
+    def load_plugins(self) -> None:
+        """[Re-]Load and register pluggable processor classes.
+
+        Entry points cached are cleared and scanned again so that plugins
+        installed after the initialization are found.
+        """
+        plugins.clear_cache()
+        self._load_plugins()
+
     def list(self, sort: bool = False) -> ProcClssT:
         """List processors.
 
-        :param sort: Result will be sorted if it's True
-        :return: A list of :class:`Processor` or its children classes
-        """
-        prs = self._processors.values()
-        if sort:
-            return sorted(prs, key=operator.methodcaller('cid'))
+        .. versionchanged:: 0.13.1
 
-        return list(prs)
+           The result is always sorted by cid and ``sort`` is kept only for
+           backward compatibility.
+
+        :param sort: Ignored
+        :return:
+            A list of :class:`Processor` or its children classes sorted by
+            cid
+        """
+        self._load_all()
+        return [prc for _cid, prc in self._sorted_items(self._processors)]
 
     def list_by_cid(self) -> typing.List[typing.Tuple[str, ProcsT]]:
         """List processors by those IDs.
@@ -65,9 +188,9 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             each cid, [(cid, [:class:`Processor`)]]
         """
-        prs = self._processors
-        return sorted(((cid, [prs[cid]]) for cid in sorted(prs.keys())),
-                      key=operator.itemgetter(0))
+        self._load_all()
+        return [(cid, [prc])
+                for cid, prc in self._sorted_items(self._processors)]
 
     def list_by_type(self) -> typing.List[typing.Tuple[str, ProcsT]]:
         """List processors by those types.
@@ -76,7 +199,9 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             each type, [(type, [:class:`Processor`)]]
         """
-        return utils.list_by_x(self.list(), 'type')  # type: ignore
+        self._load_all()
+        return [(typ, list(prs))
+                for typ, prs in self._sorted_items(self._by_type)]
 
     def list_by_x(self, item: typing.Optional[str] = None
                   ) -> typing.List[typing.Tuple[str, ProcsT]]:
@@ -87,18 +212,20 @@ class Processors:
             A list of :class:`Processor` or its children classes grouped by
             given 'item', [(cid, [:class:`Processor`)]] by default
         """
-        prs = self._processors
-
         if item is None or item == 'cid':  # Default.
-            res = [(cid, [prs[cid]]) for cid in sorted(prs.keys())]
+            return self.list_by_cid()
+
+        if item == 'type':
+            return self.list_by_type()
+
+        if item == 'extensions':
+            self._load_all()
+            return [(ext, list(prs))
+                    for ext, prs in self._sorted_items(self._by_ext)]
 
-        elif item in ('type', 'extensions'):
-            res = utils.list_by_x(prs.values(), typing.cast(str, item))
-        else:
-            raise ValueError("keyword argument 'item' must be one of "
-                             "None, 'cid', 'type' and 'extensions' "
-                             f"but it was '{item}'")
-        return res
+        raise ValueError("keyword argument 'item' must be one of "
+                         "None, 'cid', 'type' and 'extensions' "
+                         f"but it was '{item}'")
 
     def list_x(self, key: typing.Optional[str] = None) -> typing.List[str]:
         """List the factor 'x' of processors.
@@ -106,16 +233,69 @@ class Processors:
         :param key: Which of key to return from 'cid', 'type', and 'extention'
         :return: A list of x 'key'
         """
-        if key in ('cid', 'type'):
-            return sorted(set(operator.methodcaller(key)(p)
-                              for p in self._processors.values()))
+        if key == 'cid':
+            return [cid for cid, _prc in self._sorted_items(self._processors)]
+        if key == 'type':
+            return [typ for typ, _prs in self._sorted_items(self._by_type)]
         if key == 'extension':
-            return sorted(k for k, _v in self.list_by_x('extensions'))
+            return [ext for ext, _prs in self._sorted_items(self._by_ext)]
 
         raise ValueError("keyword argument 'key' must be one of "
                          "None, 'cid', 'type' and 'extension' "
                          f"but it was '{key}'")
 
+    def _find_by_type_or_id(self, type_or_id: str) -> ProcsT:
+        """Find the processors by types or IDs from the indexes.
+
+        :param type_or_id: Type of the data to process or ID of the processor
+        :return: A list of processors sorted by priority, never []
+        :raises: anyconfig.common.UnknownProcessorTypeError
+        """
+        prs = self._by_type.get(type_or_id, [])
+        proc = self._processors.get(type_or_id)
+        if proc is not None and proc not in prs:
+            prs = utils.insert_by_prio(prs, proc)
+
+        if not prs:
+            raise common.UnknownProcessorTypeError(type_or_id)
+
+        return prs
+
+    def _find_by_maybe_file(self, obj: 'ioinfo.PathOrIOInfoT') -> ProcsT:
+        """Find the processors by the file extension of ``obj``.
+
+        :param obj:
+            a file path, file, file-like object, pathlib.Path object or an
+            'anyconfig.ioinfo.IOInfo' (namedtuple) object
+        :return: A list of processors sorted by priority, never []
+        :raises: anyconfig.common.UnknownFileTypeError
+        """
+        fileext = ioinfo.make(obj).extension
+        prs = self._by_ext.get(fileext)
+        if not prs:
+            raise common.UnknownFileTypeError(f'file extension={fileext}')
+
+        return prs
+
+    def _findall(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
+                 forced_type: typing.Optional[str] = None
+                 ) -> ProcsT:
+        """Find all of the processors from the indexes.
+
+        The list returned may be the one in the indexes and must not be
+        modified. See also :meth:`findall`.
+        """
+        if forced_type is not None:
+            return self._find_by_type_or_id(forced_type)
+
+        if obj is None or not obj:
+            raise ValueError(
+                "The first argument 'obj' or the second argument "
+                "'forced_type' must be something other than None or False."
+            )
+
+        return self._find_by_maybe_file(obj)
+
     def findall(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
                 forced_type: typing.Optional[str] = None
                 ) -> typing.List[ProcT]:
@@ -129,7 +309,14 @@ class Processors:
         :return: A list of instances of processor classes to process 'obj'
         :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
         """
-        return utils.findall(obj, self.list(), forced_type=forced_type)
+        prs = self._findall(obj, forced_type=forced_type)
+        lazies = [p for p in prs if isinstance(p, LazyProcessor)]
+        if lazies:
+            for lazy in lazies:
+                self._load_lazy(lazy)
+            prs = self._findall(obj, forced_type=forced_type)
+
+        return list(prs)
 
     def find(self, obj: typing.Optional['ioinfo.PathOrIOInfoT'],
              forced_type: MaybeProcT = None) -> ProcT:
@@ -145,6 +332,16 @@ class Processors:
         :return: an instance of processor class to process 'obj'
         :raises: ValueError, UnknownProcessorTypeError, UnknownFileTypeError
         """
-        return utils.find(obj, self.list(), forced_type=forced_type)
+        if forced_type is None or isinstance(forced_type, str):
+            proc = self._findall(obj, forced_type=forced_type)[0]
+            while isinstance(proc, LazyProcessor):
+                self._load_lazy(proc)
+                proc = self._findall(obj, forced_type=forced_type)[0]
+
+            return proc
+
+        # A processor class or an instance was given and processors are not
+        # needed to find in this case.
+        return utils.find(obj, [], forced_type=forced_type)
 
 # vim:sw=4:ts=4:et:
@@ -8,9 +8,8 @@ import operator
 import typing
 import warnings
 
-import pkg_resources
-
 from .. import common, ioinfo, models, utils
+from . import plugins
 from .datatypes import (
     ProcT, ProcsT, ProcClsT, MaybeProcT
 )
@@ -25,6 +24,23 @@ def sort_by_prio(prs: typing.Iterable[ProcT]) -> ProcsT:
     return sorted(prs, key=operator.methodcaller('priority'), reverse=True)
 
 
+def insert_by_prio(prs: typing.Sequence[ProcT], proc: ProcT) -> ProcsT:
+    """Make a new list of processors with ``proc`` inserted into ``prs``.
+
+    The result is same as what :func:`sort_by_prio` returns for ``prs`` sorted
+    by it already and ``proc`` appended, that is, ``proc`` is placed after the
+    processors of same or higher priority.
+
+    :param prs: A list of processors sorted by priority
+    :param proc: A processor to insert
+    :return: A new list of processors sorted by priority
+    """
+    prio = proc.priority()
+    idx = next((i for i, p in enumerate(prs) if p.priority() < prio),
+               len(prs))
+    return [*prs[:idx], proc, *prs[idx:]]
+
+
 def select_by_key(
     items: typing.Iterable[
         typing.Tuple[typing.List[str], typing.Any]],
@@ -236,12 +252,17 @@ def load_plugins(pgroup: str) -> typing.Iterator[ProcClsT]:
     A generator function to yield a class object of
     :class:`anyconfig.models.processor.Processor`.
 
+    .. versionchanged:: 0.13.1
+
+       Entry points are listed with :mod:`importlib.metadata` instead of
+       pkg_resources and cached. See :mod:`anyconfig.processors.plugins`.
+
     :param pgroup: A string represents plugin type, e.g. anyconfig_backends
     """
-    for res in pkg_resources.iter_entry_points(pgroup):
+    for _name, value in plugins.entry_points(pgroup):
         try:
-            yield res.load()
-        except ImportError as exc:
+            yield plugins.load(value)
+        except (ImportError, ValueError) as exc:
             warnings.warn(f'Failed to load plugin, exc={exc!s}')
 
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,31 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Profile stages of loading to find where the time was spent.
+
+.. versionadded:: 0.13.1
+
+   - Added 'ac_profile' keyword option to load APIs to call a hook with the
+     wall clock time, the CPU time and optionally the peak memory usage of
+     each stage of loading, e.g. finding parsers, parsing and merging, for
+     each input, and :func:`profile` to profile loads in a context.
+"""
+from .datatypes import (
+    HookT, StageRecord, StageStats,
+    STAGE_IOINFO, STAGE_FIND, STAGE_RENDER, STAGE_PARSE, STAGE_SCHEMA,
+    STAGE_VALIDATE, STAGE_QUERY, STAGE_MERGE, STAGES
+)
+from .profiler import (
+    Profiler, get_hook, profile, stage
+)
+
+
+__all__ = [
+    'HookT', 'StageRecord', 'StageStats',
+    'STAGE_IOINFO', 'STAGE_FIND', 'STAGE_RENDER', 'STAGE_PARSE',
+    'STAGE_SCHEMA', 'STAGE_VALIDATE', 'STAGE_QUERY', 'STAGE_MERGE', 'STAGES',
+    'Profiler', 'get_hook', 'profile', 'stage',
+]
+
+# vim:sw=4:ts=4:et:
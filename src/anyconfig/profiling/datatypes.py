@@ -0,0 +1,63 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=inherit-non-class,too-few-public-methods
+"""Common data types for anyconfig.profiling."""
+import typing
+
+
+class StageRecord(typing.NamedTuple):
+    """A record of the time and the memory spent in a stage of loading.
+
+    :param stage: Name of the stage, one of :data:`STAGES`
+    :param input: Path or the representation of the input, or '' if the
+        stage processes all of inputs, e.g. 'validate'
+    :param wall: Wall clock time in seconds
+    :param cpu: CPU time of the thread in seconds
+    :param peak: Peak size of memory allocated in bytes, or None if it was
+        not measured
+    """
+
+    stage: str
+    input: str
+    wall: float
+    cpu: float
+    peak: typing.Optional[int] = None
+
+
+class StageStats(typing.NamedTuple):
+    """Statistics of a stage summarized from :class:`StageRecord` objects.
+
+    :param stage: Name of the stage, one of :data:`STAGES`
+    :param calls: Number of times the stage was run
+    :param wall: Total wall clock time in seconds
+    :param cpu: Total CPU time of the thread in seconds
+    :param peak: Max peak size of memory allocated in bytes, or None
+    """
+
+    stage: str
+    calls: int
+    wall: float
+    cpu: float
+    peak: typing.Optional[int] = None
+
+
+# A callable called with a :class:`StageRecord` object on each stage end.
+HookT = typing.Callable[[StageRecord], typing.Any]
+
+STAGE_IOINFO: str = 'ioinfo'
+STAGE_FIND: str = 'find'
+STAGE_RENDER: str = 'render'
+STAGE_PARSE: str = 'parse'
+STAGE_SCHEMA: str = 'schema'
+STAGE_VALIDATE: str = 'validate'
+STAGE_QUERY: str = 'query'
+STAGE_MERGE: str = 'merge'
+
+STAGES: typing.Tuple[str, ...] = (
+    STAGE_IOINFO, STAGE_FIND, STAGE_RENDER, STAGE_PARSE, STAGE_SCHEMA,
+    STAGE_VALIDATE, STAGE_QUERY, STAGE_MERGE
+)
+
+# vim:sw=4:ts=4:et:
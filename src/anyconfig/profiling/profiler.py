@@ -0,0 +1,247 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+"""Measure the time and the memory spent in each stage of loading.
+
+Load APIs call a hook given as 'ac_profile' keyword option, or the
+:class:`Profiler` object activated by :func:`profile` in the current
+context, with a :class:`StageRecord` object on the end of each stage.
+Stages are not measured at all and cost almost nothing if neither of them
+was given.
+"""
+import contextlib
+import contextvars
+import threading
+import time
+import typing
+
+from .datatypes import (
+    HookT, StageRecord, StageStats
+)
+
+
+_CURRENT: 'contextvars.ContextVar[typing.Optional[HookT]]' = \
+    contextvars.ContextVar('anyconfig_profiler', default=None)
+
+_NULL_STAGE: typing.ContextManager[None] = contextlib.nullcontext()
+
+# Stack of stages measure memory usage in each thread.
+_LOCAL = threading.local()
+
+
+def _input_name(input_: typing.Any) -> str:
+    """Get the name of the input ``input_`` to record."""
+    if input_ is None:
+        return ''
+
+    path = getattr(input_, 'path', None)  # anyconfig.ioinfo.IOInfo
+    if path:
+        return str(path)
+
+    if isinstance(input_, (list, tuple)) and not hasattr(input_, 'src'):
+        return ', '.join(_input_name(i) for i in input_)
+
+    src = getattr(input_, 'src', input_)
+    return src if isinstance(src, str) else repr(src)
+
+
+class _Stage:
+    """Context manager to measure a stage and call the hook with results."""
+
+    def __init__(self, hook: HookT, name: str, input_: typing.Any) -> None:
+        """Initialize."""
+        self.hook = hook
+        self.name = name
+        self.input = input_
+        self.memory = getattr(hook, 'memory', False)
+        self.started = False
+        (self.base, self.child_peak) = (0, 0)
+        (self.wall, self.cpu) = (0.0, 0.0)
+
+    def _start_tracing(self) -> None:
+        """Start tracing memory allocations."""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        stack = getattr(_LOCAL, 'stack', None)
+        if stack is None:
+            stack = _LOCAL.stack = []
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+
+        self.base = tracemalloc.get_traced_memory()[0]
+        if hasattr(tracemalloc, 'reset_peak'):  # python >= 3.9
+            tracemalloc.reset_peak()
+        stack.append(self)
+
+    def _stop_tracing(self) -> int:
+        """Stop tracing memory allocations and get the peak."""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        _LOCAL.stack.pop()
+        peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+        if self.started:
+            tracemalloc.stop()
+        elif _LOCAL.stack:
+            # The peak of the outer stage was reset in this stage.
+            parent = _LOCAL.stack[-1]
+            parent.child_peak = max(parent.child_peak, peak)
+
+        return max(peak - self.base, 0)
+
+    def __enter__(self) -> '_Stage':
+        """Start measurement."""
+        if self.memory:
+            self._start_tracing()
+
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *_args) -> None:
+        """Stop measurement and call the hook."""
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        peak = self._stop_tracing() if self.memory else None
+
+        self.hook(StageRecord(self.name, _input_name(self.input), wall, cpu,
+                              peak))
+
+
+def get_hook(options: typing.Mapping[str, typing.Any]
+             ) -> typing.Optional[HookT]:
+    """Get the hook to profile stages of loading.
+
+    :param options: Keyword options may contain 'ac_profile'
+    :return:
+        The hook given as 'ac_profile' option, or the one activated by
+        :func:`profile` in the current context, or None
+    """
+    hook = options.get('ac_profile')
+    if hook is None:
+        return _CURRENT.get()
+
+    return hook
+
+
+def stage(hook: typing.Optional[HookT], name: str,
+          input_: typing.Any = None) -> typing.ContextManager[typing.Any]:
+    """Make a context manager to measure a stage of loading.
+
+    :param hook: The hook :func:`get_hook` returns or None
+    :param name: Name of the stage
+    :param input_: An input processed in the stage or None
+    :return: A context manager does nothing if ``hook`` is None
+    """
+    if hook is None:
+        return _NULL_STAGE
+
+    return _Stage(hook, name, input_)
+
+
+class Profiler:
+    """Object collects :class:`StageRecord` objects as a hook.
+
+    :param memory:
+        Measure the peak memory usage with :mod:`tracemalloc` also if True.
+        It's much slower, and the peak memory usage of stages run
+        concurrently in other threads are mixed.
+    """
+
+    def __init__(self, memory: bool = False) -> None:
+        """Initialize."""
+        self.memory = memory
+        self._records: typing.List[StageRecord] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record: StageRecord) -> None:
+        """Collect ``record``."""
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def records(self) -> typing.List[StageRecord]:
+        """Get the list of records collected in order of stage ends."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """Clear records collected."""
+        with self._lock:
+            self._records = []
+
+    def summary(self) -> typing.List[StageStats]:
+        """Summarize records collected by stages.
+
+        :return: A list of :class:`StageStats` in order of the first ends
+        """
+        stats: typing.Dict[str, StageStats] = {}
+        for rec in self.records:
+            prev = stats.get(rec.stage)
+            if prev is None:
+                stats[rec.stage] = StageStats(rec.stage, 1, rec.wall,
+                                              rec.cpu, rec.peak)
+                continue
+
+            peak = prev.peak
+            if rec.peak is not None:
+                peak = rec.peak if peak is None else max(peak, rec.peak)
+
+            stats[rec.stage] = StageStats(rec.stage, prev.calls + 1,
+                                          prev.wall + rec.wall,
+                                          prev.cpu + rec.cpu, peak)
+
+        return list(stats.values())
+
+    def report(self, by_input: bool = False) -> str:
+        """Make a report of records collected in a table.
+
+        :param by_input: List all records if True or summary of stages
+        :return: A str represents the table
+        """
+        lines = [f'{"stage":<10} {"count/input":<32} {"wall ms":>10} '
+                 f'{"cpu ms":>10} {"peak KiB":>10}']
+
+        rows: typing.Iterable[typing.Tuple[str, str, float, float,
+                                           typing.Optional[int]]]
+        if by_input:
+            rows = ((r.stage, r.input, r.wall, r.cpu, r.peak)
+                    for r in self.records)
+        else:
+            rows = ((s.stage, str(s.calls), s.wall, s.cpu, s.peak)
+                    for s in self.summary())
+
+        for (name, label, wall, cpu, peak) in rows:
+            if len(label) > 32:
+                label = '...' + label[-29:]
+            kib = '-' if peak is None else f'{peak / 1024:.1f}'
+            lines.append(f'{name:<10} {label:<32} {wall * 1e3:10.3f} '
+                         f'{cpu * 1e3:10.3f} {kib:>10}')
+
+        return '\n'.join(lines)
+
+
+@contextlib.contextmanager
+def profile(memory: bool = False) -> typing.Iterator[Profiler]:
+    """Profile stages of loading in this context.
+
+    .. code-block:: python
+
+       with anyconfig.profiling.profile() as prof:
+           anyconfig.load('/etc/app/conf.d/*.yml')
+
+       print(prof.report())
+
+    :param memory: See :class:`Profiler`
+    :return: A :class:`Profiler` object collects records
+    """
+    prof = Profiler(memory=memory)
+    token = _CURRENT.set(prof)
+    try:
+        yield prof
+    finally:
+        _CURRENT.reset(token)
+
+# vim:sw=4:ts=4:et:
@@ -2,17 +2,87 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Public API to query data with JMESPath expression."""
-try:
-    from .query import try_query
-    SUPPORTED = True
-except ImportError:
-    from .default import try_query
-    SUPPORTED = False  # type: ignore
+"""Public API to query data with JMESPath expression.
+
+.. versionchanged:: 0.13.1
+
+   - The implementation using jmespath is imported on the first query, and
+     :data:`SUPPORTED` is computed on the first access to it.
+   - Added :func:`query_many` to query data with multiple expressions at
+     once.
+"""
+import functools
+import types
+import typing
+
+from ..common import InDataExT
+from . import default
+from .datatypes import (
+    JexpsT, MaybeJexp, QueryT
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_impl() -> typing.Tuple[types.ModuleType, bool]:
+    """Import the implementation module only once.
+
+    :return: A tuple of (the module, True if jmespath is available)
+    """
+    try:
+        from . import query  # pylint: disable=import-outside-toplevel
+        return (query, True)
+    except ImportError:
+        return (default, False)
+
+
+def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
+    """Try to query data with JMESPath expression `jexp`.
+
+    .. seealso:: :func:`anyconfig.query.query.try_query`
+    """
+    if jexp is None or not jexp:  # Nothing to import in this case.
+        return data
+
+    return _load_impl()[0].try_query(data, jexp, **options)
+
+
+def make_query(jexp: MaybeJexp = None, **options) -> QueryT:
+    """Make a function queries data with JMESPath expression ``jexp``.
+
+    It's faster than :func:`try_query` to query many data with same
+    expression.
+
+    .. versionadded:: 0.13.1
+
+    .. seealso:: :func:`anyconfig.query.query.make_query`
+    """
+    if jexp is None or not jexp:
+        return lambda data: data
+
+    return _load_impl()[0].make_query(jexp, **options)
+
+
+def query_many(data: InDataExT, jexps: JexpsT, **options
+               ) -> typing.Dict[str, InDataExT]:
+    """Query data with multiple JMESPath expressions at once.
+
+    .. versionadded:: 0.13.1
+
+    .. seealso:: :func:`anyconfig.query.query.query_many`
+    """
+    return _load_impl()[0].query_many(data, jexps, **options)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Compute :data:`SUPPORTED` on access."""
+    if name == 'SUPPORTED':
+        return _load_impl()[1]
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 __all__ = [
-    'try_query',
+    'try_query', 'make_query', 'query_many', 'QueryT',
 ]
 
 # vim:sw=4:ts=4:et:
@@ -8,4 +8,11 @@ import typing
 
 MaybeJexp = typing.Optional[typing.Union[str, bool]]
 
+# Names and JMESPath expressions given to query_many.
+JexpsT = typing.Union[typing.Mapping[str, MaybeJexp],
+                      typing.Iterable[typing.Tuple[str, MaybeJexp]]]
+
+# A function queries given data, made by make_query.
+QueryT = typing.Callable[[typing.Any], typing.Any]
+
 # vim:sw=4:ts=4:et:
@@ -4,12 +4,27 @@
 #
 # pylint: disable=unused-argument
 """Provide dummy implementation of anyconfig.query.*."""
+import typing
+
 from ..common import InDataExT
-from .datatypes import MaybeJexp
+from .datatypes import (
+    JexpsT, MaybeJexp, QueryT
+)
 
 
 def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
     """Provide a dummy implementation of :func:`anyconfig.query.try_query`."""
     return data
 
+
+def make_query(jexp: MaybeJexp = None, **options) -> QueryT:
+    """Provide a dummy implementation of :func:`anyconfig.query.make_query`."""
+    return lambda data: data
+
+
+def query_many(data: InDataExT, jexps: JexpsT, **options
+               ) -> typing.Dict[str, InDataExT]:
+    """Provide a dummy implementation of :func:`anyconfig.query.query_many`."""
+    return {name: data for name in dict(jexps)}
+
 # vim:sw=4:ts=4:et:
@@ -10,7 +10,13 @@ Changelog:
 .. versionadded:: 0.8.3
 
    - Added to query config data with JMESPath expression, http://jmespath.org
+
+.. versionadded:: 0.13.1
+
+   - Compiled expressions are cached and reused.
+   - Added :func:`query_many` to query data with multiple expressions.
 """
+import functools
 import typing
 import warnings
 
@@ -20,7 +26,34 @@ from ..common import (
     InDataExT, InDataT
 )
 from ..utils import is_dict_like
-from .datatypes import MaybeJexp
+from .datatypes import (
+    JexpsT, MaybeJexp, QueryT
+)
+
+
+# Max number of compiled expressions to cache.
+COMPILE_CACHE_SIZE: int = 256
+
+
+@functools.lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_(jexp: str) -> typing.Any:
+    """Compile JMESPath expression ``jexp`` and cache the result.
+
+    :param jexp: a string represents JMESPath expression
+    :return: A jmespath.parser.ParsedResult object
+    :raises: ValueError (jmespath.exceptions.ParseError) if ``jexp`` is wrong
+    """
+    return jmespath.compile(jexp)
+
+
+def _search(pexp: typing.Any, data: InDataExT) -> InDataExT:
+    """Search ``data`` with compiled expression ``pexp``."""
+    try:
+        return pexp.search(data)
+    except ValueError:
+        raise
+    except BaseException:  # noqa: E722
+        return None
 
 
 def try_query(data: InDataExT, jexp: MaybeJexp = None, **options) -> InDataExT:
@@ -57,7 +90,7 @@ def query(data: InDataT, jexp: str, **_options
     """
     exc: typing.Optional[Exception] = None
     try:
-        pexp = jmespath.compile(jexp)
+        pexp = compile_(jexp)
         return (pexp.search(data), exc)
 
     except ValueError as exc:  # jmespath.exceptions.*Error inherit from it.
@@ -66,4 +99,57 @@ def query(data: InDataT, jexp: str, **_options
     except BaseException:  # noqa: E722
         return (None, exc)
 
+
+def make_query(jexp: MaybeJexp = None, **_options) -> QueryT:
+    """Make a function queries data with JMESPath expression ``jexp``.
+
+    The function made works same as :func:`try_query` with ``jexp``, but the
+    expression is compiled only once.
+
+    :param jexp: a string represents JMESPath expression
+    :return: A function takes data and returns the query result
+    :raises: ValueError (jmespath.exceptions.ParseError) if ``jexp`` is wrong
+    """
+    if jexp is None or not jexp:
+        return lambda data: data
+
+    pexp = compile_(typing.cast(str, jexp))
+
+    def query_(data: InDataExT) -> InDataExT:
+        """Query ``data``."""
+        if not is_dict_like(data):
+            warnings.warn('Could not query because given data is not '
+                          f'a mapping object (type? {type(data)}')
+            return data
+
+        return _search(pexp, data)
+
+    return query_
+
+
+def query_many(data: InDataExT, jexps: JexpsT, **_options
+               ) -> typing.Dict[str, InDataExT]:
+    """Query ``data`` with multiple JMESPath expressions at once.
+
+    Each result is same as the one :func:`try_query` gives with each
+    expression, but the expressions are compiled and cached, and ``data`` is
+    checked only once.
+
+    :param data: Target object (a dict or a dict-like object) to query
+    :param jexps:
+        A mapping object of names and JMESPath expressions, or an iterable
+        of pairs of them
+    :return: A dict of names and query results
+    :raises: ValueError (jmespath.exceptions.*Error) if some of ``jexps``
+        are wrong
+    """
+    djexps: typing.Dict[str, MaybeJexp] = dict(jexps)
+    if not is_dict_like(data):
+        warnings.warn('Could not query because given data is not '
+                      f'a mapping object (type? {type(data)}')
+        return {name: data for name in djexps}
+
+    return {name: _search(compile_(jexp), data) if jexp else data
+            for name, jexp in djexps.items()}
+
 # vim:sw=4:ts=4:et:
@@ -2,17 +2,114 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Misc global constants, variables, classes and so on."""
-try:
-    from .jsonschema import validate, is_valid, gen_schema
-    SUPPORTED: bool = True
-except ImportError:
-    from .default import validate, is_valid, gen_schema
-    SUPPORTED = False  # type: ignore
+"""Misc global constants, variables, classes and so on.
+
+.. versionchanged:: 0.13.1
+
+   - The implementation using jsonschema is imported on the first use of the
+     functions, and :data:`SUPPORTED` is computed on the first access to it.
+"""
+import functools
+import types
+import typing
+
+from .. import metrics
+from ..common import (
+    InDataT, InDataExT
+)
+from . import default
+from .datatypes import (
+    ResultT, ValidatorT
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_impl() -> typing.Tuple[types.ModuleType, bool]:
+    """Import the implementation module only once.
+
+    :return: A tuple of (the module, True if jsonschema is available)
+    """
+    try:
+        from . import jsonschema  # pylint: disable=import-outside-toplevel
+        return (jsonschema, True)
+    except ImportError:
+        return (default, False)
+
+
+def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
+             ac_schema_errors: bool = False, **options: typing.Any
+             ) -> ResultT:
+    """Validate target object ``data`` with given schema object ``schema``.
+
+    .. seealso:: :func:`anyconfig.schema.jsonschema.validate`
+    """
+    return _load_impl()[0].validate(
+        data, schema, ac_schema_safe=ac_schema_safe,
+        ac_schema_errors=ac_schema_errors, **options
+    )
+
+
+def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
+             ac_schema_errors: bool = False, **options) -> bool:
+    """Test if target object ``data`` is valid with schema ``schema``.
+
+    .. seealso:: :func:`anyconfig.schema.jsonschema.is_valid`
+    """
+    res = _load_impl()[0].is_valid(
+        data, schema, ac_schema_safe=ac_schema_safe,
+        ac_schema_errors=ac_schema_errors, **options
+    )
+    if not res:
+        metrics.inc(metrics.VALIDATION_FAILURES)
+
+    return res
+
+
+def make_validator(schema: InDataT, ac_schema_safe: bool = True,
+                   ac_schema_errors: bool = False, **options) -> ValidatorT:
+    """Make a function tests if data is valid with schema ``schema``.
+
+    It's faster than :func:`is_valid` to validate many data with same schema.
+
+    .. versionadded:: 0.13.1
+
+    .. seealso:: :func:`anyconfig.schema.jsonschema.make_validator`
+    """
+    impl_validator = _load_impl()[0].make_validator(
+        schema, ac_schema_safe=ac_schema_safe,
+        ac_schema_errors=ac_schema_errors, **options
+    )
+
+    def validator(data: InDataExT) -> bool:
+        """Test if ``data`` is valid and count failures."""
+        res = impl_validator(data)
+        if not res:
+            metrics.inc(metrics.VALIDATION_FAILURES)
+
+        return res
+
+    return validator
+
+
+def gen_schema(data: InDataExT, **options) -> InDataT:
+    """Generate a JSON schema object from ``data``.
+
+    .. seealso:: :func:`anyconfig.schema.jsonschema.gen_schema`
+    """
+    return _load_impl()[0].gen_schema(data, **options)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Compute :data:`SUPPORTED` on access."""
+    if name == 'SUPPORTED':
+        return _load_impl()[1]
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 __all__ = [
-    'validate', 'is_valid', 'gen_schema', 'SUPPORTED'
+    'validate', 'is_valid', 'make_validator', 'gen_schema', 'SUPPORTED',
+    'ValidatorT',
 ]
 
 # vim:sw=4:ts=4:et:
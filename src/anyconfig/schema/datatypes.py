@@ -8,4 +8,7 @@ import typing
 
 ResultT = typing.Tuple[bool, typing.Union[str, typing.List[str]]]
 
+# A function tests if given data is valid, made by make_validator.
+ValidatorT = typing.Callable[[typing.Any], bool]
+
 # vim:sw=4:ts=4:et:
@@ -9,7 +9,9 @@ import typing
 from ..common import (
     InDataT, InDataExT
 )
-from .datatypes import ResultT
+from .datatypes import (
+    ResultT, ValidatorT
+)
 
 
 def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
@@ -25,6 +27,12 @@ def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     return True
 
 
+def make_validator(schema: InDataT, ac_schema_safe: bool = True,
+                   ac_schema_errors: bool = False, **options) -> ValidatorT:
+    """Provide a dummy function makes a function never invalidate data."""
+    return lambda _data: True
+
+
 def gen_schema(data: InDataExT, **options) -> InDataT:
     """Provide a dummy function generates an empty dict in actual."""
     return {}
@@ -10,10 +10,25 @@
            **options) -> typing.Tuple[bool, str]:
   validate with schema
 
+- make_validator(schema: typing.Dict[str, typing.Any],
+                 ac_schema_safe: bool = True, ac_schema_errors: bool = False,
+                 **options) -> typing.Callable[[typing.Any], bool]:
+  make a function validates data with schema checked only once
+
 - gen_schema(data: typing.Dict[str, typing.Any],
              **options) -> typing.Dict[str, typing.Any]:
   Generate an object represents a schema
+
+.. versionchanged:: 0.13.1
+
+   - Validator objects of jsonschema are cached per schema content, so that
+     schemas are checked only once by :func:`validate`, :func:`is_valid`
+     and :func:`make_validator`.
 """
+import collections
+import copy
+import json
+import threading
 import typing
 import warnings
 
@@ -25,7 +40,72 @@ from ..common import (
 from ..utils import (
     filter_options, is_dict_like, is_list_like
 )
-from .datatypes import ResultT
+from .datatypes import (
+    ResultT, ValidatorT
+)
+
+
+# Max number of validator objects to cache.
+VALIDATOR_CACHE_SIZE: int = 64
+
+_VALIDATORS: 'collections.OrderedDict[typing.Hashable, typing.Any]' = \
+    collections.OrderedDict()
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _schema_key(schema: InDataT) -> str:
+    """Make a str represents the content of ``schema`` to key the cache."""
+    try:
+        return json.dumps(schema, sort_keys=True, default=repr)
+    except (TypeError, ValueError):  # e.g. keys of different types.
+        return repr(schema)
+
+
+def _make_validator_object(schema: InDataT, ac_schema_errors: bool = False,
+                           cls: typing.Any = None) -> typing.Any:
+    """Make a validator object of jsonschema.
+
+    :raises: jsonschema.SchemaError and so on if ``schema`` was wrong
+    """
+    if ac_schema_errors:
+        return jsonschema.Draft7Validator(schema)
+
+    cls = cls or jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema, format_checker=jsonschema.draft7_format_checker)
+
+
+def _get_validator_object(schema: InDataT, ac_schema_errors: bool = False,
+                          cls: typing.Any = None) -> typing.Any:
+    """Get the validator object for ``schema`` from the cache or make it.
+
+    Validator objects are cached per the content of ``schema`` so that the
+    schema is checked only once. Wrong schemas are not cached.
+
+    :raises: jsonschema.SchemaError and so on if ``schema`` was wrong
+    """
+    key = (_schema_key(schema), ac_schema_errors, cls)
+    with _VALIDATORS_LOCK:
+        vldtr = _VALIDATORS.get(key)
+        if vldtr is not None:
+            _VALIDATORS.move_to_end(key)
+            return vldtr
+
+    # Copy it not to affect cached one by changes to ``schema`` later.
+    vldtr = _make_validator_object(copy.deepcopy(schema), ac_schema_errors,
+                                   cls)
+    with _VALIDATORS_LOCK:
+        _VALIDATORS[key] = vldtr
+        while len(_VALIDATORS) > VALIDATOR_CACHE_SIZE:
+            _VALIDATORS.popitem(last=False)
+
+    return vldtr
+
+
+def clear_cache() -> None:
+    """Clear the cache of validator objects."""
+    with _VALIDATORS_LOCK:
+        _VALIDATORS.clear()
 
 
 def _validate_all(data: InDataExT, schema: InDataT, **_options) -> ResultT:
@@ -37,7 +117,8 @@ def _validate_all(data: InDataExT, schema: InDataT, **_options) -> ResultT:
     :seealso: https://python-jsonschema.readthedocs.io/en/latest/validate/,
     a section of 'iter_errors' especially
     """
-    vldtr = jsonschema.Draft7Validator(schema)  # :raises: SchemaError, ...
+    # :raises: SchemaError, ...
+    vldtr = _get_validator_object(schema, ac_schema_errors=True)
     errors = list(vldtr.iter_errors(data))
 
     return (not errors, [err.message for err in errors])
@@ -50,13 +131,14 @@ def _validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     See the description of :func:`validate` for more details of parameters and
     return value.
 
-    Validate target object 'data' with given schema object.
+    Validate target object 'data' with given schema object. It works same as
+    jsonschema.validate but the validator object is cached.
     """
     try:
-        jsonschema.validate(
-            data, schema, format_checker=jsonschema.draft7_format_checker,
-            **options
-        )
+        vldtr = _get_validator_object(schema, cls=options.get('cls'))
+        err = jsonschema.exceptions.best_match(vldtr.iter_errors(data))
+        if err is not None:
+            raise err
     except (jsonschema.ValidationError, jsonschema.SchemaError,
             Exception) as exc:
         if ac_schema_safe:
@@ -95,6 +177,21 @@ def validate(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
     return _validate(data, schema, ac_schema_safe, **options)
 
 
+def _check_result(schema: InDataT,
+                  error_or_errors: typing.Union[str, typing.List[str]],
+                  ac_schema_safe: bool = True) -> bool:
+    """Warn or raise ValidationError if ``error_or_errors`` is not empty."""
+    if error_or_errors:
+        msg = f'scm={schema!s}, err={error_or_errors!s}'
+        if ac_schema_safe:
+            warnings.warn(msg)
+            return False
+
+        raise ValidationError(msg)
+
+    return True
+
+
 def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
              ac_schema_errors: bool = False, **options) -> bool:
     """Raise ValidationError if ``data`` was invalidated by schema `schema`."""
@@ -105,15 +202,66 @@ def is_valid(data: InDataExT, schema: InDataT, ac_schema_safe: bool = True,
         data, schema, ac_schema_safe=True,
         ac_schema_errors=ac_schema_errors, **options
     )
-    if error_or_errors:
-        msg = f'scm={schema!s}, err={error_or_errors!s}'
-        if ac_schema_safe:
-            warnings.warn(msg)
-            return False
+    return _check_result(schema, error_or_errors, ac_schema_safe)
 
-        raise ValidationError(msg)
 
-    return True
+def _make_errors_fn(schema: InDataT, ac_schema_errors: bool = False,
+                    **options: typing.Any
+                    ) -> typing.Callable[[InDataExT],
+                                         typing.Union[str, typing.List[str]]]:
+    """Make a function returns errors of data same as :func:`validate`.
+
+    :raises: jsonschema.SchemaError and so on if ``schema`` was wrong
+    """
+    vldtr = _get_validator_object(schema, ac_schema_errors,
+                                  options.get('cls'))
+    if ac_schema_errors:
+        return lambda data: [err.message for err in vldtr.iter_errors(data)]
+
+    def get_error(data: InDataExT) -> str:
+        """Get the error jsonschema.validate raises if any."""
+        err = jsonschema.exceptions.best_match(vldtr.iter_errors(data))
+        return '' if err is None else str(err)
+
+    return get_error
+
+
+def make_validator(schema: InDataT, ac_schema_safe: bool = True,
+                   ac_schema_errors: bool = False, **options) -> ValidatorT:
+    """Make a function tests if data is valid with ``schema``.
+
+    The function made works same as :func:`is_valid` with ``schema`` and
+    other arguments given, but the schema is checked and the validator
+    object of jsonschema is made only once.
+
+    :param schema: Schema object
+    :param options: See :func:`validate`
+    :return: A function takes data and returns True if it's valid
+    """
+    if schema is None or not schema:
+        return lambda _data: True
+
+    options = filter_options(('cls', ), options)
+    errors_fn: typing.Callable[[InDataExT],
+                               typing.Union[str, typing.List[str]]]
+    try:
+        errors_fn = _make_errors_fn(schema, ac_schema_errors, **options)
+    except Exception as exc:  # pylint: disable=broad-except
+        # The schema is wrong and any data will be invalidated as
+        # :func:`is_valid` does.
+        schema_error = str(exc)
+        errors_fn = lambda _data: schema_error  # noqa: E731
+
+    def validator(data: InDataExT) -> bool:
+        """Test if ``data`` is valid."""
+        try:
+            error_or_errors = errors_fn(data)
+        except Exception as exc:  # pylint: disable=broad-except
+            error_or_errors = str(exc)
+
+        return _check_result(schema, error_or_errors, ac_schema_safe)
+
+    return validator
 
 
 _SIMPLETYPE_MAP: typing.Dict[typing.Any, str] = {
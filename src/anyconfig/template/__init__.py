@@ -2,17 +2,61 @@
 # Copyright (C) 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-"""Misc global constants, variables, classes and so on."""
-try:
-    from .jinja2 import try_render
-    SUPPORTED: bool = True
-except ImportError:  # jinja2 may not be available.
-    SUPPORTED = False  # type: ignore
-
-    def try_render(*_args, **_kwargs) -> None:  # type: ignore
-        """Provide a dummy function does nothing but returns None."""
+"""Misc global constants, variables, classes and so on.
+
+.. versionchanged:: 0.13.1
+
+   - The implementation using jinja2 is imported on the first use of
+     :func:`try_render`, and :data:`SUPPORTED` is computed on the first access
+     to it.
+"""
+import functools
+import types
+import typing
+
+from .. import metrics
+
+
+@functools.lru_cache(maxsize=None)
+def _load_impl() -> typing.Optional[types.ModuleType]:
+    """Import the implementation module only once.
+
+    :return: The module or None if jinja2 is not available
+    """
+    try:
+        from . import jinja2  # pylint: disable=import-outside-toplevel
+        return jinja2
+    except ImportError:  # jinja2 may not be available.
+        return None
+
+
+def try_render(filepath: typing.Optional[str] = None,
+               content: typing.Optional[str] = None,
+               **options) -> typing.Optional[str]:
+    """Compile and render template and return the result as a string.
+
+    It does nothing but returns None if jinja2 is not available.
+
+    .. seealso:: :func:`anyconfig.template.jinja2.try_render`
+    """
+    impl = _load_impl()
+    if impl is None:
         return None
 
+    res = impl.try_render(filepath=filepath, content=content, **options)
+    metrics.inc(metrics.TEMPLATE_RENDERS,
+                metrics.RENDER_FAILED if res is None else metrics.RENDER_OK)
+
+    return res
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Compute :data:`SUPPORTED` on access."""
+    if name == 'SUPPORTED':
+        return _load_impl() is not None
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 __all__ = [
     'try_render',
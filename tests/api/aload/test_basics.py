@@ -0,0 +1,83 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import asyncio
+import concurrent.futures
+import pathlib
+import tempfile
+import unittest
+
+import anyconfig.api._adump as DT
+import anyconfig.api._aload as TT
+import anyconfig.api._load
+
+from anyconfig.api import UnknownFileTypeError
+
+from ... import base
+
+
+RES_DIR = base.RES_DIR / 'multi_load' / 'basics' / '00'
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.inputs = sorted(RES_DIR.glob('*.json'))
+
+    def test_asingle_load(self):
+        for inp in self.inputs:
+            self.assertEqual(run(TT.asingle_load(inp)),
+                             anyconfig.api._load.single_load(inp))
+
+    def test_amulti_load(self):
+        self.assertEqual(run(TT.amulti_load(self.inputs)),
+                         anyconfig.api._load.multi_load(self.inputs))
+
+    def test_aload(self):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as exe:
+            for path_specs in (self.inputs[0], self.inputs,
+                               RES_DIR / '*.json'):
+                self.assertEqual(
+                    run(TT.aload(path_specs, ac_executor=exe,
+                                 ac_merge='merge_dicts_and_lists')),
+                    anyconfig.api._load.load(path_specs,
+                                             ac_merge='merge_dicts_and_lists')
+                )
+
+    def test_aload__gather(self):
+        async def _load_all():
+            return await asyncio.gather(
+                *(TT.aload(inp) for inp in self.inputs)
+            )
+
+        self.assertEqual(run(_load_all()),
+                         [anyconfig.api._load.load(i) for i in self.inputs])
+
+    def test_aload__failures(self):
+        with self.assertRaises(ValueError):
+            run(TT.aload([]))
+
+        with self.assertRaises(UnknownFileTypeError):
+            run(TT.aload('dummy.txt'))
+
+    def test_aloads(self):
+        self.assertEqual(run(TT.aloads('{"a": 1}', ac_parser='json')),
+                         {'a': 1})
+
+    def test_adump_and_adumps(self):
+        data = {'a': 1, 'b': [1, 2]}
+        self.assertEqual(run(DT.adumps(data, ac_parser='json')),
+                         '{"a": 1, "b": [1, 2]}')
+
+        with tempfile.TemporaryDirectory() as tdir:
+            out = pathlib.Path(tdir) / 'out.json'
+            run(DT.adump(data, out))
+            self.assertEqual(run(TT.aload(out)), data)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,81 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import io
+import json
+import pathlib
+import tempfile
+import types
+import unittest
+
+import anyconfig.api._iter_load as TT
+import anyconfig.backend.json.common
+
+from anyconfig.api import UnknownFileTypeError
+
+
+DATA = [{'a': 1, 'b': [1, 2]}, {'a': 2, 'c': {'d': 'D'}}, {'a': 3}]
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.workdir = pathlib.Path(self.tdir.name)
+
+    def tearDown(self):
+        self.tdir.cleanup()
+
+    def test_iter_load_ndjson(self):
+        path = self.workdir / 'a.json'
+        path.write_text('\n'.join(json.dumps(d) for d in DATA) + '\n')
+
+        res = TT.iter_load(path)
+        self.assertIsInstance(res, types.GeneratorType)
+        self.assertEqual(list(res), DATA)
+
+    def test_iter_load_ndjson_extensions(self):
+        for ext in ('ndjson', 'jsonl'):
+            path = self.workdir / f'a.{ext}'
+            path.write_text('\n'.join(json.dumps(d) for d in DATA) + '\n')
+            self.assertEqual(list(TT.iter_load(path)), DATA)
+
+    def test_iter_load_concatenated_json(self):
+        content = '  '.join(json.dumps(d, indent=2) for d in DATA) + '12 [3]'
+        res = TT.iter_load(io.StringIO(content), ac_parser='json')
+        self.assertEqual(list(res), DATA + [12, [3]])
+
+    def test_iter_load_json_in_small_chunks(self):
+        content = ''.join(json.dumps(d) for d in DATA) + '123'
+        res = anyconfig.backend.json.common.load_iter(io.StringIO(content),
+                                                      chunk_size=3)
+        self.assertEqual(list(res), DATA + [123])
+
+    def test_iter_load_broken_json(self):
+        res = TT.iter_load(io.StringIO('{"a": 1} {"b": '), ac_parser='json')
+        self.assertEqual(next(res), {'a': 1})
+        with self.assertRaises(ValueError):
+            next(res)
+
+    def test_iter_load_yaml(self):
+        path = self.workdir / 'a.yml'
+        path.write_text('a: 1\n---\na: 2\n---\n')
+        self.assertEqual(list(TT.iter_load(path)), [{'a': 1}, {'a': 2}, {}])
+
+    def test_iter_load_single_document(self):
+        path = self.workdir / 'a.ini'
+        path.write_text('[x]\na = 1\n')
+        self.assertEqual(list(TT.iter_load(path)), [{'x': {'a': '1'}}])
+
+    def test_iter_load_missing_file(self):
+        path = self.workdir / 'not_exist.json'
+        self.assertEqual(list(TT.iter_load(path, ac_ignore_missing=True)),
+                         [])
+
+    def test_iter_load_unknown_type(self):
+        with self.assertRaises(UnknownFileTypeError):
+            list(TT.iter_load(self.workdir / 'a.unknown_type'))
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,46 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import anyconfig.api._dump as DUMP
+import anyconfig.api._load as TT
+
+from anyconfig.dicts import FrozenDict
+
+from . import common
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return TT.multi_load(*args, ac_frozen=True, **kwargs)
+
+    def test_multi_load_returns_frozen_dict(self):
+        for tdata in self.each_data():
+            res = TT.multi_load(tdata.inputs, ac_frozen=True, **tdata.opts)
+            self.assertIsInstance(res, FrozenDict)
+            self.assertEqual(res, tdata.exp)
+            self.assertEqual(hash(res), hash(FrozenDict(tdata.exp)))
+
+    def test_multi_load_with_ac_layered(self):
+        for tdata in self.each_data():
+            res = TT.multi_load(tdata.inputs, ac_frozen=True,
+                                ac_layered=True, **tdata.opts)
+            self.assertIsInstance(res, FrozenDict)
+            self.assertEqual(res, tdata.exp)
+
+    def test_multi_load_from_empty_inputs(self):
+        res = TT.multi_load([], ac_frozen=True)
+        self.assertEqual(res, FrozenDict())
+
+    def test_dumps_frozen_dict(self):
+        for tdata in self.each_data():
+            res = TT.multi_load(tdata.inputs, ac_frozen=True, **tdata.opts)
+            self.assertEqual(
+                TT.loads(DUMP.dumps(res, ac_parser='json'), ac_parser='json'),
+                tdata.exp
+            )
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,36 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import anyconfig.api._load as TT
+
+from anyconfig.dicts import LayeredDict
+
+from . import common
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return TT.multi_load(*args, ac_layered=True, **kwargs)
+
+    def test_multi_load_returns_layered_dict(self):
+        for tdata in self.each_data():
+            res = TT.multi_load(tdata.inputs, ac_layered=True, **tdata.opts)
+            self.assertIsInstance(res, LayeredDict)
+            self.assertEqual(res.materialize(), tdata.exp)
+
+    def test_multi_load_with_ac_template(self):
+        for tdata in self.each_data():
+            res = TT.multi_load(tdata.inputs, ac_layered=True,
+                                ac_template=True, **tdata.opts)
+            self.assertNotIsInstance(res, LayeredDict)
+
+
+class MultiTypesTestCase(TestCase):
+    kind = 'multi_types'
+    pattern = '*.*'
+
+# vim:sw=4:ts=4:et:
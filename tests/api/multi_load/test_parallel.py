@@ -0,0 +1,87 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring, protected-access
+import unittest.mock
+
+import anyconfig.api._load as TT
+
+from . import common
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return TT.multi_load(*args, ac_parallel=True, **kwargs)
+
+    def setUp(self):
+        super().setUp()
+        # Test data are too small to load in parallel.
+        patcher = unittest.mock.patch.object(TT, 'PARALLEL_MIN_SIZE', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_multi_load_with_wrong_parallel_type(self):
+        for tdata in self.each_data():
+            with self.assertRaises(ValueError):
+                TT.multi_load(tdata.inputs, ac_parallel='wrong_type')
+
+    def test_multi_load_from_streams(self):
+        for tdata in self.each_data():
+            self.assertEqual(
+                TT.multi_load([i.open() for i in tdata.inputs],
+                              ac_parallel=TT.PARALLEL_PROCESS, **tdata.opts),
+                tdata.exp
+            )
+
+    def test_multi_load_in_processes(self):
+        for tdata in self.each_data():
+            self.assertEqual(
+                TT.multi_load(tdata.inputs, ac_parallel=TT.PARALLEL_PROCESS,
+                              ac_workers=2, **tdata.opts),
+                tdata.exp
+            )
+
+    def test_multi_load_with_ac_template(self):
+        for tdata in self.each_data():
+            with unittest.mock.patch.object(TT, '_load_in_parallel') as mck:
+                TT.multi_load(tdata.inputs, ac_parallel=True,
+                              ac_template=True, **tdata.opts)
+                mck.assert_not_called()
+
+    def test_multi_load_shares_executors(self):
+        for tdata in self.each_data():
+            TT.multi_load(tdata.inputs, ac_parallel=True, ac_workers=3,
+                          **tdata.opts)
+            executor = TT._get_executor(False, 3)
+            with unittest.mock.patch.object(
+                executor, 'submit', wraps=executor.submit
+            ) as submit:
+                self.assertEqual(
+                    TT.multi_load(tdata.inputs, ac_parallel=True,
+                                  ac_workers=3, **tdata.opts),
+                    tdata.exp
+                )
+                self.assertEqual(submit.call_count, len(tdata.inputs))
+
+    def test_multi_load_small_files_sequentially(self):
+        for tdata in self.each_data():
+            with unittest.mock.patch.object(TT, 'PARALLEL_MIN_SIZE', 1 << 20):
+                with unittest.mock.patch.object(
+                    TT, '_load_in_parallel'
+                ) as mck:
+                    self.assertEqual(
+                        TT.multi_load(tdata.inputs, ac_parallel=True,
+                                      **tdata.opts),
+                        tdata.exp
+                    )
+                    mck.assert_not_called()
+
+
+class MultiTypesTestCase(TestCase):
+    kind = 'multi_types'
+    pattern = '*.*'
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,53 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import unittest.mock
+
+import anyconfig.api._load as TT
+
+from anyconfig import ioinfo
+from anyconfig.profiling import (
+    Profiler, STAGE_IOINFO, STAGE_MERGE, STAGE_PARSE
+)
+
+from . import common
+
+
+class TestCase(common.TestCase):
+
+    @staticmethod
+    def target_fn(*args, **kwargs):
+        return TT.multi_load(*args, ac_profile=Profiler(), **kwargs)
+
+    def test_multi_load_records_stages(self):
+        for tdata in self.each_data():
+            prof = Profiler()
+            TT.multi_load(tdata.inputs, ac_profile=prof, **tdata.opts)
+
+            recs = prof.records
+            self.assertEqual(
+                [r.input for r in recs if r.stage == STAGE_PARSE],
+                [ioinfo.make(i).path for i in tdata.inputs]
+            )
+            self.assertEqual(
+                len([r for r in recs if r.stage == STAGE_MERGE]),
+                len(tdata.inputs)
+            )
+            self.assertEqual(
+                len([r for r in recs if r.stage == STAGE_IOINFO]), 1
+            )
+
+    @unittest.mock.patch.object(TT, 'PARALLEL_MIN_SIZE', 0)
+    def test_multi_load_in_parallel_records_stages(self):
+        for tdata in self.each_data():
+            prof = Profiler()
+            TT.multi_load(tdata.inputs, ac_profile=prof,
+                          ac_parallel=TT.PARALLEL_PROCESS, **tdata.opts)
+            self.assertEqual(
+                len([r for r in prof.records if r.stage == STAGE_PARSE]),
+                len(tdata.inputs)
+            )
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,115 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+import collections
+import io
+import json
+import pathlib
+import tempfile
+import unittest
+
+import anyconfig.api._prepare as TT
+import anyconfig.profiling
+import anyconfig.query
+import anyconfig.schema
+import anyconfig.template
+
+from anyconfig.api import UnknownFileTypeError
+
+
+DATA = dict(a=1, b=[1, 2], c=dict(d='D'))
+SCHEMA = {'type': 'object', 'properties': {'a': {'type': 'integer'}}}
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.workdir = pathlib.Path(self.tdir.name)
+        self.path = self.workdir / 'a.json'
+        self.path.write_text(json.dumps(DATA))
+
+    def tearDown(self):
+        self.tdir.cleanup()
+
+    def test_prepare(self):
+        load = TT.prepare()
+        self.assertIsInstance(load, TT.PreparedLoader)
+        for _ in range(2):
+            self.assertEqual(load(self.path), DATA)
+            self.assertEqual(load(str(self.path)), DATA)
+
+        with self.assertRaises(UnknownFileTypeError):
+            load(self.workdir / 'a.unknown_ext')
+
+    def test_prepare_with_parser(self):
+        load = TT.prepare(ac_parser='json', ac_ordered=True)
+        with self.path.open() as inp:
+            res = load(inp)
+
+        self.assertEqual(res, DATA)
+        self.assertIsInstance(res, collections.OrderedDict)
+        self.assertEqual(load(io.StringIO('{"x": 1}')), dict(x=1))
+        self.assertEqual(load.loads('{"x": 1}'), dict(x=1))
+
+    def test_prepare_with_ac_dict(self):
+        load = TT.prepare(ac_dict=collections.OrderedDict)
+        self.assertIsInstance(load(self.path), collections.OrderedDict)
+
+    def test_loads_without_parser(self):
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(TT.prepare().loads('{}'))
+
+    def test_prepare_with_ignore_missing(self):
+        load = TT.prepare(ac_ignore_missing=True)
+        self.assertEqual(load(self.workdir / 'not_exist.json'), {})
+
+    def test_prepare_with_cache(self):
+        cache = anyconfig.Cache()
+        load = TT.prepare(ac_cache=cache)
+        for _ in range(3):
+            self.assertEqual(load(self.path), DATA)
+
+        self.assertEqual(cache.stats().hits, 2)
+
+    def test_prepare_with_profile(self):
+        prof = anyconfig.profiling.Profiler()
+        load = TT.prepare(ac_profile=prof)
+        load(self.path)
+
+        self.assertEqual(
+            [rec.stage for rec in prof.records],
+            [anyconfig.profiling.STAGE_IOINFO, anyconfig.profiling.STAGE_FIND,
+             anyconfig.profiling.STAGE_PARSE]
+        )
+
+    @unittest.skipIf(not anyconfig.schema.SUPPORTED,
+                     'jsonschema is not available')
+    def test_prepare_with_schema(self):
+        scm_path = self.workdir / 'schema.json'
+        scm_path.write_text(json.dumps(SCHEMA))
+
+        load = TT.prepare(ac_parser='json', ac_schema=scm_path)
+        self.assertEqual(load(self.path), DATA)
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(load.loads('{"a": "A"}'))
+
+    @unittest.skipIf(not anyconfig.query.SUPPORTED,
+                     'jmespath is not available')
+    def test_prepare_with_query(self):
+        load = TT.prepare(ac_query='c.d')
+        self.assertEqual(load(self.path), 'D')
+
+    @unittest.skipIf(not anyconfig.template.SUPPORTED,
+                     'jinja2 is not available')
+    def test_prepare_with_template(self):
+        self.path.write_text('{"a": {{ a }}}')
+        load = TT.prepare(ac_template=True, ac_context=dict(a=3))
+        self.assertEqual(load(self.path), dict(a=3))
+        self.assertEqual(TT.prepare(ac_parser='json', ac_template=True,
+                                    ac_context=dict(a=4)).loads(
+                                        '{"a": {{ a }}}'), dict(a=4))
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,78 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,protected-access
+"""Test cases for the cache of schemas loaded through ac_schema."""
+import json
+import pathlib
+import tempfile
+import unittest
+
+import anyconfig.api._load as TT
+
+
+SCHEMA = {'type': 'object', 'properties': {'a': {'type': 'integer'}}}
+SCHEMA_2 = {'type': 'object', 'properties': {'a': {'type': 'string'}}}
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        TT._SCHEMAS.clear()
+        self.tdir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tdir.name) / 'scm.json'
+        self.path.write_text(json.dumps(SCHEMA))
+
+    def tearDown(self):
+        self.tdir.cleanup()
+        TT._SCHEMAS.clear()
+
+    def test_schema_files_are_loaded_once(self):
+        scm = TT.try_to_load_schema(ac_schema=str(self.path))
+        self.assertEqual(scm, SCHEMA)
+        self.assertIs(TT.try_to_load_schema(ac_schema=self.path), scm)
+        self.assertEqual(len(TT._SCHEMAS), 1)
+
+        # Options affect results are the part of keys.
+        scm_2 = TT.try_to_load_schema(ac_schema=self.path, ac_ordered=True)
+        self.assertIsNot(scm_2, scm)
+        self.assertEqual(len(TT._SCHEMAS), 2)
+
+    def test_schema_files_modified_are_loaded_again(self):
+        scm = TT.try_to_load_schema(ac_schema=self.path)
+        self.path.write_text(json.dumps(SCHEMA_2, indent=2))
+        self.assertEqual(TT.try_to_load_schema(ac_schema=self.path),
+                         SCHEMA_2)
+        self.assertEqual(scm, SCHEMA)
+
+    def test_schemas_not_cached(self):
+        with self.path.open() as inp:
+            self.assertEqual(TT.try_to_load_schema(ac_schema=inp), SCHEMA)
+
+        self.assertEqual(
+            TT.try_to_load_schema(ac_schema=self.path, ac_template=True),
+            SCHEMA
+        )
+        self.assertEqual(len(TT._SCHEMAS), 0)
+
+    def test_schema_strings_are_loaded_once(self):
+        for _ in range(3):
+            self.assertEqual(
+                TT.loads('{"a": 1}', ac_parser='json',
+                         ac_schema=json.dumps(SCHEMA)),
+                {'a': 1}
+            )
+        self.assertEqual(len(TT._SCHEMAS), 1)
+
+        TT.loads('{"a": 1}', ac_parser='json', ac_schema=json.dumps(SCHEMA_2))
+        self.assertEqual(len(TT._SCHEMAS), 2)
+
+    def test_cache_size_is_bounded(self):
+        for idx in range(TT.SCHEMA_CACHE_SIZE + 2):
+            TT.loads('{}', ac_parser='json',
+                     ac_schema=json.dumps(dict(SCHEMA, title=str(idx))))
+
+        self.assertEqual(len(TT._SCHEMAS), TT.SCHEMA_CACHE_SIZE)
+
+# vim:sw=4:ts=4:et:
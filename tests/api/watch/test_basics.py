@@ -0,0 +1,147 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring, protected-access
+import json
+import os
+import pathlib
+import tempfile
+import time
+import unittest
+import unittest.mock
+
+import anyconfig.api._load
+import anyconfig.api._watch as TT
+import anyconfig.dicts
+import anyconfig.schema
+
+
+def _dump(path: pathlib.Path, data, mtime_offset: int = 0) -> None:
+    path.write_text(json.dumps(data))
+    # Make sure that the signature of the file changes.
+    mtime = time.time() + mtime_offset
+    os.utime(path, (mtime, mtime))
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.workdir = pathlib.Path(self.tdir.name)
+        self.pattern = str(self.workdir / '*.json')
+
+        _dump(self.workdir / 'a.json', {'a': 1, 'b': {'c': [1]}})
+        _dump(self.workdir / 'b.json', {'b': {'d': 'D'}})
+        _dump(self.workdir / 'c.json', {'e': True})
+
+    def tearDown(self):
+        self.tdir.cleanup()
+
+    def assert_same_as_multi_load(self, watcher, **options):
+        self.assertEqual(
+            watcher.snapshot,
+            anyconfig.api._load.multi_load(self.pattern, **options)
+        )
+
+    def test_10_initial_load(self):
+        watcher = TT.watch(self.pattern)
+        self.assert_same_as_multi_load(watcher)
+        self.assertEqual(len(watcher.paths), 3)
+        self.assertFalse(watcher.poll())
+
+    def test_20_poll__changed(self):
+        watcher = TT.watch(self.pattern)
+        _dump(self.workdir / 'b.json', {'b': {'d': 'X'}, 'f': 0}, 10)
+
+        with unittest.mock.patch.object(
+            anyconfig.api._load, '_single_load',
+            wraps=anyconfig.api._load._single_load
+        ) as single_load:
+            self.assertTrue(watcher.poll())
+            # Only the changed file should be parsed again.
+            self.assertEqual(single_load.call_count, 1)
+
+        self.assert_same_as_multi_load(watcher)
+        self.assertEqual(watcher.snapshot['b'], {'c': [1], 'd': 'X'})
+
+    def test_22_poll__merge_strategies(self):
+        for strategy in ('replace', 'noreplace', 'merge_dicts',
+                         'merge_dicts_and_lists'):
+            watcher = TT.watch(self.pattern, ac_merge=strategy)
+            _dump(self.workdir / 'c.json', {'b': {'c': [2]}}, 20)
+            self.assertTrue(watcher.poll())
+            self.assert_same_as_multi_load(watcher, ac_merge=strategy)
+
+            _dump(self.workdir / 'a.json', {'b': {'c': [1, 3]}}, 30)
+            self.assertTrue(watcher.poll())
+            self.assert_same_as_multi_load(watcher, ac_merge=strategy)
+
+    def test_30_poll__added_and_removed(self):
+        watcher = TT.watch(self.pattern)
+        _dump(self.workdir / 'aa.json', {'g': 1})
+        self.assertTrue(watcher.poll())
+        self.assertEqual(len(watcher.paths), 4)
+        self.assert_same_as_multi_load(watcher)
+
+        (self.workdir / 'a.json').unlink()
+        self.assertTrue(watcher.poll())
+        self.assertEqual(len(watcher.paths), 3)
+        self.assert_same_as_multi_load(watcher)
+
+    def test_40_callbacks(self):
+        res = []
+        watcher = TT.watch(self.pattern)
+        watcher.add_callback(lambda data, paths: res.append((data, paths)))
+
+        path = self.workdir / 'c.json'
+        _dump(path, {'e': False}, 10)
+        watcher.poll()
+        watcher.poll()
+
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0][0], watcher.snapshot)
+        self.assertEqual(res[0][1], [str(path)])
+
+    def test_32_poll__frozen_shares_unchanged_data(self):
+        watcher = TT.watch(self.pattern, ac_frozen=True)
+        snap = watcher.snapshot
+        self.assert_same_as_multi_load(watcher)
+
+        _dump(self.workdir / 'c.json', {'e': False}, 10)
+        with unittest.mock.patch.object(TT, 'copy_data') as copy_data:
+            self.assertTrue(watcher.poll())
+            copy_data.assert_not_called()
+
+        self.assertFalse(watcher.snapshot['e'])
+        self.assertIs(watcher.snapshot['b'], snap['b'])
+
+    @unittest.skipIf(not anyconfig.schema.SUPPORTED,
+                     'jsonschema lib is not available')
+    def test_42_schema_and_frozen(self):
+        scm_path = self.workdir / 'schema.js'
+        scm_path.write_text(json.dumps(
+            {'type': 'object', 'properties': {'e': {'type': 'boolean'}}}
+        ))
+        watcher = TT.watch(self.pattern, ac_schema=str(scm_path),
+                           ac_frozen=True)
+        self.assertIsInstance(watcher.snapshot, anyconfig.dicts.FrozenDict)
+        self.assert_same_as_multi_load(watcher)
+
+        _dump(self.workdir / 'c.json', {'e': 'X'}, 10)
+        self.assertTrue(watcher.poll())
+        self.assertIsNone(watcher.snapshot)
+
+    def test_50_start_and_stop(self):
+        with TT.watch(self.pattern, ac_interval=0.01) as watcher:
+            _dump(self.workdir / 'c.json', {'e': False}, 10)
+            for _ in range(100):
+                if not watcher.snapshot['e']:
+                    break
+                time.sleep(0.01)
+
+            self.assertFalse(watcher.snapshot['e'])
+
+        self.assertIsNone(watcher._thread)
+
+# vim:sw=4:ts=4:et:
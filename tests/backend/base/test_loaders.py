@@ -3,9 +3,12 @@
 # License: MIT
 #
 # pylint: disable=missing-docstring, invalid-name
+import collections
 import unittest
 
 import anyconfig.backend.base.loaders as TT
+import anyconfig.ioinfo
+import anyconfig.parsers
 
 
 FILE_PATH = __file__
@@ -17,6 +20,31 @@ class LoaderMixinTestCase(unittest.TestCase):
         with TT.LoaderMixin().ropen(FILE_PATH) as fio:
             self.assertEqual(fio.mode, 'r')
 
+    def test_prepare(self):
+        psr = anyconfig.parsers.find(None, forced_type='json')
+        (container, options) = psr.prepare(ac_ordered=True, indent=2,
+                                           parse_int=int)
+        self.assertEqual(container, collections.OrderedDict)
+        self.assertEqual(options['object_pairs_hook'],
+                         collections.OrderedDict)
+        self.assertEqual(options['parse_int'], int)
+        self.assertNotIn('indent', options)
+        self.assertNotIn('ac_ordered', options)
+
+        res = psr.loads_prepared('{"b": 1, "a": 2}', container, options)
+        self.assertEqual(res, collections.OrderedDict(b=1, a=2))
+        self.assertEqual(psr.loads_prepared('', container, options),
+                         container())
+
+    def test_load_prepared(self):
+        psr = anyconfig.parsers.find(None, forced_type='json')
+        (container, options) = psr.prepare()
+
+        ioi = anyconfig.ioinfo.make(FILE_PATH + '.not_exist.json')
+        res = psr.load_prepared(ioi, container, options,
+                                ac_ignore_missing=True)
+        self.assertEqual(res, {})
+
 
 class BinaryLoaderMixinTestCase(unittest.TestCase):
 
@@ -0,0 +1,48 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.backend."""
+import os
+import subprocess
+import sys
+import unittest
+
+import anyconfig.backend as TT
+
+
+class TestCase(unittest.TestCase):
+
+    def test_lazy_parsers_metadata(self):
+        for spec in TT.LAZY_PARSERS:
+            pcls = spec.load_class()
+            self.assertEqual(
+                (spec.cid(), spec.type(), spec.priority(), spec.extensions()),
+                (pcls.cid(), pcls.type(), pcls.priority(), pcls.extensions()),
+                spec
+            )
+
+    def test_parsers(self):
+        self.assertEqual([p.cid() for p in TT.PARSERS],
+                         [s.cid() for s in TT.LAZY_PARSERS])
+
+    def test_backend_modules(self):
+        self.assertTrue(TT.json.Parser)
+        with self.assertRaises(AttributeError):
+            _ = TT.not_existing_module
+
+    def test_backend_modules_not_imported(self):
+        code = '''
+import sys
+import anyconfig
+assert 'anyconfig.backend.json.default' not in sys.modules
+assert 'anyconfig.backend.xml' not in sys.modules
+anyconfig.loads('{}', ac_parser='json')
+assert 'anyconfig.backend.json.default' in sys.modules
+assert 'anyconfig.backend.xml' not in sys.modules
+'''
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,146 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring, invalid-name
+import collections
+import pathlib
+import pickle
+import tempfile
+import unittest
+import unittest.mock
+
+import anyconfig.api
+import anyconfig.cache.disk as TT
+import anyconfig.cache.memory
+import anyconfig.ioinfo
+import anyconfig.parsers
+
+
+JSON_PARSER = anyconfig.parsers.find(None, forced_type='json')
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.workdir = pathlib.Path(self.tdir.name)
+        self.cache = TT.DiskCache(self.workdir / 'cache')
+
+    def tearDown(self):
+        self.tdir.cleanup()
+
+    def _write(self, name, content):
+        path = self.workdir / name
+        path.write_text(content)
+        return anyconfig.ioinfo.make(path)
+
+    def test_get_disk_cache(self):
+        self.assertTrue(TT.get_disk_cache(None) is None)
+        self.assertTrue(TT.get_disk_cache('') is None)
+        self.assertTrue(TT.get_disk_cache(self.cache) is self.cache)
+
+        cdir = self.workdir / 'cache2'
+        cache = TT.get_disk_cache(cdir)
+        self.assertTrue(TT.get_disk_cache(str(cdir)) is cache)
+        self.assertEqual(cache.cachedir, cdir.resolve())
+
+    def test_make_key(self):
+        key = self.cache.make_key(b'{}', JSON_PARSER)
+        self.assertEqual(key, self.cache.make_key(b'{}', JSON_PARSER))
+        self.assertNotEqual(key, self.cache.make_key(b'{} ', JSON_PARSER))
+        self.assertNotEqual(
+            key, self.cache.make_key(b'{}', JSON_PARSER, ac_ordered=True)
+        )
+        self.assertNotEqual(
+            self.cache.make_key(b'{}', JSON_PARSER,
+                                ac_dict=collections.OrderedDict),
+            self.cache.make_key(b'{}', JSON_PARSER, ac_dict=dict)
+        )
+        self.assertTrue(
+            self.cache.make_key(b'{}', JSON_PARSER, ac_dict=lambda x: x)
+            is None
+        )
+
+    def test_load(self):
+        ioi = self._write('a.json', '{"a": {"b": [1, 2]}}')
+        res = self.cache.load(JSON_PARSER, ioi, ac_ordered=True)
+        self.assertEqual(res, {'a': {'b': [1, 2]}})
+        self.assertEqual(self.cache.stats()[:4], (0, 1, 0, 1))
+
+        # Another cache object may be in another process.
+        cache = TT.DiskCache(self.cache.cachedir)
+        with unittest.mock.patch.object(JSON_PARSER, 'load') as mck:
+            res2 = cache.load(JSON_PARSER, ioi, ac_ordered=True)
+            mck.assert_not_called()
+
+        self.assertEqual(res2, res)
+        self.assertTrue(isinstance(res2, collections.OrderedDict))
+        self.assertEqual(cache.stats()[:4], (1, 0, 0, 1))
+
+        self._write('a.json', '{"a": 1}')
+        self.assertEqual(cache.load(JSON_PARSER, ioi), {'a': 1})
+        self.assertEqual(cache.stats()[:4], (1, 1, 0, 2))
+
+        cache.clear()
+        self.assertEqual(cache.stats(), (0, 0, 0, 0, 0))
+
+    def test_load__file_is_read_once(self):
+        ioi = self._write('a.json', '{"a": 1}')
+        with unittest.mock.patch.object(JSON_PARSER, 'ropen') as mck:
+            self.assertEqual(self.cache.load(JSON_PARSER, ioi), {'a': 1})
+            mck.assert_not_called()
+
+        self.assertEqual(self.cache.stats()[:2], (0, 1))
+
+    def test_load__binary_parser(self):
+        psr = anyconfig.parsers.find(None, forced_type='pickle')
+        ioi = self._write('a.pkl', '')
+        pathlib.Path(ioi.path).write_bytes(pickle.dumps({'a': 1}))
+
+        for _ in range(2):
+            self.assertEqual(self.cache.load(psr, ioi), {'a': 1})
+        self.assertEqual(self.cache.stats()[:2], (1, 1))
+
+    def test_load__broken_cache_file(self):
+        ioi = self._write('a.json', '{"a": 1}')
+        self.cache.load(JSON_PARSER, ioi)
+        (path, ) = self.cache.cachedir.glob('*/*.pickle')
+        path.write_bytes(b'broken')
+
+        with self.assertWarns(UserWarning):
+            self.assertEqual(self.cache.load(JSON_PARSER, ioi), {'a': 1})
+        self.assertEqual(self.cache.load(JSON_PARSER, ioi), {'a': 1})
+        self.assertEqual(self.cache.stats().hits, 1)
+
+    def test_load__not_cached(self):
+        missing = anyconfig.ioinfo.make(self.workdir / 'b.json')
+        self.assertEqual(
+            self.cache.load(JSON_PARSER, missing, ac_ignore_missing=True), {}
+        )
+        self.assertEqual(self.cache.stats().entries, 0)
+
+    def test_api__ac_cache_dir(self):
+        self._write('a.json', '{"a": {"b": 1}}')
+        self._write('b.json', '{"a": {"c": 2}}')
+        exp = {'a': {'b': 1, 'c': 2}}
+
+        for _ in range(2):
+            res = anyconfig.api.load(self.workdir / '*.json',
+                                     ac_cache_dir=self.cache)
+            self.assertEqual(res, exp)
+
+        self.assertEqual(self.cache.stats()[:4], (2, 2, 0, 2))
+
+    def test_api__ac_cache_and_ac_cache_dir(self):
+        ioi = self._write('a.json', '{"a": 1}')
+        mcache = anyconfig.cache.memory.Cache()
+        for _ in range(3):
+            res = anyconfig.api.load(ioi.path, ac_cache=mcache,
+                                     ac_cache_dir=self.cache)
+            self.assertEqual(res, {'a': 1})
+
+        self.assertEqual(mcache.stats()[:2], (2, 1))
+        self.assertEqual(self.cache.stats()[:2], (0, 1))
+
+# vim:sw=4:ts=4:et:
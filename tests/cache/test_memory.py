@@ -0,0 +1,195 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring, invalid-name
+import collections
+import os
+import pathlib
+import pickle
+import tempfile
+import unittest
+import unittest.mock
+
+import anyconfig.api
+import anyconfig.cache.memory as TT
+import anyconfig.ioinfo
+import anyconfig.parsers
+
+
+JSON_PARSER = anyconfig.parsers.find(None, forced_type='json')
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tdir = tempfile.TemporaryDirectory()
+        self.workdir = pathlib.Path(self.tdir.name)
+
+    def tearDown(self):
+        self.tdir.cleanup()
+
+    def _write(self, name, content, mtime_ns=None):
+        path = self.workdir / name
+        path.write_text(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        return anyconfig.ioinfo.make(path)
+
+    def test_get_cache(self):
+        cache = TT.Cache()
+        self.assertTrue(TT.get_cache(None) is None)
+        self.assertTrue(TT.get_cache(False) is None)
+        self.assertTrue(TT.get_cache(True) is TT.get_cache(True))
+        self.assertTrue(TT.get_cache(cache) is cache)
+
+    def test_load__hit_and_miss(self):
+        ioi = self._write('a.json', '{"a": {"b": [1, 2]}}')
+        cache = TT.Cache()
+
+        res = cache.load(JSON_PARSER, ioi)
+        self.assertEqual(res, {'a': {'b': [1, 2]}})
+        self.assertEqual(cache.stats()[:4], (0, 1, 0, 1))
+
+        with unittest.mock.patch.object(JSON_PARSER, 'load') as mck:
+            res2 = cache.load(JSON_PARSER, ioi)
+            mck.assert_not_called()
+
+        self.assertEqual(res2, res)
+        self.assertEqual(cache.stats().hits, 1)
+
+        # Data in the cache must not be changed even if results were.
+        res2['a']['b'].append(3)
+        self.assertEqual(cache.load(JSON_PARSER, ioi), res)
+
+    def test_load__not_picklable(self):
+        class MyDict(dict):
+            pass
+
+        ioi = self._write('a.json', '{"a": {"b": 1}}')
+        cache = TT.Cache()
+        res = cache.load(JSON_PARSER, ioi, ac_dict=MyDict)
+        res2 = cache.load(JSON_PARSER, ioi, ac_dict=MyDict)
+        self.assertEqual(res2, res)
+        self.assertTrue(isinstance(res2['a'], MyDict))
+        self.assertFalse(res2['a'] is res['a'])
+
+    def test_load__no_copy(self):
+        ioi = self._write('a.json', '{"a": 1}')
+        cache = TT.Cache(copy=False)
+        res = cache.load(JSON_PARSER, ioi)
+        self.assertTrue(cache.load(JSON_PARSER, ioi) is res)
+
+    def test_load__file_changed(self):
+        ioi = self._write('a.json', '{"a": 1}', mtime_ns=10 ** 18)
+        cache = TT.Cache()
+        self.assertEqual(cache.load(JSON_PARSER, ioi), {'a': 1})
+
+        self._write('a.json', '{"a": 2}', mtime_ns=10 ** 18 + 1)
+        self.assertEqual(cache.load(JSON_PARSER, ioi), {'a': 2})
+        self.assertEqual(cache.stats().misses, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_load__options(self):
+        ioi = self._write('a.json', '{"a": 1, "b": 2}')
+        cache = TT.Cache()
+
+        res = cache.load(JSON_PARSER, ioi, ac_ordered=True)
+        self.assertTrue(isinstance(res, collections.OrderedDict))
+        self.assertFalse(isinstance(cache.load(JSON_PARSER, ioi),
+                                    collections.OrderedDict))
+        self.assertEqual(len(cache), 2)
+
+        # It does not affect results.
+        cache.load(JSON_PARSER, ioi, ac_merge='replace')
+        self.assertEqual(cache.stats().hits, 1)
+
+    def test_load__not_cached(self):
+        cache = TT.Cache()
+        ioi = self._write('a.json', '{"a": 1}')
+        with ioi.src.open() as inp:
+            sio = anyconfig.ioinfo.make(inp)
+            self.assertEqual(cache.load(JSON_PARSER, sio), {'a': 1})
+
+        self.assertEqual(len(cache), 0)
+
+        missing = anyconfig.ioinfo.make(self.workdir / 'b.json')
+        self.assertEqual(
+            cache.load(JSON_PARSER, missing, ac_ignore_missing=True), {}
+        )
+        self.assertEqual(len(cache), 0)
+
+    def test_load__evictions(self):
+        iois = [self._write(f'{i}.json', '{"a": 1}') for i in range(4)]
+
+        nbytes = len(pickle.dumps({'a': 1}, protocol=pickle.HIGHEST_PROTOCOL))
+
+        cache = TT.Cache(max_entries=2)
+        for ioi in iois:
+            cache.load(JSON_PARSER, ioi)
+        self.assertEqual(cache.stats(),
+                         TT.CacheStats(0, 4, 2, 2, nbytes * 2))
+
+        cache.load(JSON_PARSER, iois[2])  # It makes 3 most recently used.
+        cache.load(JSON_PARSER, iois[0])
+        self.assertEqual(cache.stats()[:4], (1, 5, 3, 2))
+        cache.load(JSON_PARSER, iois[2])
+        self.assertEqual(cache.stats().hits, 2)
+
+        cache = TT.Cache(max_bytes=nbytes * 2 + 1)
+        for ioi in iois:
+            cache.load(JSON_PARSER, ioi)
+        self.assertEqual(cache.stats(),
+                         TT.CacheStats(0, 4, 2, 2, nbytes * 2))
+
+        # File sizes are used instead if data are not copied.
+        cache = TT.Cache(max_bytes=17, copy=False)
+        for ioi in iois:
+            cache.load(JSON_PARSER, ioi)
+        self.assertEqual(cache.stats(), TT.CacheStats(0, 4, 2, 2, 16))
+
+        cache.clear()
+        self.assertEqual(cache.stats(), TT.CacheStats(0, 0, 0, 0, 0))
+
+    def test_api__ac_cache(self):
+        ioi = self._write('a.json', '{"a": 1}')
+        cache = TT.Cache()
+        for _ in range(3):
+            self.assertEqual(anyconfig.api.load(ioi.path, ac_cache=cache),
+                             {'a': 1})
+        self.assertEqual(cache.stats().hits, 2)
+
+    def test_api__multi_load_with_ac_cache(self):
+        self._write('a.json', '{"a": {"b": 1}}')
+        self._write('b.json', '{"a": {"c": 2}}')
+        exp = {'a': {'b': 1, 'c': 2}}
+
+        cache = TT.Cache()
+        for _ in range(2):
+            res = anyconfig.api.load(self.workdir / '*.json', ac_cache=cache)
+            self.assertEqual(res, exp)
+
+        self.assertEqual(cache.stats()[:3], (2, 2, 0))
+
+    def test_api__multi_load_with_ac_cache_no_copy(self):
+        self._write('a.json', '{"a": 1, "b": {"x": 1}}')
+        self._write('b.json', '{"b": {"y": 2}, "c": {"d": 3}}')
+        self._write('c.json', '{"c": {"e": 4}}')
+        paths = [self.workdir / f'{name}.json' for name in 'abc']
+
+        cache = TT.Cache(copy=False)
+        for _ in range(2):
+            self.assertEqual(
+                anyconfig.api.load(paths, ac_cache=cache),
+                {'a': 1, 'b': {'x': 1, 'y': 2}, 'c': {'d': 3, 'e': 4}}
+            )
+
+        # Data in the cache must not be changed by merging.
+        self.assertEqual(anyconfig.api.load(paths[0], ac_cache=cache),
+                         {'a': 1, 'b': {'x': 1}})
+        self.assertEqual(anyconfig.api.load(paths[1], ac_cache=cache),
+                         {'b': {'y': 2}, 'c': {'d': 3}})
+        self.assertEqual(cache.stats().misses, 3)
+
+# vim:sw=4:ts=4:et:
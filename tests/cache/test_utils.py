@@ -0,0 +1,63 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# SPDX-License-Identifier: MIT
+#
+# pylint: disable=missing-docstring, invalid-name
+import collections
+import io
+import pathlib
+import tempfile
+import unittest
+
+import anyconfig.cache.utils as TT
+import anyconfig.ioinfo
+import anyconfig.parsers
+
+
+class TestCase(unittest.TestCase):
+
+    def test_file_signature(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            path = pathlib.Path(tdir) / 'a.json'
+            path.write_text('{}')
+            stat = path.stat()
+
+            self.assertEqual(
+                TT.file_signature(anyconfig.ioinfo.make(path)),
+                (stat.st_ino, stat.st_mtime_ns, 2)
+            )
+            self.assertTrue(TT.file_signature(
+                anyconfig.ioinfo.make(pathlib.Path(tdir) / 'b.json')
+            ) is None)
+
+        self.assertTrue(
+            TT.file_signature(anyconfig.ioinfo.make(io.StringIO())) is None
+        )
+
+    def test_options_key(self):
+        psr = anyconfig.parsers.find(None, forced_type='json')
+        self.assertEqual(TT.options_key(psr), ())
+        self.assertEqual(
+            TT.options_key(psr, ac_ordered=True, parse_int=float,
+                           ac_merge='replace'),
+            (('ac_ordered', True), ('parse_int', float))
+        )
+        self.assertTrue(TT.options_key(psr, parse_int=[]) is None)
+
+    def test_copy_data(self):
+        odic = collections.OrderedDict(b=1, a=[{'c': None}])
+        data = {'a': [1, {'b': 'c'}, (2, [3])], 'd': odic}
+
+        res = TT.copy_data(data)
+        self.assertEqual(res, data)
+        self.assertFalse(res is data)
+        self.assertFalse(res['a'][1] is data['a'][1])
+        self.assertFalse(res['a'][2][1] is data['a'][2][1])
+        self.assertTrue(isinstance(res['d'], collections.OrderedDict))
+        self.assertEqual(list(res['d']), ['b', 'a'])
+        self.assertFalse(res['d']['a'][0] is odic['a'][0])
+
+        for obj in (None, 1, 'abc', b'abc', 1.0):
+            self.assertTrue(TT.copy_data(obj) is obj)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import unittest
+
+import anyconfig.dicts as TT
+
+from .. import base
+from . import common
+
+
+DATA = {
+    'servers': [
+        {'name': 'a', 'port': 80},
+        {'name': 'b'},
+        {'name': 'c', 'port': 8080},
+    ],
+    'a': {'b': {'c': 1, 'd': [1, 2, 3]}},
+    'ports': {'80:80': 'http', '443:443': 'https'},
+}
+
+
+class TestCase(common.TestCase):
+    kind = 'get'
+
+    def test_get(self):
+        for data in self.each_data():
+            emsg = base.load_data(data.scm)  # diversion.
+            (res, err) = TT.compile_path(data.query).get(data.inp)
+
+            if emsg:
+                self.assertTrue(bool(err), data)
+            else:  # emsg = ''
+                self.assertEqual(err, '', data)
+
+            self.assertEqual(res, data.exp, data)
+
+
+class WildcardsTestCase(unittest.TestCase):
+
+    def test_compile_path_cached(self):
+        self.assertIs(TT.compile_path('a.b'), TT.compile_path('a.b'))
+        self.assertFalse(TT.compile_path('a.b').multi)
+        self.assertTrue(TT.compile_path('a/*').multi)
+
+    def test_get_indices_at_any_steps(self):
+        for path, exp in (('servers/1/name', 'b'),
+                          ('servers.2.port', 8080),
+                          ('a/b/d/0', 1)):
+            self.assertEqual(TT.compile_path(path).get(DATA), (exp, ''))
+
+        (res, err) = TT.compile_path('servers/3/name').get(DATA)
+        self.assertIsNone(res)
+        self.assertTrue(err)
+
+    def test_get_with_wildcards(self):
+        for path, exp in (('servers/*/port', [80, 8080]),
+                          ('servers/*/name', ['a', 'b', 'c']),
+                          ('servers/1:/name', ['b', 'c']),
+                          ('servers/::2/name', ['a', 'c']),
+                          ('servers/-1:/name', ['c']),
+                          ('a/b/d/:2', [1, 2]),
+                          ('a/*/c', [1]),
+                          ('a/*/x', []),
+                          ('x/*', []),
+                          ('ports/*', ['http', 'https']),
+                          ('ports/80:80', ['http'])):
+            self.assertEqual(TT.compile_path(path).get(DATA), (exp, ''),
+                             path)
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import collections
+import sys
+import unittest
+
+import anyconfig.dicts as TT
+
+
+OD = collections.OrderedDict
+
+DATA = {
+    'a': {'b': [1, {'c': 2}], 'd': (1, [2]), 'e': {1, 2}},
+    'f': None, 'g': b'G', 'h': 'H',
+}
+
+
+class TestCase(unittest.TestCase):
+
+    def test_convert_to_same_types(self):
+        res = TT.convert_to(DATA)
+        self.assertIs(res, DATA)
+
+    def test_convert_to_copy(self):
+        res = TT.convert_to(DATA, ac_copy=True)
+        self.assertEqual(res, DATA)
+        self.assertIsNot(res, DATA)
+        self.assertIsNot(res['a'], DATA['a'])
+        self.assertIsNot(res['a']['b'][1], DATA['a']['b'][1])
+        self.assertIsNot(res['a']['e'], DATA['a']['e'])
+
+    def test_convert_to_ordered_dicts(self):
+        res = TT.convert_to(DATA, ac_ordered=True)
+        self.assertEqual(res, DATA)
+        self.assertIsInstance(res, OD)
+        self.assertIsInstance(res['a']['b'][1], OD)
+        self.assertIsInstance(res['a']['d'], tuple)
+        self.assertIs(res['a']['e'], DATA['a']['e'])  # Nothing to convert.
+
+    def test_convert_to_nested_mappings(self):
+        class MyDict(dict):
+            pass
+
+        inp = {'a': {'b': {'c': 1}, 'd': [{'e': 2}]}}
+        res = TT.convert_to(inp, ac_dict=MyDict)
+        self.assertEqual(res, inp)
+        for obj in (res, res['a'], res['a']['b'], res['a']['d'][0]):
+            self.assertIs(type(obj), MyDict)
+
+        res = TT.convert_to(OD(a=OD(b=OD(c=1))))
+        self.assertIs(type(res['a']), dict)
+        self.assertIs(type(res['a']['b']), dict)
+
+    def test_convert_to_shares_subtrees_not_converted(self):
+        inp = OD(a=OD(b=1), c={'d': [1, 2]})
+        res = TT.convert_to(inp, ac_dict=dict)
+        self.assertEqual(res, {'a': {'b': 1}, 'c': {'d': [1, 2]}})
+        self.assertIs(type(res['a']), dict)
+        self.assertIs(res['c'], inp['c'])
+
+    def test_convert_to_snapshots(self):
+        res = TT.convert_to(TT.freeze(DATA))
+        self.assertEqual(res, DATA)
+        self.assertIs(type(res['a']['b'][1]), dict)
+
+    def test_convert_to_deep_data(self):
+        depth = sys.getrecursionlimit() * 2
+        inp = cur = {}
+        for _ in range(depth):
+            cur['a'] = {}
+            cur = cur['a']
+
+        res = TT.convert_to(inp, ac_ordered=True)
+        for _ in range(depth):
+            self.assertIsInstance(res, OD)
+            res = res['a']
+
+        self.assertEqual(res, OD())
+
+    def test_convert_to_with_circular_references(self):
+        inp = {'a': {'b': []}}
+        inp['a']['b'].append(inp)
+        with self.assertRaises(ValueError):
+            TT.convert_to(inp)
+
+    def test_convert_to_with_shared_objects(self):
+        shared = [1, 2]
+        res = TT.convert_to({'a': shared, 'b': {'c': shared}}, ac_copy=True)
+        self.assertEqual(res, {'a': [1, 2], 'b': {'c': [1, 2]}})
+
+    def test_convert_to_primitives(self):
+        for obj in (None, 1, 'abc', b'abc'):
+            self.assertIs(TT.convert_to(obj), obj)
+
+# vim:sw=4:ts=4:et:
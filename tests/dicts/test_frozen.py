@@ -0,0 +1,162 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import copy
+import pickle
+import unittest
+
+import anyconfig.dicts as TT
+
+
+DATA = {
+    'a': 1,
+    'b': {'b1': [1, {'c': 2}], 'b2': {'d': {'e': 'E'}}},
+    'f': {1, 2},
+    'g': (0, [1]),
+}
+
+
+def merge(dic, other, **options):
+    dic = copy.deepcopy(dic)
+    TT.merge(dic, copy.deepcopy(other), **options)
+    return dic
+
+
+class FreezeTestCase(unittest.TestCase):
+
+    def test_freeze(self):
+        res = TT.freeze(DATA)
+
+        self.assertIsInstance(res, TT.FrozenDict)
+        self.assertIsInstance(res['b'], TT.FrozenDict)
+        self.assertIsInstance(res['b']['b1'], TT.FrozenList)
+        self.assertIsInstance(res['b']['b1'][1], TT.FrozenDict)
+        self.assertIsInstance(res['f'], frozenset)
+        self.assertIsInstance(res['g'][1], TT.FrozenList)
+        self.assertEqual(res, DATA)
+        self.assertEqual(DATA, res)
+
+    def test_freeze_frozen_objects(self):
+        res = TT.freeze(DATA)
+        self.assertIs(TT.freeze(res), res)
+        self.assertIs(TT.freeze({'x': res})['x'], res)
+
+    def test_freeze_primitives(self):
+        for obj in (None, 0, 1.0, True, 'abc', b'abc'):
+            self.assertIs(TT.freeze(obj), obj)
+
+    def test_thaw(self):
+        res = TT.thaw(TT.freeze(DATA))
+
+        self.assertEqual(res, dict(DATA, g=[0, [1]]))
+        self.assertIsInstance(res, dict)
+        self.assertIsInstance(res['b']['b1'], list)
+        self.assertIsInstance(res['b']['b1'][1], dict)
+
+        res = TT.thaw(TT.freeze(DATA), ac_ordered=True)
+        self.assertIsInstance(res['b']['b2'], TT.collections.OrderedDict)
+
+
+class FrozenDictTestCase(unittest.TestCase):
+
+    def test_read_only(self):
+        res = TT.FrozenDict(DATA)
+        with self.assertRaises(TypeError):
+            res['a'] = 0  # type: ignore
+        with self.assertRaises(TypeError):
+            del res['a']  # type: ignore
+        with self.assertRaises(AttributeError):
+            res['b'].update(x=1)  # type: ignore
+        with self.assertRaises(AttributeError):
+            res['b']['b1'].append(1)  # type: ignore
+
+    def test_hashable(self):
+        (res_0, res_1) = (TT.FrozenDict(DATA), TT.freeze(DATA))
+        self.assertEqual(hash(res_0), hash(res_1))
+        self.assertEqual(len({res_0, res_1}), 1)
+        self.assertEqual(hash(res_0['b']['b1']),
+                         hash((1, res_0['b']['b1'][1])))
+
+    def test_equality(self):
+        res = TT.FrozenDict(DATA)
+        self.assertEqual(res['b']['b1'], [1, {'c': 2}])
+        self.assertEqual(res['b']['b1'], (1, {'c': 2}))
+        self.assertNotEqual(res['b']['b1'], [1])
+        self.assertNotEqual(res, TT.FrozenDict(a=1))
+
+    def test_no_copies(self):
+        res = TT.FrozenDict(DATA)
+        self.assertIs(copy.copy(res), res)
+        self.assertIs(copy.deepcopy(res), res)
+        self.assertIs(copy.deepcopy(res['b']['b1']), res['b']['b1'])
+
+    def test_pickle(self):
+        res = TT.FrozenDict(DATA)
+        self.assertEqual(pickle.loads(pickle.dumps(res)), res)
+
+
+class UpdateTestCase(unittest.TestCase):
+
+    def test_set_(self):
+        res = TT.freeze(DATA)
+        new = res.set_('b.b2.d.e', 'X')
+
+        self.assertEqual(new, merge(DATA, {'b': {'b2': {'d': {'e': 'X'}}}}))
+        self.assertEqual(res, DATA)  # It's not changed.
+        self.assertIs(new['b']['b1'], res['b']['b1'])
+        self.assertIs(new['f'], res['f'])
+
+    def test_set__function(self):
+        res = TT.freeze(DATA)
+        new = TT.set_(res, 'b.b3', {'x': [1]})
+
+        self.assertIsInstance(new, TT.FrozenDict)
+        self.assertIsInstance(new['b']['b3']['x'], TT.FrozenList)
+        self.assertEqual(new['b']['b3'], {'x': [1]})
+        self.assertIs(new['b']['b2'], res['b']['b2'])
+        self.assertIsNone(TT.set_(TT.thaw(res), 'b.b3', 1))
+
+    def test_merge(self):
+        other = {'a': None, 'b': {'b1': [{'c': 2}, 3], 'b2': {'x': 1}},
+                 'h': [1]}
+        for strategy in TT.MERGE_STRATEGIES:
+            res = TT.freeze(DATA)
+            new = TT.merge(res, other, ac_merge=strategy)
+
+            self.assertIsInstance(new, TT.FrozenDict)
+            self.assertEqual(new, merge(DATA, other, ac_merge=strategy),
+                             strategy)
+            self.assertEqual(res, DATA)
+            self.assertIs(new['f'], res['f'])
+
+    def test_merge_pairs(self):
+        other = [('b', {'b2': {'x': 1}}), ('a', None),
+                 ('b', {'b2': {'y': None}})]
+        for strategy in TT.MERGE_STRATEGIES:
+            new = TT.freeze(DATA).merge(other, ac_merge=strategy)
+            self.assertEqual(new, merge(DATA, other, ac_merge=strategy),
+                             strategy)
+
+    def test_merge_nothing_changed(self):
+        res = TT.freeze(DATA)
+        self.assertIs(res.merge({'b': {'b2': res['b']['b2']}}), res)
+        self.assertIs(res.merge({'a': 0}, ac_merge=TT.MS_NO_REPLACE), res)
+
+    def test_merge_with_custom_strategy(self):
+        def update_fn(self, other, key, **_options):
+            self[key] = [self.get(key), other[key]]
+
+        res = TT.freeze(DATA).merge({'a': 2}, ac_merge=update_fn)
+        self.assertEqual(res['a'], [1, 2])
+        self.assertIsInstance(res['a'], TT.FrozenList)
+
+    def test_merge_failures(self):
+        res = TT.freeze(DATA)
+        with self.assertRaises(TypeError):
+            res.merge([1])
+        with self.assertRaises(ValueError):
+            res.merge({}, ac_merge='unknown')
+
+# vim:sw=4:ts=4:et:
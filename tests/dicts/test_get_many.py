@@ -0,0 +1,42 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import unittest
+
+import anyconfig.dicts as TT
+
+from .test_compile_path import DATA
+
+
+PATHS = (
+    '', 'a', 'a/b/c', 'a/b/d/1', 'a/b/x', 'a/x/y', 'a/x/*',
+    'servers/*/port', 'servers/0/name', 'servers/0/port', 'servers/5/name',
+    'servers/:2/name', 'ports/80:80', 'a/b/c',
+)
+
+
+class TestCase(unittest.TestCase):
+
+    def test_get_many(self):
+        res = TT.get_many(DATA, PATHS)
+        self.assertEqual(res, [TT.compile_path(p).get(DATA) for p in PATHS])
+        self.assertEqual(res[0], (DATA, ''))
+        self.assertEqual(res[2], (1, ''))
+        self.assertEqual(res[7], ([80, 8080], ''))
+        self.assertIsNone(res[5][0])
+        self.assertTrue(res[5][1])
+
+    def test_get_many_same_as_get(self):
+        paths = ('', 'a', 'a/b/c', 'a/b/d/1', 'a/b/x', 'a/x/y')
+        res = TT.get_many(DATA, iter(paths))
+        for path, (val, err) in zip(paths, res):
+            (exp, exp_err) = TT.get(DATA, path)
+            self.assertEqual(val, exp, path)
+            self.assertEqual(bool(err), bool(exp_err), path)
+
+    def test_get_many_no_paths(self):
+        self.assertEqual(TT.get_many(DATA, []), [])
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,107 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import copy
+import unittest
+
+import anyconfig.dicts as TT
+
+from .. import base
+from . import common
+
+
+LAYERS = [
+    {'a': 1, 'b': {'b1': [1, 2], 'b2': {'c': 'C'}}, 'd': None, 'e': [1, 2],
+     'k': 1},
+    {'a': None, 'b': {'b1': [2, 3], 'b2': {'c': 'X', 'f': 0}}, 'd': 'D'},
+    {},
+    {'b': {'b2': {'f': 1}}, 'e': [2, 4, 4], 'g': {'h': 1}, 'k': {'x': 1}},
+    {'a': 2, 'g': {'i': [0]}, 'j': None},
+]
+
+
+def eager_merge(layers, **options):
+    (cnf, *others) = copy.deepcopy(layers)
+    for layer in others:
+        TT.merge(cnf, layer, **options)
+
+    return cnf
+
+
+class TestCase(common.TestCase):
+    kind = 'merge'
+
+    def test_materialize(self):
+        for data in self.each_data():
+            upd = base.load_data(data.scm)
+            res = TT.LayeredDict([copy.deepcopy(data.inp), upd], **data.opts)
+            self.assertEqual(res.materialize(), data.exp, data)
+
+
+class LayersTestCase(unittest.TestCase):
+
+    def test_strategies(self):
+        for strategy in TT.MERGE_STRATEGIES:
+            exp = eager_merge(LAYERS, ac_merge=strategy)
+            res = TT.LayeredDict(LAYERS, ac_merge=strategy)
+
+            self.assertEqual(res, exp, strategy)
+            self.assertEqual(list(res), list(exp), strategy)
+            self.assertEqual(res.materialize(), exp, strategy)
+
+    def test_strategies_with_empty_first_layer(self):
+        layers = [{}, *LAYERS[1:]]
+        for strategy in TT.MERGE_STRATEGIES:
+            exp = eager_merge(layers, ac_merge=strategy)
+            res = TT.LayeredDict(layers, ac_merge=strategy)
+
+            self.assertEqual(res, exp, strategy)
+            self.assertEqual(list(res), list(exp), strategy)
+            self.assertEqual(res.materialize(), exp, strategy)
+
+    def test_strategies_with_values_after_mappings(self):
+        layers = [{'a': {'b': 1}, 'c': {'d': 1}},
+                  {'a': [('e', 2)], 'c': {'f': 2}},
+                  {'c': [2, 3]}]
+        for strategy in TT.MERGE_STRATEGIES:
+            try:
+                exp = eager_merge(layers, ac_merge=strategy)
+            except (TypeError, ValueError) as exc:
+                res = TT.LayeredDict(layers, ac_merge=strategy)
+                self.assertEqual(res['a'], {'b': 1, 'e': 2}, strategy)
+                with self.assertRaises(type(exc)):
+                    res['c']
+                continue
+
+            res = TT.LayeredDict(layers, ac_merge=strategy)
+            self.assertEqual(res, exp, strategy)
+            self.assertEqual(res.materialize(), exp, strategy)
+
+    def test_lazy_and_cached(self):
+        res = TT.LayeredDict(LAYERS)
+        self.assertIsInstance(res['b'], TT.LayeredDict)
+        self.assertIs(res['b'], res['b'])
+        self.assertEqual(res['b']['b2'], {'c': 'X', 'f': 1})
+        self.assertEqual(res['k'], {'x': 1})
+        self.assertEqual(res['g']['i'], [0])
+        self.assertNotIn('z', res)
+
+        with self.assertRaises(KeyError):
+            _ = res['z']
+
+    def test_materialize__ac_dict(self):
+        res = TT.LayeredDict(LAYERS).materialize(ac_ordered=True)
+        self.assertIsInstance(res['g'], TT.collections.OrderedDict)
+
+    def test_read_only(self):
+        res = TT.LayeredDict(LAYERS)
+        with self.assertRaises(TypeError):
+            res['a'] = 0  # type: ignore
+
+    def test_wrong_strategy(self):
+        with self.assertRaises(ValueError):
+            TT.LayeredDict(LAYERS, ac_merge='unknown')
+
+# vim:sw=4:ts=4:et:
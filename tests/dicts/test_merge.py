@@ -4,6 +4,8 @@
 # Copyright (C) 2011 - 2021 Satoru SATOH <satoru.satoh@gmail.com>
 #
 # pylint: disable=missing-docstring,invalid-name
+import sys
+
 import anyconfig.dicts as TT
 
 from .. import base
@@ -35,4 +37,41 @@ class TestCase(common.TestCase):
         with self.assertRaises((ValueError, TypeError)):
             TT.merge(dict(a=1), 1)
 
+    def test_merge_with_invalid_nested_data(self):
+        with self.assertRaisesRegex(TypeError, r'other=1'):
+            TT.merge(dict(a=dict(b=1)), dict(a=1))
+
+    def test_merge_with_an_iterator(self):
+        for strategy in TT.MERGE_STRATEGIES:
+            dic = dict(a=1)
+            TT.merge(dic, iter([('b', 2), ('c', 3)]), ac_merge=strategy)
+            self.assertEqual(dic, dict(a=1, b=2, c=3), strategy)
+
+    def test_merge_lists(self):
+        lst = [1, 2, 2, dict(a=1), [3]] * 30
+        dic = dict(a=list(lst))
+        TT.merge(dic, dict(a=[2, 4, 4, dict(a=1), dict(b=2), [3], {5}]),
+                 ac_merge=TT.MS_DICTS_AND_LISTS)
+        self.assertEqual(dic['a'], lst + [4, 4, dict(b=2), {5}])
+
+    def test_merge_lists_of_unhashable_items(self):
+        lst = [dict(a=i) for i in range(100)]
+        dic = dict(a=list(lst))
+        TT.merge(dic, dict(a=[dict(a=1), dict(b=1)]),
+                 ac_merge=TT.MS_DICTS_AND_LISTS)
+        self.assertEqual(dic['a'], lst + [dict(b=1)])
+
+    def test_merge_deeply_nested_dicts(self):
+        depth = sys.getrecursionlimit() * 2
+        (dic, upd) = ({}, {})
+        (cur, ucur) = (dic, upd)
+        for _ in range(depth):
+            (cur['a'], ucur['a']) = ({}, {'b': 1})
+            (cur, ucur) = (cur['a'], ucur['a'])
+
+        TT.merge(dic, upd)
+        for _ in range(depth):
+            dic = dic['a']
+            self.assertEqual(dic['b'], 1)
+
 # vim:sw=4:ts=4:et:
@@ -0,0 +1,108 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring,invalid-name
+import copy
+import unittest
+
+import anyconfig.dicts as TT
+
+
+DATA = {'a': {'b': {'c': 1, 'd': [1, 2]}, 'e': 'E'}, 'f': 0}
+
+ITEMS = [
+    ('a.b.c', 2), ('a.b.x', {'y': 1}), ('a.b.x.z', 2), ('a.e', 'X'),
+    ('f.g', 1), ('a/b/d', [3]), ('h', {'i': None}), ('', 1),
+]
+
+
+def set_each(dic, items):
+    dic = copy.deepcopy(dic)
+    for path, val in copy.deepcopy(items):
+        TT.set_(dic, path, val)
+    return dic
+
+
+class TestCase(unittest.TestCase):
+
+    def test_set_many(self):
+        res = copy.deepcopy(DATA)
+        self.assertIsNone(TT.set_many(res, ITEMS))
+        self.assertEqual(res, set_each(DATA, ITEMS))
+
+    def test_set_many_from_mapping(self):
+        items = dict(ITEMS)
+        res = copy.deepcopy(DATA)
+        TT.set_many(res, items)
+        self.assertEqual(res, set_each(DATA, list(items.items())))
+
+    def test_set_many_merge_dicts(self):
+        res = copy.deepcopy(DATA)
+        TT.set_many(res, [('a', {'b': {'c': 0}}), ('a.b', {'x': 1})])
+        self.assertEqual(res['a'], {'b': {'c': 0, 'd': [1, 2], 'x': 1},
+                                    'e': 'E'})
+
+    def test_set_many_replace_dicts(self):
+        res = copy.deepcopy(DATA)
+        TT.set_many(res, [('a.b', 1), ('a.b', None)])
+        self.assertEqual(res['a'], {'b': None, 'e': 'E'})
+
+    def test_set_many_snapshots_replace_dicts(self):
+        res = TT.set_many(TT.freeze(DATA), [('a.b', 1), ('a.e.x', 2)])
+        self.assertEqual(res['a'], {'b': 1, 'e': {'x': 2}})
+
+    def test_set_many_escaped_paths(self):
+        res = {}
+        TT.set_many(res, [('/a~1b/c~0d', 1)])
+        self.assertEqual(res, {'a/b': {'c~d': 1}})
+
+    def test_set_many_snapshots(self):
+        snap = TT.freeze(DATA)
+        res = TT.set_many(snap, ITEMS)
+
+        self.assertIsInstance(res, TT.FrozenDict)
+        self.assertEqual(res, set_each(DATA, ITEMS))
+        self.assertEqual(snap, DATA)
+
+    def test_set_many_snapshots_same_as_set_each(self):
+        snap = TT.freeze(DATA)
+        items = [('a.b', {'x': {'y': 1}}), ('a.b.x', {'z': 2}),
+                 ('a.b', {'c': 3}), ('a.e.f', 4)]
+        res = TT.set_many(snap, items)
+
+        exp = snap
+        for path, val in items:
+            exp = TT.compile_path(path).set_(exp, val)
+
+        self.assertEqual(res, exp)
+        self.assertIs(res['a']['b']['d'], snap['a']['b']['d'])
+        self.assertIs(TT.set_many(snap, [('', 1)]), snap)
+
+    def test_set_many_with_wildcards(self):
+        with self.assertRaises(ValueError):
+            TT.set_many({}, [('a.*.b', 1)])
+
+
+class CompiledSetterTestCase(unittest.TestCase):
+
+    def test_set_(self):
+        res = copy.deepcopy(DATA)
+        for path, val in ITEMS:
+            self.assertIsNone(TT.compile_path(path).set_(res, val))
+
+        self.assertEqual(res, set_each(DATA, ITEMS))
+
+    def test_set__snapshots(self):
+        snap = TT.freeze(DATA)
+        res = TT.compile_path('a.b.c').set_(snap, 3)
+
+        self.assertEqual(res['a']['b']['c'], 3)
+        self.assertIs(res['a']['b']['d'], snap['a']['b']['d'])
+        self.assertIs(TT.compile_path('').set_(snap, 3), snap)
+
+    def test_set__with_wildcards(self):
+        with self.assertRaises(ValueError):
+            TT.compile_path('a/*').set_({}, 1)
+
+# vim:sw=4:ts=4:et:
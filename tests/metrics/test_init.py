@@ -0,0 +1,71 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.metrics."""
+import pathlib
+import tempfile
+import unittest
+
+import anyconfig
+import anyconfig.metrics as TT
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        TT.reset()
+        TT.enable()
+
+    def tearDown(self):
+        TT.disable()
+        TT.reset()
+
+    def test_load_and_dump(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            path = pathlib.Path(workdir) / 'a.json'
+            anyconfig.dump(dict(a=1), path)
+            anyconfig.load(path)
+            anyconfig.loads('{"b": 2}', ac_parser='json')
+            size = path.stat().st_size
+
+        res = anyconfig.stats()
+        self.assertEqual(res[TT.LOADS], {'std.json': 2})
+        self.assertEqual(res[TT.DUMPS], {'std.json': 1})
+        self.assertEqual(res[TT.READ_BYTES], {'std.json': size + 8})
+        self.assertEqual(res[TT.WRITTEN_BYTES], {'std.json': size})
+        self.assertEqual(res[TT.PARSE_SECONDS]['std.json']['count'], 2)
+
+    def test_cache(self):
+        cache = anyconfig.Cache()
+        with tempfile.TemporaryDirectory() as workdir:
+            path = pathlib.Path(workdir) / 'a.json'
+            path.write_text('{"a": 1}')
+            for _ in range(3):
+                anyconfig.load(path, ac_cache=cache)
+
+        res = TT.stats()
+        self.assertEqual(res[TT.CACHE_MISSES], {TT.CACHE_MEMORY: 1})
+        self.assertEqual(res[TT.CACHE_HITS], {TT.CACHE_MEMORY: 2})
+        self.assertEqual(res[TT.LOADS], {'std.json': 1})
+
+    def test_disabled_by_default(self):
+        self.assertFalse(TT.Registry().enabled)
+
+    def test_disable(self):
+        TT.disable()
+        self.assertFalse(TT.is_enabled())
+
+        anyconfig.loads('{"b": 2}', ac_parser='json')
+        self.assertEqual(TT.stats()[TT.LOADS], {})
+
+    def test_export_prometheus(self):
+        anyconfig.loads('{"b": 2}', ac_parser='json')
+        with tempfile.TemporaryDirectory() as workdir:
+            path = pathlib.Path(workdir) / 'anyconfig.prom'
+            TT.export_prometheus(path)
+            self.assertIn('anyconfig_loads_total{parser="std.json"} 1',
+                          path.read_text().splitlines())
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,60 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.metrics.prometheus."""
+import os
+import pathlib
+import stat
+import tempfile
+import unittest
+
+import anyconfig.metrics.prometheus as TT
+
+from anyconfig.metrics.registry import (
+    Counter, Histogram, Registry
+)
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.reg = Registry(enabled=True)
+        self.reg.register(Counter('loads_total', 'Loads.', 'parser'))
+        self.reg.register(Counter('failures_total', 'Failures.'))
+        self.reg.register(Histogram('parse_seconds', 'Time.', 'parser',
+                                    (0.1, 1.0)))
+
+    def test_to_text(self):
+        self.reg.inc('loads_total', 'std.json', 2)
+        self.reg.inc('loads_total', 'a"b')
+        self.reg.observe('parse_seconds', 'std.json', 0.5)
+
+        lines = TT.to_text(self.reg).splitlines()
+        for line in (
+            '# HELP anyconfig_loads_total Loads.',
+            '# TYPE anyconfig_loads_total counter',
+            'anyconfig_loads_total{parser="std.json"} 2',
+            'anyconfig_loads_total{parser="a\\"b"} 1',
+            'anyconfig_failures_total 0',
+            '# TYPE anyconfig_parse_seconds histogram',
+            'anyconfig_parse_seconds_bucket{parser="std.json",le="0.1"} 0',
+            'anyconfig_parse_seconds_bucket{parser="std.json",le="1.0"} 1',
+            'anyconfig_parse_seconds_bucket{parser="std.json",le="+Inf"} 1',
+            'anyconfig_parse_seconds_sum{parser="std.json"} 0.5',
+            'anyconfig_parse_seconds_count{parser="std.json"} 1',
+        ):
+            self.assertIn(line, lines)
+
+    def test_export(self):
+        self.reg.inc('loads_total', 'std.json')
+        with tempfile.TemporaryDirectory() as workdir:
+            path = pathlib.Path(workdir) / 'anyconfig.prom'
+            TT.export(path, self.reg)
+
+            self.assertEqual(path.read_text(), TT.to_text(self.reg))
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o644)
+            self.assertEqual(os.listdir(workdir), ['anyconfig.prom'])
+
+# vim:sw=4:ts=4:et:
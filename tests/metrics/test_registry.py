@@ -0,0 +1,89 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.metrics.registry."""
+import threading
+import unittest
+
+import anyconfig.metrics.registry as TT
+
+
+class CounterTestCase(unittest.TestCase):
+
+    def test_inc(self):
+        cnt = TT.Counter('a', 'A', 'parser')
+        self.assertEqual(cnt.snapshot(), {})
+
+        cnt.inc('json')
+        cnt.inc('json', 2)
+        cnt.inc('yaml')
+        self.assertEqual(cnt.snapshot(), {'json': 3, 'yaml': 1})
+
+        cnt.reset()
+        self.assertEqual(cnt.snapshot(), {})
+
+    def test_snapshot_without_label(self):
+        self.assertEqual(TT.Counter('a', 'A').snapshot(), {'': 0})
+
+
+class HistogramTestCase(unittest.TestCase):
+
+    def test_observe(self):
+        hist = TT.Histogram('a', 'A', 'parser', (0.1, 1.0))
+        for val in (0.05, 0.1, 0.5, 2.0):
+            hist.observe('json', val)
+
+        res = hist.snapshot()['json']
+        self.assertEqual(res['count'], 4)
+        self.assertAlmostEqual(res['sum'], 2.65)
+        self.assertEqual(res['buckets'],
+                         {0.1: 2, 1.0: 3, float('inf'): 4})
+
+        hist.reset()
+        self.assertEqual(hist.snapshot(), {})
+
+
+class RegistryTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.reg = TT.Registry(enabled=True)
+        self.reg.register(TT.Counter('a', 'A', 'x'))
+        self.reg.register(TT.Histogram('b', 'B', 'x'))
+
+    def test_register_twice(self):
+        with self.assertRaises(ValueError):
+            self.reg.register(TT.Counter('a', 'A'))
+
+    def test_inc_and_observe(self):
+        self.reg.inc('a', 'y')
+        self.reg.observe('b', 'y', 0.01)
+
+        res = self.reg.stats()
+        self.assertEqual(res['a'], {'y': 1})
+        self.assertEqual(res['b']['y']['count'], 1)
+
+        self.reg.reset()
+        self.assertEqual(self.reg.stats(), {'a': {}, 'b': {}})
+
+    def test_disabled(self):
+        self.reg.enabled = False
+        self.reg.inc('a', 'y')
+        self.reg.observe('b', 'y', 0.01)
+        self.assertEqual(self.reg.stats(), {'a': {}, 'b': {}})
+
+    def test_inc_from_threads(self):
+        def inc():
+            for _ in range(1000):
+                self.reg.inc('a', 'y')
+
+        threads = [threading.Thread(target=inc) for _ in range(8)]
+        for thr in threads:
+            thr.start()
+        for thr in threads:
+            thr.join()
+
+        self.assertEqual(self.reg.stats()['a'], {'y': 8000})
+
+# vim:sw=4:ts=4:et:
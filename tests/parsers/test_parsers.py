@@ -6,6 +6,7 @@
 
 import pathlib
 import unittest
+import unittest.mock
 
 import anyconfig.backend.json
 import anyconfig.backend.json.default as JSON
@@ -62,6 +63,17 @@ class Test(unittest.TestCase):
             inp = pathlib.Path("x.json")
             self.assertTrue(isinstance(self.psrs.find(inp), pcls))
 
+    def test_20_init__only_once(self):
+        with unittest.mock.patch('anyconfig.processors.utils.load_plugins',
+                                 return_value=iter([])) as mck:
+            psrs = TT.Parsers()
+            self.assertTrue(psrs is self.psrs)
+            self.assertTrue(psrs.find(None, forced_type='json'))
+            mck.assert_not_called()
+
+            psrs.load_plugins()
+            mck.assert_called_once_with(TT.Parsers._pgroup)
+
     def test_34_find__input_object(self):
         inp = anyconfig.ioinfo.make(CNF_PATH)
         psr = self.psrs.find(inp)
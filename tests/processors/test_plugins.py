@@ -0,0 +1,142 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.processors.plugins."""
+import importlib
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+import unittest.mock
+
+import anyconfig.backend.ini
+import anyconfig.backend.json.default
+import anyconfig.processors
+import anyconfig.processors.plugins as TT
+
+
+GROUP = 'anyconfig_test_backends'
+VALUE = 'anyconfig.backend.json.default:Parser'
+
+
+def _make_dist(topdir: pathlib.Path, name: str = 'fake_plugin',
+               value: str = VALUE) -> None:
+    """Make a fake distribution provides an entry point."""
+    distinfo = topdir / f'{name}-0.1.dist-info'
+    distinfo.mkdir()
+    (distinfo / 'METADATA').write_text(
+        f'Metadata-Version: 2.1\nName: {name}\nVersion: 0.1\n'
+    )
+    (distinfo / 'entry_points.txt').write_text(
+        f'[{GROUP}]\n{name} = {value}\n'
+    )
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.sitedir = pathlib.Path(self.workdir.name) / 'site'
+        self.sitedir.mkdir()
+        _make_dist(self.sitedir)
+        sys.path.insert(0, str(self.sitedir))
+        self.manifest = pathlib.Path(self.workdir.name) / 'manifest.json'
+        TT.clear_cache()
+
+    def tearDown(self):
+        sys.path.remove(str(self.sitedir))
+        self.workdir.cleanup()
+        TT.clear_cache()
+
+    def test_scan(self):
+        self.assertEqual(TT.scan(GROUP), (('fake_plugin', VALUE), ))
+        self.assertEqual(TT.scan('not_existing_group'), ())
+
+    def test_entry_points_cached(self):
+        exp = (('fake_plugin', VALUE), )
+        self.assertEqual(TT.entry_points(GROUP), exp)
+        with unittest.mock.patch.object(TT, 'scan') as mck:
+            self.assertEqual(TT.entry_points(GROUP), exp)
+            mck.assert_not_called()
+
+        TT.clear_cache()
+        with unittest.mock.patch.object(TT, 'scan') as mck:
+            TT.entry_points(GROUP)
+            mck.assert_called_once_with(GROUP)
+
+    def test_entry_points_with_manifest(self):
+        exp = (('fake_plugin', VALUE), )
+        self.assertEqual(TT.entry_points(GROUP, str(self.manifest)), exp)
+        self.assertTrue(self.manifest.exists())
+        data = json.loads(self.manifest.read_text())
+        self.assertEqual(data['groups'][GROUP], [list(e) for e in exp])
+
+        # Entry points are loaded from the manifest in other processes.
+        TT.clear_cache()
+        with unittest.mock.patch.object(TT, 'scan') as mck:
+            self.assertEqual(TT.entry_points(GROUP, str(self.manifest)), exp)
+            mck.assert_not_called()
+
+    def test_entry_points_with_manifest_from_env(self):
+        env = {TT.MANIFEST_ENV: str(self.manifest)}
+        with unittest.mock.patch.dict(os.environ, env):
+            TT.entry_points(GROUP)
+
+        self.assertTrue(self.manifest.exists())
+
+    def test_manifest_invalidated(self):
+        TT.entry_points(GROUP, str(self.manifest))
+        _make_dist(self.sitedir, 'fake_plugin_2')
+        mtime = self.sitedir.stat().st_mtime_ns + 1_000_000_000
+        os.utime(self.sitedir, ns=(mtime, mtime))
+
+        TT.clear_cache()
+        self.assertEqual(TT.entry_points(GROUP, str(self.manifest)),
+                         (('fake_plugin', VALUE), ('fake_plugin_2', VALUE)))
+
+    def test_broken_manifest(self):
+        self.manifest.write_text('{')
+        with self.assertWarns(UserWarning):
+            res = TT.entry_points(GROUP, str(self.manifest))
+
+        self.assertEqual(res, (('fake_plugin', VALUE), ))
+
+    def test_load_plugins_again(self):
+        class Processors(anyconfig.processors.Processors):
+            _pgroup = GROUP
+
+        prcs = Processors()
+        self.assertEqual(prcs.list_x('type'), ['json'])
+
+        _make_dist(self.sitedir, 'fake_plugin_2',
+                   'anyconfig.backend.ini:Parser')
+        importlib.invalidate_caches()
+        with unittest.mock.patch.object(TT, 'scan', wraps=TT.scan) as mck:
+            Processors()  # Entry points cached should be used.
+            mck.assert_not_called()
+
+            prcs.load_plugins()
+            mck.assert_called_once_with(GROUP)
+
+        self.assertEqual(prcs.list_x('type'), ['ini', 'json'])
+
+    def test_load(self):
+        self.assertEqual(TT.load(VALUE), anyconfig.backend.json.default.Parser)
+        self.assertEqual(TT.load('anyconfig.backend.json.default'),
+                         anyconfig.backend.json.default)
+        self.assertEqual(TT.load(f'{VALUE} [extra]'),
+                         anyconfig.backend.json.default.Parser)
+
+    def test_load_failures(self):
+        with self.assertRaises(ValueError):
+            TT.load('not a value')
+        with self.assertRaises(ImportError):
+            TT.load('not_existing_module:Parser')
+        with self.assertRaises(ImportError):
+            TT.load('anyconfig.backend.json.default:NotExistingParser')
+
+# vim:sw=4:ts=4:et:
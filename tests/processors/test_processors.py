@@ -2,13 +2,19 @@
 # Copyright (C) 2018 - 2021 Satoru SATOH <satoru.satoh@gmail.com>
 # SPDX-License-Identifier: MIT
 #
-# pylint: disable=missing-docstring, invalid-name
+# pylint: disable=missing-docstring, invalid-name, protected-access
 import operator
+import threading
 import unittest
 
 import anyconfig.processors.processors as TT
 
-from .common import A, A2, B, C, PRS
+from anyconfig.common import (
+    UnknownFileTypeError, UnknownProcessorTypeError
+)
+from anyconfig.models.processor import LazyProcessor
+from . import common
+from .common import A, A2, A3, B, C, PRS
 
 
 class Test_10_Processor(unittest.TestCase):
@@ -48,4 +54,140 @@ class Test_40_Processors(unittest.TestCase):
         res = sorted(set(A.extensions() + B.extensions() + C.extensions()))
         self.assertEqual(prcs.list_x('extension'), res)
 
+    def test_22_list_by_x(self):
+        prcs = TT.Processors(PRS)
+        (a, a2, a3, b, c) = (A(), A2(), A3(), B(), C())
+
+        self.assertEqual(prcs.list_by_x(), prcs.list_by_cid())
+        self.assertEqual(prcs.list_by_x('type'),
+                         [('json', [a3, a2, a]), ('yaml', [b, c])])
+        self.assertEqual(prcs.list_by_x('type'), prcs.list_by_type())
+        self.assertEqual(prcs.list_by_x('extensions'),
+                         [('js', [a3, a2, a]), ('jsn', [a3, a2, a]),
+                          ('json', [a3, a2, a]),
+                          ('yaml', [b, c]), ('yml', [b, c])])
+
+        with self.assertRaises(ValueError):
+            prcs.list_by_x('undef')
+
+    def test_24_register__update_indexes(self):
+        prcs = TT.Processors([A, B])
+        self.assertEqual(prcs.findall(None, forced_type='json'), [A()])
+
+        prcs.register(A3)
+        prcs.register(A2)
+        prcs.register(A2)  # It should be ignored.
+        self.assertEqual(prcs.list_x('cid'), ['A', 'A2', 'A3', 'B'])
+        self.assertEqual(prcs.findall(None, forced_type='json'),
+                         [A3(), A2(), A()])
+        self.assertEqual(prcs.findall('/a/b/c.js'), [A3(), A2(), A()])
+
+    def test_26_list__wait_for_writers(self):
+        prcs = TT.Processors([A, B])
+        listers = [
+            prcs.list, prcs.list_by_type,
+            lambda: prcs.list_by_x('extensions'), lambda: prcs.list_x('cid'),
+        ]
+        for lister in listers:
+            with prcs._lock:  # Writers hold the lock to update indexes.
+                thr = threading.Thread(target=lister)
+                thr.start()
+                thr.join(0.05)
+                self.assertTrue(thr.is_alive())
+
+            thr.join()
+
+    def test_30_find(self):
+        prcs = TT.Processors(PRS)
+        ies = (((None, 'json'), A3),
+               ((None, 'yaml'), B),
+               ((None, 'dummy'), C),
+               (('/path/to/a.jsn', None), A3),
+               (('/path/to/a.yml', 'A'), A),
+               ((None, A2), A2),
+               ((None, A2()), A2),
+               )
+        for (obj, ftype), exp in ies:
+            self.assertTrue(isinstance(prcs.find(obj, forced_type=ftype),
+                                       exp))
+
+    def test_32_findall(self):
+        prcs = TT.Processors(PRS)
+        res = prcs.findall(None, forced_type='yaml')
+        self.assertEqual(res, [B(), C()])
+
+        res.clear()  # It should not affect the indexes.
+        self.assertEqual(prcs.findall(None, forced_type='yaml'), [B(), C()])
+
+    def test_34_find__ng_cases(self):
+        prcs = TT.Processors(PRS)
+        ies = (((None, None), ValueError),
+               (('/tmp/x.xyz', None), UnknownFileTypeError),
+               ((None, 'xyz'), UnknownProcessorTypeError),
+               ((None, int), ValueError),
+               )
+        for (obj, ftype), exc in ies:
+            with self.assertRaises(exc):
+                prcs.find(obj, forced_type=ftype)
+
+
+class Test_50_LazyProcessors(unittest.TestCase):
+
+    def setUp(self):
+        self.lazies = [
+            LazyProcessor(common.__name__, p.cid(), p.type(), p.priority(),
+                          p.extensions(), name=p.__name__)
+            for p in PRS
+        ]
+
+    def assert_lazies(self, prcs, count):
+        self.assertEqual(
+            sum(isinstance(p, LazyProcessor)
+                for p in prcs._processors.values()),
+            count
+        )
+
+    def test_10_find(self):
+        prcs = TT.Processors(self.lazies)
+        self.assert_lazies(prcs, len(PRS))
+
+        self.assertIsInstance(prcs.find(None, forced_type='json'), A3)
+        self.assertIsInstance(prcs.find('/path/to/a.yml'), B)
+        self.assert_lazies(prcs, len(PRS) - 2)
+
+        self.assertIsInstance(prcs.find(None, forced_type='A'), A)
+        self.assertIsInstance(prcs.find(None, forced_type=A2), A2)
+        self.assert_lazies(prcs, len(PRS) - 3)
+
+    def test_20_findall_and_list(self):
+        (prcs, ref) = (TT.Processors(self.lazies), TT.Processors(PRS))
+        self.assertEqual(prcs.findall(None, forced_type='yaml'),
+                         ref.findall(None, forced_type='yaml'))
+        self.assert_lazies(prcs, len(PRS) - 2)
+
+        self.assertEqual(prcs.list_x('type'), ref.list_x('type'))
+        self.assert_lazies(prcs, len(PRS) - 2)
+
+        self.assertEqual(prcs.list_by_x('type'), ref.list_by_x('type'))
+        self.assertEqual(prcs.list(), ref.list())
+        self.assert_lazies(prcs, 0)
+
+    def test_30_find__failed_to_import(self):
+        lazy = LazyProcessor('not.existing.module', 'X', 'json', 100,
+                             ['json'])
+        prcs = TT.Processors([lazy, *self.lazies])
+
+        with self.assertWarns(ImportWarning):
+            self.assertIsInstance(prcs.find(None, forced_type='json'), A3)
+
+        self.assertNotIn('X', prcs.list_x('cid'))
+
+    def test_32_find__failed_to_import_all(self):
+        lazy = LazyProcessor('not.existing.module', 'X', 'xyz', 0, ['xyz'])
+        prcs = TT.Processors([lazy])
+
+        with self.assertWarns(ImportWarning):
+            with self.assertRaises(UnknownFileTypeError):
+                prcs.find('/path/to/a.xyz')
+
 # vim:sw=4:ts=4:et:
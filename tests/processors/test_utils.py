@@ -46,6 +46,20 @@ class TestCase(unittest.TestCase):
         for inp, exp in ies:
             self.assertEqual(TT.select_by_key(inp, sfn), exp)
 
+    def test_insert_by_prio(self):
+        (a, a2, a3, b, c) = (A(), A2(), A3(), B(), C())
+        ies = ((([], a), [a]),
+               (([a3, a], a2), [a3, a2, a]),
+               (([a3, a2], a), [a3, a2, a]),
+               (([a2, a], a3), [a3, a2, a]),
+               (([b], c), [b, c]),
+               (([a], c), [a, c]),  # Same priority.
+               )
+        for (prs, proc), exp in ies:
+            self.assertEqual(TT.insert_by_prio(prs, proc), exp)
+            self.assertEqual(TT.insert_by_prio(prs, proc),
+                             TT.sort_by_prio([*prs, proc]))
+
     def test_list_by_x(self):
         (a, a2, a3, b, c) = (A(), A2(), A3(), B(), C())
         ies = ((([], 'type'), []),
@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.profiling.profiler."""
+import pathlib
+import tracemalloc
+import unittest
+
+import anyconfig
+import anyconfig.ioinfo
+import anyconfig.profiling.profiler as TT
+
+from anyconfig.profiling.datatypes import (
+    StageRecord, STAGE_PARSE, STAGE_FIND, STAGE_IOINFO
+)
+
+
+class TestCase(unittest.TestCase):
+
+    def test_stage_without_hook(self):
+        with TT.stage(None, STAGE_PARSE) as stg:
+            self.assertIsNone(stg)
+
+    def test_stage(self):
+        recs = []
+        with TT.stage(recs.append, STAGE_PARSE, 'a.json'):
+            pass
+
+        self.assertEqual(len(recs), 1)
+        self.assertEqual(recs[0].stage, STAGE_PARSE)
+        self.assertEqual(recs[0].input, 'a.json')
+        self.assertGreaterEqual(recs[0].wall, 0)
+        self.assertIsNone(recs[0].peak)
+
+    def test_stage_with_ioinfo(self):
+        recs = []
+        ioi = anyconfig.ioinfo.make(pathlib.Path('a.json'))
+        with TT.stage(recs.append, STAGE_PARSE, ioi):
+            pass
+
+        self.assertEqual(recs[0].input, ioi.path)
+
+    def test_stage_measures_memory(self):
+        prof = TT.Profiler(memory=True)
+        with TT.stage(prof, STAGE_PARSE):
+            with TT.stage(prof, STAGE_FIND):
+                data = [0] * 100000
+            del data
+
+        (inner, outer) = prof.records
+        self.assertGreater(inner.peak, 100000 * 8)
+        self.assertGreaterEqual(outer.peak, inner.peak)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_get_hook(self):
+        prof = TT.Profiler()
+        self.assertIsNone(TT.get_hook({}))
+        self.assertEqual(TT.get_hook(dict(ac_profile=prof)), prof)
+        with TT.profile() as cur:
+            self.assertEqual(TT.get_hook({}), cur)
+            self.assertEqual(TT.get_hook(dict(ac_profile=prof)), prof)
+
+        self.assertIsNone(TT.get_hook({}))
+
+    def test_profiler_summary(self):
+        prof = TT.Profiler()
+        for rec in (StageRecord(STAGE_PARSE, 'a.json', 1.0, 0.5),
+                    StageRecord(STAGE_PARSE, 'b.json', 2.0, 1.0),
+                    StageRecord(STAGE_IOINFO, '', 0.5, 0.5)):
+            prof(rec)
+
+        self.assertEqual(
+            [tuple(s) for s in prof.summary()],
+            [(STAGE_PARSE, 2, 3.0, 1.5, None),
+             (STAGE_IOINFO, 1, 0.5, 0.5, None)]
+        )
+        self.assertIn('b.json', prof.report(by_input=True))
+        self.assertNotIn('b.json', prof.report())
+
+        prof.clear()
+        self.assertEqual(prof.records, [])
+
+    def test_profile_loads(self):
+        with TT.profile() as prof:
+            anyconfig.loads('{"a": 1}', ac_parser='json')
+
+        self.assertEqual([r.stage for r in prof.records],
+                         [STAGE_FIND, STAGE_PARSE])
+
+    def test_ac_profile_option(self):
+        prof = TT.Profiler()
+        anyconfig.loads('{"a": 1}', ac_parser='json', ac_profile=prof)
+        self.assertEqual([r.stage for r in prof.records],
+                         [STAGE_FIND, STAGE_PARSE])
+
+# vim:sw=4:ts=4:et:
@@ -0,0 +1,41 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.query."""
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+import anyconfig.query as TT
+
+
+class TestCase(unittest.TestCase):
+
+    def test_supported(self):
+        self.assertEqual(TT.SUPPORTED,
+                         importlib.util.find_spec('jmespath') is not None)
+
+    def test_query_many(self):
+        data = {'a': {'b': 1}}
+        res = TT.query_many(data, {'b': 'a.b', 'a': 'a'})
+        if TT.SUPPORTED:
+            self.assertEqual(res, {'b': 1, 'a': {'b': 1}})
+        else:
+            self.assertEqual(res, {'b': data, 'a': data})
+
+    def test_not_imported_until_needed(self):
+        code = '''
+import sys
+import anyconfig
+anyconfig.loads('{}', ac_parser='json')
+assert 'anyconfig.query.query' not in sys.modules
+assert 'jmespath' not in sys.modules
+'''
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+
+# vim:sw=4:ts=4:et:
@@ -41,4 +41,46 @@ class Test_00_Functions(unittest.TestCase):
         self._assert_query([(data, None, data),
                             (data, '', data)])
 
+    def test_20_make_query(self):
+        query = TT.make_query("a.b")
+        self.assertEqual(query({"a": {"b": 2}}), 2)
+        self.assertEqual(query({"a": {"c": 2}}), None)
+
+    def test_22_make_query_with_invalid_query(self):
+        with self.assertRaises(ValueError):
+            TT.make_query("b.")
+
+    def test_24_make_query_with_empty_query(self):
+        data = {"a": 1}
+        self.assertEqual(TT.make_query(None)(data), data)
+        self.assertEqual(TT.make_query('')(data), data)
+
+    def test_26_make_query_for_primitive_data(self):
+        with self.assertWarns(UserWarning):
+            self.assertEqual(TT.make_query("a")(1), 1)
+
+    def test_30_compiled_expressions_are_cached(self):
+        TT.compile_.cache_clear()
+        TT.make_query("a.b")
+        TT.query({"a": 1}, "a.b")
+        self.assertEqual(TT.compile_.cache_info().hits, 1)
+
+    def test_40_query_many(self):
+        data = {"a": {"b": 2, "c": [1, 2]}}
+        self.assertEqual(
+            TT.query_many(data, {"b": "a.b", "c0": "a.c[0]", "x": "a.x",
+                                 "all": None}),
+            {"b": 2, "c0": 1, "x": None, "all": data}
+        )
+        self.assertEqual(TT.query_many(data, [("b", "a.b")]), {"b": 2})
+        self.assertEqual(TT.query_many(data, {}), {})
+
+    def test_42_query_many_with_invalid_query(self):
+        with self.assertRaises(ValueError):
+            TT.query_many({"a": 1}, {"a": "a", "b": "b."})
+
+    def test_44_query_many_for_primitive_data(self):
+        with self.assertWarns(UserWarning):
+            self.assertEqual(TT.query_many(1, {"a": "a"}), {"a": 1})
+
 # vim:sw=4:ts=4:et:
@@ -80,6 +80,26 @@ class Test_10_Validation(Test_00_Base):
         with self.assertRaises(TT.ValidationError):
             TT.is_valid(self.obj_ng, self.schema, ac_schema_safe=False)
 
+    def test_30_make_validator(self):
+        validator = TT.make_validator(self.schema)
+        self.assertTrue(validator(self.obj))
+        with self.assertWarns(UserWarning):
+            self.assertFalse(validator(self.obj_ng))
+
+    def test_32_make_validator_no_safe(self):
+        validator = TT.make_validator(self.schema, ac_schema_safe=False)
+        with self.assertRaises(TT.ValidationError):
+            validator(self.obj_ng)
+
+    def test_34_make_validator_with_wrong_schema(self):
+        validator = TT.make_validator({'type': 'wrong_type'},
+                                      ac_schema_safe=False)
+        with self.assertRaises(TT.ValidationError):
+            validator(self.obj)
+
+    def test_36_make_validator_with_empty_schema(self):
+        self.assertTrue(TT.make_validator({})(self.obj_ng))
+
 
 @unittest.skipIf(not SUPPORTED, "json schema lib is not available")
 class Test_12_Validation_Errors(Test_00_Base):
@@ -93,6 +113,53 @@ class Test_12_Validation_Errors(Test_00_Base):
         self.assertTrue(msg)  # ["'a' is not of type ...", "'b' is not ..."]
         self.assertFalse(ret)
 
+    def test_20_make_validator(self):
+        validator = TT.make_validator(self.scm, ac_schema_errors=True)
+        with self.assertWarns(UserWarning):
+            self.assertFalse(validator(self.obj))
+
+
+@unittest.skipIf(not SUPPORTED, "json schema lib is not available")
+class Test_14_Validator_Cache(Test_00_Base):
+
+    def setUp(self):
+        TT.clear_cache()
+
+    def test_10_validators_are_cached_per_schema_content(self):
+        self.assertTrue(TT.is_valid(self.obj, self.schema))
+        self.assertTrue(TT.validate(self.obj, dict(self.schema))[0])
+        TT.make_validator(self.schema)
+        self.assertEqual(len(TT._VALIDATORS), 1)
+
+        self.assertTrue(TT.validate(self.obj, self.schema,
+                                    ac_schema_errors=True)[0])
+        self.assertEqual(len(TT._VALIDATORS), 2)
+
+    def test_20_changes_to_schema_do_not_affect_cached_ones(self):
+        schema = {"type": "object",
+                  "properties": {"a": {"type": "integer"}}}
+        self.assertTrue(TT.validate(self.obj, schema)[0])
+
+        schema["properties"]["a"]["type"] = "string"
+        self.assertFalse(TT.validate(self.obj, schema)[0])
+        self.assertEqual(len(TT._VALIDATORS), 2)
+
+    def test_30_wrong_schema_is_not_cached(self):
+        (ret, msg) = TT.validate(self.obj, {"type": "aaa"})
+        self.assertFalse(ret)
+        self.assertTrue(msg)
+        self.assertEqual(len(TT._VALIDATORS), 0)
+
+    def test_40_raise_errors_if_not_safe(self):
+        with self.assertRaises(TT.jsonschema.ValidationError):
+            TT.validate(dict(a='aaa'), self.schema, ac_schema_safe=False)
+
+    def test_50_cache_size_is_bounded(self):
+        for idx in range(TT.VALIDATOR_CACHE_SIZE + 2):
+            TT.validate(self.obj, dict(self.schema, title=str(idx)))
+
+        self.assertEqual(len(TT._VALIDATORS), TT.VALIDATOR_CACHE_SIZE)
+
 
 class Test_20_GenSchema(Test_00_Base):
 
@@ -0,0 +1,33 @@
+#
+# Copyright (C) 2022 Satoru SATOH <satoru.satoh@gmail.com>
+# License: MIT
+#
+# pylint: disable=missing-docstring
+"""Test cases for anyconfig.template."""
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+import anyconfig.template as TT
+
+
+class TestCase(unittest.TestCase):
+
+    def test_supported(self):
+        self.assertEqual(TT.SUPPORTED,
+                         importlib.util.find_spec('jinja2') is not None)
+
+    def test_not_imported_until_needed(self):
+        code = '''
+import sys
+import anyconfig
+anyconfig.loads('{}', ac_parser='json')
+assert 'anyconfig.template.jinja2' not in sys.modules
+assert 'jinja2' not in sys.modules
+'''
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+
+# vim:sw=4:ts=4:et: